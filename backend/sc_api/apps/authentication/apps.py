@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class AuthenticationConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "sc_api.apps.authentication"
+
+    def ready(self):
+        from sc_api.apps.authentication import signals  # noqa: F401
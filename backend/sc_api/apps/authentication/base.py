@@ -1,30 +1,33 @@
-import logging
-
 from django.conf import settings
+from django.utils.translation import gettext_lazy as _
 from rest_framework_simplejwt.authentication import JWTAuthentication
-from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+from sc_api.apps.authentication.cache import get_cached_user
+from sc_api.apps.utils.log import get_logger
 
-logger = logging.getLogger(__name__)
+# Runs on every authenticated request; DEBUG events here are sampled (LOG_SAMPLING).
+logger = get_logger(__name__)
 
 
 class CustomAuthentication(JWTAuthentication):
     def authenticate(self, request):
         header = self.get_header(request)
         if header is None:
-            logger.info("Checking for access token in cookie")
+            source = "cookie"
             raw_token = request.COOKIES.get(settings.SIMPLE_JWT["AUTH_COOKIE"]) or None
         else:
-            logger.info("Checking for access token in header")
+            source = "header"
             raw_token = self.get_raw_token(header)
-        logger.debug("Raw access token retrieved")
         if raw_token is None:
-            logger.error("Access Token not provided!!")
+            logger.debug("auth.no_token", source=source)
             return None
 
         try:
             validated_token = self.get_validated_token(raw_token)
-            logger.debug("Token validated")
         except InvalidToken:
+            logger.debug("auth.invalid_token", source=source)
             raise InvalidToken(
                 {
                     "message": "Your session has expired. Please login!!",
@@ -32,5 +35,34 @@ class CustomAuthentication(JWTAuthentication):
             )
 
         user = self.get_user(validated_token)
-        logger.debug(f"Currently logged in user oid: {user.oid}")
+        logger.debug("auth.authenticated", source=source, user=user.oid)
         return user, validated_token
+
+    def get_user(self, validated_token):
+        """
+        Resolve the token's user (with its team) through the auth user cache.
+
+        Same checks as JWTAuthentication.get_user, without a query on warm hits.
+        """
+        try:
+            user_oid = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        user = get_cached_user(user_oid)
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        # The password hash is not cached, so this check costs a query when enabled.
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(
+                user.password
+            ):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return user
@@ -0,0 +1,92 @@
+import threading
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from sc_api.apps.schema.models import Team, User
+from sc_api.apps.utils.cache import build_cache
+
+auth_user_cache = build_cache(settings.AUTH_USER_CACHE)
+
+# Kept out of the cache; loaded lazily if a view ever reads it.
+UNCACHED_USER_FIELDS = ("password",)
+
+USER_FIELDS = [
+    field.attname for field in User._meta.concrete_fields if field.name not in UNCACHED_USER_FIELDS
+]
+TEAM_FIELDS = [field.attname for field in Team._meta.concrete_fields]
+
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def _cache_key(oid):
+    return f"auth:user:{oid}"
+
+
+def _count(name):
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def get_auth_cache_stats():
+    """Hit/miss counters of the authenticated-user cache in this process."""
+    with _stats_lock:
+        hits, misses = _stats["hits"], _stats["misses"]
+    total = hits + misses
+    return {"hits": hits, "misses": misses, "hit_ratio": hits / total if total else None}
+
+
+def reset_auth_cache_stats():
+    with _stats_lock:
+        _stats.update(hits=0, misses=0)
+
+
+def _dump(user):
+    return {
+        "user": [getattr(user, name) for name in USER_FIELDS],
+        "team": [getattr(user.team, name) for name in TEAM_FIELDS] if user.team_id else None,
+    }
+
+
+def _load(entry):
+    # Fresh instances per request, so a view mutating request.user never
+    # touches another request's object.
+    user = User.from_db(DEFAULT_DB_ALIAS, USER_FIELDS, entry["user"])
+    if entry["team"] is not None:
+        user.team = Team.from_db(DEFAULT_DB_ALIAS, TEAM_FIELDS, entry["team"])
+    return user
+
+
+def get_cached_user(oid):
+    """
+    Return the user with this oid and its team preloaded, or None if it does not exist.
+
+    Warm lookups run no queries. Entries are dropped when the user or its team
+    is saved or deleted, but with the per-process "local" backend only in the
+    process that made the change; other workers, and bulk `update()`s that
+    bypass the signals, rely on the TTL. Use the "django" backend on a shared
+    cache for immediate invalidation everywhere.
+    """
+    key = _cache_key(oid)
+    entry = auth_user_cache.get(key)
+    if entry is not None:
+        _count("hits")
+        return _load(entry)
+
+    _count("misses")
+    try:
+        user = User.objects.select_related("team").get(oid=oid)
+    except (User.DoesNotExist, ValueError):
+        return None
+
+    auth_user_cache.set(key, _dump(user))
+    return user
+
+
+def invalidate_cached_user(oid):
+    auth_user_cache.delete(_cache_key(oid))
+
+
+def invalidate_cached_users(oids):
+    for oid in oids:
+        invalidate_cached_user(oid)
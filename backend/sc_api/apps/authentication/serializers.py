@@ -1,10 +1,6 @@
-import logging
-
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
-logger = logging.getLogger(__name__)
-
 
 class LoginSerializer(serializers.ModelSerializer):
     email = serializers.CharField(style={"input_type": "email", "placeholder": "Email"})
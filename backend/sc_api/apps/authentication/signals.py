@@ -0,0 +1,25 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from sc_api.apps.authentication.cache import (
+    invalidate_cached_user,
+    invalidate_cached_users,
+)
+from sc_api.apps.schema.models import Team, User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance, using, **kwargs):
+    # After commit, so a concurrent request cannot re-cache the old row.
+    transaction.on_commit(partial(invalidate_cached_user, instance.oid), using=using)
+
+
+# Members are looked up before the delete, since deleting the team nulls their team_id.
+@receiver(post_save, sender=Team)
+@receiver(pre_delete, sender=Team)
+def invalidate_team_cache(sender, instance, using, **kwargs):
+    oids = list(User.objects.using(using).filter(team=instance).values_list("oid", flat=True))
+    transaction.on_commit(partial(invalidate_cached_users, oids), using=using)
@@ -1,6 +1,7 @@
 from django.urls import path
 from rest_framework_simplejwt.views import TokenRefreshView
 from sc_api.apps.authentication.views import (
+    AuthCacheStatsView,
     LoginView,
 )
 
@@ -8,4 +9,5 @@ app_name = "auth"
 urlpatterns = [
     path("login/", LoginView.as_view(), name="login"),
     path("token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+    path("cache-stats/", AuthCacheStatsView.as_view(), name="auth_cache_stats"),
 ]
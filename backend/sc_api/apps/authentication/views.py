@@ -1,23 +1,23 @@
-import logging
-
 from django.conf import settings
 from django.contrib.auth import authenticate, get_user_model
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.generics import GenericAPIView
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.tokens import RefreshToken
+from sc_api.apps.authentication.cache import get_auth_cache_stats
 from sc_api.apps.authentication.serializers import (
     LoginSerializer,
 )
 from sc_api.apps.utils.decorators import (
     params_required,
 )
+from sc_api.apps.utils.log import get_logger
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class LoginView(GenericAPIView):
@@ -30,24 +30,22 @@ class LoginView(GenericAPIView):
 
     @params_required(params=("email", "password"))
     def post(self, request, *args, **kwargs):
-        logger.info("Starting post method of LoginView")
         try:
             email = request.data["email"]
             password = request.data["password"]
 
-            logger.info("Authenticating")
             self.user = authenticate(request, email=email, password=password)
             if not self.user:
+                logger.warning("auth.login_failed", reason="invalid_credentials")
                 return Response(
                     {"message": "Invalid email or password"},
                     status=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 )
 
             response = self.get_response(email)
-            logger.info("Updating last login")
             self.user.last_login = timezone.now()
             self.user.save()
-            logger.info("Saving user login history")
+            logger.info("auth.login", user=self.user.oid)
             return response
         except get_user_model().DoesNotExist:
             return Response(
@@ -55,7 +53,7 @@ class LoginView(GenericAPIView):
                 status=status.HTTP_401_UNAUTHORIZED,
             )
         except Exception:
-            logger.error("Unable to login", exc_info=True)
+            logger.exception("auth.login_error")
             return Response(
                 {"message": "Unable to log user in!!"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
@@ -69,28 +67,18 @@ class LoginView(GenericAPIView):
         }
 
     def get_response(self, email):
-        logger.info("Starting get_response method")
         if self.user is None:
-            logger.error("Unable to authenticate email!!")
-            logger.error("Email does not exist in our system!!")
             raise get_user_model().DoesNotExist
 
-        logger.info("Successfully authenticated")
-        logger.info("Checking if email is inactive in our system")
         if not self.user.is_active:
-            logger.error("Inactive account trying to log in!!")
+            logger.warning("auth.login_failed", reason="inactive", user=self.user.oid)
             raise get_user_model().DoesNotExist
 
         try:
-            logger.info("User found to be active in our system")
-            logger.info("Initializing response object for user")
             response = Response()
 
-            logger.info("Getting tokens for user")
             tokens = self.get_tokens_for_user()
-            logger.info("Successfully created tokens for user")
 
-            logger.info("Setting cookie")
             response.set_cookie(
                 key=settings.SIMPLE_JWT["REFRESH_COOKIE"],
                 value=tokens["refresh"],
@@ -109,11 +97,10 @@ class LoginView(GenericAPIView):
                 samesite=settings.SIMPLE_JWT["AUTH_COOKIE_SAMESITE"],
                 domain=settings.SIMPLE_JWT["AUTH_COOKIE_DOMAIN"],
             )
-            logger.info("Successfully set cookie")
             response.data = {"message": "Logged in successfully", "data": tokens}
             return response
         except Exception as e:
-            logger.error("Error while generating response")
+            logger.error("auth.login_response_error", user=self.user.oid)
             raise e
 
 
@@ -121,27 +108,22 @@ class LogoutView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
-        logger.info("Starting logout process")
         try:
             refresh_token = request.COOKIES.get(settings.SIMPLE_JWT["REFRESH_COOKIE"])
 
             if refresh_token:
-                logger.info("Blacklisting refresh token")
                 try:
                     token = RefreshToken(refresh_token)
                     token.blacklist()
-                    logger.info("Successfully blacklisted refresh token")
                 except TokenError as e:
-                    logger.warning(f"Token already blacklisted or invalid: {e}")
+                    logger.warning("auth.logout_token_invalid", error=e)
             else:
-                logger.warning("No refresh token found in cookies")
+                logger.debug("auth.logout_without_token")
 
-            logger.info("Creating logout response")
             response = Response(
                 {"success": True, "message": "Successfully logged out"}, status=status.HTTP_200_OK
             )
 
-            logger.info("Clearing cookies")
             response.delete_cookie(
                 key=settings.SIMPLE_JWT["AUTH_COOKIE"],
                 domain=settings.SIMPLE_JWT["AUTH_COOKIE_DOMAIN"],
@@ -153,12 +135,19 @@ class LogoutView(APIView):
                 path=settings.SIMPLE_JWT["AUTH_COOKIE_PATH"],
             )
 
-            logger.info("Logout successful")
+            logger.info("auth.logout", user=request.user.oid)
             return response
 
         except Exception as e:
-            logger.error(f"Error during logout: {e}")
+            logger.error("auth.logout_error", error=e)
             return Response(
                 {"success": False, "error": "Logout failed"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+
+class AuthCacheStatsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response({"success": True, "data": get_auth_cache_stats()})
@@ -1,8 +1,28 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.utils.html import format_html
+from sc_api.apps.utils.pagination import EstimatedCountPaginator
 
-from .models import Respondent, Survey, SurveyResponse, Team, User
+from .models import OutboundEmail, Respondent, Survey, SurveyResponse, Team, User
+
+
+def count_subquery(queryset, field):
+    """
+    Correlated COUNT of `queryset` rows whose `field` points at the outer row.
+
+    Used instead of Count() joins so several counts on one changelist do not
+    multiply each other's rows.
+    """
+    counts = (
+        queryset.filter(**{field: OuterRef("pk")})
+        .order_by()
+        .values(field)
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
 
 
 @admin.register(User)
@@ -11,6 +31,7 @@ class UserAdmin(BaseUserAdmin):
     list_filter = ("is_active", "is_staff", "role", "team")
     search_fields = ("email", "first_name", "last_name")
     ordering = ("email",)
+    list_select_related = ("team",)
     filter_horizontal = ()
 
     fieldsets = (
@@ -48,15 +69,27 @@ class TeamAdmin(admin.ModelAdmin):
     search_fields = ("name",)
     ordering = ("name",)
 
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                survey_count=count_subquery(Survey.objects.all(), "team"),
+                member_count=count_subquery(User.objects.all(), "team"),
+            )
+        )
+
     def survey_count(self, obj):
-        return obj.survey_set.count()
+        return obj.survey_count
 
     survey_count.short_description = "Surveys"
+    survey_count.admin_order_field = "survey_count"
 
     def member_count(self, obj):
-        return obj.user_set.count()
+        return obj.member_count
 
     member_count.short_description = "Members"
+    member_count.admin_order_field = "member_count"
 
 
 @admin.register(Respondent)
@@ -71,11 +104,21 @@ class RespondentAdmin(admin.ModelAdmin):
     list_filter = ("created_at",)
     search_fields = ("email", "full_name", "phone_number")
     ordering = ("full_name",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(response_count=count_subquery(SurveyResponse.objects.all(), "respondent"))
+        )
 
     def response_count(self, obj):
-        return obj.surveyresponse_set.count()
+        return obj.response_count
 
     response_count.short_description = "Responses"
+    response_count.admin_order_field = "response_count"
 
 
 @admin.register(Survey)
@@ -85,7 +128,8 @@ class SurveyAdmin(admin.ModelAdmin):
         "created_by",
         "team",
         "status",
-        "response_count",
+        "total_responses",
+        "complete_responses",
         "allow_multiple_responses",
         "is_active",
         "created_at",
@@ -93,12 +137,15 @@ class SurveyAdmin(admin.ModelAdmin):
     list_filter = ("status", "allow_multiple_responses", "team", "created_at")
     search_fields = ("title", "description", "created_by__email")
     ordering = ("-created_at",)
+    list_select_related = ("created_by", "team")
     readonly_fields = (
         "oid",
         "public_url_link",
         "edit_url_link",
         "responses_url_link",
-        "response_count",
+        "total_responses",
+        "complete_responses",
+        "last_response_at",
     )
 
     fieldsets = (
@@ -114,7 +161,9 @@ class SurveyAdmin(admin.ModelAdmin):
                     "public_url_link",
                     "edit_url_link",
                     "responses_url_link",
-                    "response_count",
+                    "total_responses",
+                    "complete_responses",
+                    "last_response_at",
                 ),
                 "classes": ("collapse",),
             },
@@ -164,6 +213,9 @@ class SurveyResponseAdmin(admin.ModelAdmin):
         "respondent__full_name",
     )
     ordering = ("-created_at",)
+    list_select_related = ("survey", "respondent")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     readonly_fields = ("oid", "response_url_link", "completed_at")
 
     fieldsets = (
@@ -179,11 +231,13 @@ class SurveyResponseAdmin(admin.ModelAdmin):
         return obj.respondent.full_name
 
     respondent_name.short_description = "Name"
+    respondent_name.admin_order_field = "respondent__full_name"
 
     def respondent_email(self, obj):
         return obj.respondent.email
 
     respondent_email.short_description = "Email"
+    respondent_email.admin_order_field = "respondent__email"
 
     def response_url_link(self, obj):
         if obj.oid:
@@ -192,3 +246,15 @@ class SurveyResponseAdmin(admin.ModelAdmin):
         return "-"
 
     response_url_link.short_description = "Response URL"
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ("recipient", "kind", "survey", "status", "attempts", "sent_at", "created_at")
+    list_filter = ("status", "kind", "created_at")
+    search_fields = ("recipient", "subject", "survey__title")
+    ordering = ("-created_at",)
+    list_select_related = ("survey",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    readonly_fields = ("oid", "batch_id", "attempts", "last_error", "sent_at")
@@ -19,3 +19,28 @@ SURVEY_CATEGORY_CHOICES = [
     ("product", "Product Research"),
     ("other", "Other"),
 ]
+
+EMAIL_KIND_CHOICES = [
+    ("invitation", "Invitation"),
+    ("confirmation", "Confirmation"),
+]
+
+EMAIL_STATUS_CHOICES = [
+    ("queued", "Queued"),
+    ("sending", "Sending"),
+    ("sent", "Sent"),
+    ("failed", "Failed"),
+]
+
+QUESTION_TYPE_CHOICES = [
+    ("text", "Short Text"),
+    ("textarea", "Long Text"),
+    ("number", "Number"),
+    ("email", "Email"),
+    ("phone", "Phone"),
+    ("date", "Date"),
+    ("radio", "Single Choice"),
+    ("checkbox", "Multiple Choice"),
+    ("dropdown", "Dropdown"),
+    ("rating", "Rating"),
+]
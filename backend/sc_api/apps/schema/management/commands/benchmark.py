@@ -0,0 +1,38 @@
+import inspect
+import json
+from importlib import import_module
+
+from django.core.management.base import BaseCommand, CommandError
+from sc_api.benchmarks import BENCHMARKS
+
+
+class Command(BaseCommand):
+    help = "Run a local benchmark and print its results"
+
+    def add_arguments(self, parser):
+        parser.add_argument("name", choices=sorted(BENCHMARKS), help="Benchmark to run")
+        parser.add_argument(
+            "--iterations", type=int, help="Number of iterations (benchmark default if omitted)"
+        )
+        parser.add_argument("--size", type=int, help="Data set size (benchmark default if omitted)")
+        parser.add_argument("--output", help="Also write the results as JSON to this file")
+
+    def handle(self, *args, **options):
+        module = import_module(BENCHMARKS[options["name"]])
+        kwargs = {key: options[key] for key in ("iterations", "size") if options[key] is not None}
+        accepted = inspect.signature(module.run).parameters
+        unsupported = [f"--{key}" for key in kwargs if key not in accepted]
+        if unsupported:
+            raise CommandError(
+                f"The {options['name']} benchmark does not take {', '.join(unsupported)}"
+            )
+
+        results = module.run(**kwargs)
+
+        self.stdout.write(self.style.SUCCESS(f"✓ Benchmark: {options['name']}"))
+        self.stdout.write(json.dumps(results, indent=2, default=str))
+
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump(results, f, indent=2, default=str)
+            self.stdout.write(f"  Results written to {options['output']}")
@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from sc_api.apps.utils.database import check_connections
+
+
+class Command(BaseCommand):
+    help = "Connect to each configured database and report the connection setup cost"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "aliases",
+            nargs="*",
+            help="DATABASES aliases to check (all of them if omitted)",
+        )
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=5,
+            help="Reconnects timed after the first connection",
+        )
+
+    def handle(self, *args, **options):
+        unknown = [alias for alias in options["aliases"] if alias not in settings.DATABASES]
+        if unknown:
+            raise CommandError(f"Unknown database aliases: {', '.join(unknown)}")
+
+        results = check_connections(options["aliases"], options["samples"])
+        failures = []
+        for result in results:
+            alias = result["alias"]
+            if result["error"]:
+                self.stdout.write(self.style.ERROR(f"  ✗ {alias}: {result['error']}"))
+                failures.append(alias)
+                continue
+
+            if result["pooled"]:
+                pool = result["pool"]
+                mode = f"pool {pool['size']}/{pool['max_size']} (min {pool['min_size']})"
+            elif result["conn_max_age"]:
+                mode = f"persistent, CONN_MAX_AGE={result['conn_max_age']}"
+            else:
+                mode = "new connection per request"
+            self.stdout.write(
+                f"  ✓ {alias}: {result['vendor']} ({mode}) "
+                f"connect {result['connect_ms']} ms, reconnect {result['reconnect_ms']} ms, "
+                f"SELECT 1 {result['query_ms']} ms"
+            )
+
+        if failures:
+            raise CommandError(f"Could not connect to: {', '.join(failures)}")
+
+        self.stdout.write(self.style.SUCCESS(f"✓ All {len(results)} databases reachable"))
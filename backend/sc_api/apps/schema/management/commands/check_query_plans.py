@@ -0,0 +1,84 @@
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from sc_api.apps.schema.models import Survey, SurveyResponse
+from sc_api.apps.survey.search import search_surveys
+
+# Hot query -> (queryset factory, indexes any of which satisfies the plan).
+HOT_QUERIES = {
+    "survey_list": (
+        lambda: Survey.objects.filter(team_id=1).order_by("-created_at"),
+        ["survey_team_created_idx"],
+    ),
+    # pg_trgm GIN index on PostgreSQL, the FTS5 trigram table on SQLite.
+    "survey_search": (
+        lambda: search_surveys(Survey.objects.all(), "feedback"),
+        ["survey_title_trgm_idx", "survey_search"],
+    ),
+    # The unique oid index (named by PostgreSQL / SQLite); status is checked on the one row.
+    "public_survey": (
+        lambda: Survey.objects.filter(status="published", oid=uuid.uuid4())[:21],
+        ["survey_oid_key", "sqlite_autoindex_survey_"],
+    ),
+    "response_lookup": (
+        lambda: SurveyResponse.objects.filter(survey_id=1, respondent_id=1, is_complete=True)[:1],
+        ["survey_response_lookup_idx"],
+    ),
+    "response_list": (
+        lambda: SurveyResponse.objects.filter(survey_id=1).order_by("-created_at", "-id")[:51],
+        ["survey_response_created_idx"],
+    ),
+}
+
+
+def explain(queryset):
+    """
+    EXPLAIN a queryset and return the plan text.
+
+    On PostgreSQL sequential scans are disabled for the statement, since on a
+    small or empty table the planner would otherwise never pick an index.
+    """
+    with transaction.atomic():
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        return queryset.explain()
+
+
+class Command(BaseCommand):
+    help = "EXPLAIN the hot survey queries and fail if they do not use their indexes"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--show-plans",
+            action="store_true",
+            help="Print the full query plan of every query",
+        )
+
+    def handle(self, *args, **options):
+        failures = []
+
+        for name, (build_queryset, indexes) in HOT_QUERIES.items():
+            plan = explain(build_queryset())
+            used = next((index for index in indexes if index in plan), None)
+
+            if used:
+                self.stdout.write(f"  ✓ {name}: {used}")
+            else:
+                self.stdout.write(self.style.ERROR(f"  ✗ {name}: expected {indexes[0]}"))
+                failures.append(name)
+            if options["show_plans"] or not used:
+                self.stdout.write(f"    {plan}")
+
+        if failures:
+            raise CommandError(
+                f"{len(failures)} queries do not use their index on {connection.vendor}: "
+                + ", ".join(failures)
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✓ All {len(HOT_QUERIES)} hot queries use an index ({connection.vendor})"
+            )
+        )
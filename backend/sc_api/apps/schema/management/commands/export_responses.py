@@ -0,0 +1,76 @@
+import sys
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+from sc_api.apps.schema.models import Survey
+from sc_api.apps.survey.exports import (
+    COLUMNAR_FORMATS,
+    EXPORT_FORMATS,
+    export_filename,
+    stream_export,
+    write_columnar_export,
+)
+
+
+class Command(BaseCommand):
+    help = "Export a survey's responses to a CSV, NDJSON, Parquet or Arrow file"
+
+    def add_arguments(self, parser):
+        parser.add_argument("oid", help="Survey oid")
+        parser.add_argument(
+            "--format", choices=sorted({**EXPORT_FORMATS, **COLUMNAR_FORMATS}), default="csv"
+        )
+        parser.add_argument(
+            "--gzip", action="store_true", help="Gzip-compress the output (CSV/NDJSON only)"
+        )
+        parser.add_argument(
+            "--output", help="Output file path ('-' for stdout, default: generated file name)"
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=2000, help="Rows fetched per database round trip"
+        )
+        parser.add_argument(
+            "--row-group-size",
+            type=int,
+            default=50000,
+            help="Rows per Parquet row group / Arrow record batch",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            survey = Survey.objects.only("id", "oid", "questions").get(oid=options["oid"])
+        except (Survey.DoesNotExist, ValueError):
+            raise CommandError(f"Survey not found: {options['oid']}")
+
+        file_format = options["format"]
+        if file_format in COLUMNAR_FORMATS:
+            self.export_columnar(survey, file_format, options)
+            return
+
+        output = options["output"] or export_filename(survey, file_format, options["gzip"])
+        chunks = stream_export(survey, file_format, options["gzip"], options["chunk_size"])
+
+        if output == "-":
+            for chunk in chunks:
+                sys.stdout.buffer.write(chunk)
+            return
+
+        written = 0
+        with open(output, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                written += len(chunk)
+
+        self.stdout.write(self.style.SUCCESS(f"✓ Exported responses to {output} ({written} bytes)"))
+
+    def export_columnar(self, survey, file_format, options):
+        if options["gzip"] or options["output"] == "-":
+            raise CommandError(f"{file_format} exports are written to a file without --gzip.")
+
+        output = options["output"] or export_filename(survey, file_format)
+        try:
+            rows = write_columnar_export(survey, output, file_format, options["row_group_size"])
+        except ImproperlyConfigured as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(self.style.SUCCESS(f"✓ Exported {rows} responses to {output}"))
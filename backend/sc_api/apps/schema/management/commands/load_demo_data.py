@@ -1,16 +1,48 @@
 import json
 import os
+import time
 
 from django.conf import settings
 from django.contrib.auth.hashers import make_password
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from sc_api.apps.schema.models import Respondent, Survey, SurveyResponse, Team, User
+from sc_api.apps.survey.demo import DEMO_PASSWORD, generate_demo_data
 
 
 class Command(BaseCommand):
-    help = "Load demo data from JSON files"
+    help = "Load demo data from JSON files, or generate synthetic data at scale with --teams"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--teams", type=int, help="Generate this many synthetic teams instead of the JSON data"
+        )
+        parser.add_argument("--surveys", type=int, default=10, help="Generated surveys per team")
+        parser.add_argument(
+            "--responses-per-survey",
+            type=int,
+            default=1000,
+            help="Generated responses (and respondents) per survey",
+        )
+        parser.add_argument(
+            "--prefix",
+            default="demo",
+            help="Prefix of generated team names and emails (remove with remove_demo_data --prefix)",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Random seed of the generator")
+        parser.add_argument(
+            "--batch-size", type=int, default=5000, help="Rows per insert and per transaction"
+        )
+        parser.add_argument(
+            "--copy",
+            action="store_true",
+            help="Load generated responses with COPY (PostgreSQL only)",
+        )
 
     def handle(self, *args, **options):
+        if options["teams"]:
+            self.generate(options)
+            return
+
         demo_dir = os.path.join(settings.RESOURCES_DIR, "demo_data")
 
         if not os.path.exists(demo_dir):
@@ -116,7 +148,12 @@ class Command(BaseCommand):
 
                     response_data["survey"] = surveys[survey_idx]
                     response_data["respondent"] = respondents[respondent_idx]
-                    SurveyResponse.objects.create(**response_data)
+                    survey_response = SurveyResponse.objects.create(**response_data)
+                    Survey.increment_response_counters(
+                        survey_response.survey_id,
+                        survey_response.is_complete,
+                        survey_response.created_at,
+                    )
                     responses_created += 1
 
                     self.stdout.write(
@@ -143,3 +180,42 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR(f"Invalid JSON format: {e}"))
         except Exception as e:
             self.stdout.write(self.style.ERROR(f"Error loading demo data: {e}"))
+
+    def generate(self, options):
+        prefix = options["prefix"]
+        if Team.objects.filter(name__startswith=f"{prefix}-team-").exists():
+            raise CommandError(
+                f'Generated data with prefix "{prefix}" already exists; '
+                f"remove it with remove_demo_data --prefix {prefix} or pick another --prefix"
+            )
+
+        def progress(survey, responses):
+            self.stdout.write(f"  ✓ {survey.title}: {responses} responses")
+
+        start = time.perf_counter()
+        try:
+            result = generate_demo_data(
+                options["teams"],
+                options["surveys"],
+                options["responses_per_survey"],
+                prefix=prefix,
+                seed=options["seed"],
+                batch_size=options["batch_size"],
+                use_copy=options["copy"],
+                progress=progress,
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+        elapsed = time.perf_counter() - start
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"\n   Generated demo data in {elapsed:.1f}s "
+                f"({result['responses'] / elapsed:,.0f} responses/s)"
+                f"\n   Teams: {len(result['teams'])}"
+                f"\n   Users: {prefix}-owner-<n>@example.com (password: {DEMO_PASSWORD})"
+                f"\n   Respondents: {result['respondents']}"
+                f"\n   Surveys: {len(result['surveys'])}"
+                f"\n   Responses: {result['responses']}"
+            )
+        )
@@ -0,0 +1,93 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from sc_api.benchmarks.load import DEFAULT_THRESHOLD, SCENARIOS, compare_results, run
+
+
+class Command(BaseCommand):
+    help = "Seed synthetic data, load-test the key API endpoints and compare with a baseline"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--teams", type=int, default=2, help="Teams to seed")
+        parser.add_argument("--surveys", type=int, default=5, help="Surveys per team")
+        parser.add_argument(
+            "--responses", type=int, default=200, help="Seeded responses per survey"
+        )
+        parser.add_argument("--clients", type=int, default=8, help="Concurrent clients")
+        parser.add_argument("--requests", type=int, default=400, help="Requests per scenario")
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            choices=sorted(SCENARIOS),
+            help="Scenario to run (repeatable; all when omitted)",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Random seed of the generator")
+        parser.add_argument("--output", help="Write the results as a JSON baseline to this file")
+        parser.add_argument("--baseline", help="Compare the results with this JSON baseline")
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=DEFAULT_THRESHOLD,
+            help="Relative latency/throughput change counted as a regression",
+        )
+        parser.add_argument(
+            "--fail-on-regression",
+            action="store_true",
+            help="Exit with an error when the comparison finds a regression",
+        )
+
+    def handle(self, *args, **options):
+        baseline = None
+        if options["baseline"]:
+            with open(options["baseline"]) as f:
+                baseline = json.load(f)
+
+        results = run(
+            size=options["responses"],
+            iterations=options["requests"],
+            clients=options["clients"],
+            teams=options["teams"],
+            surveys_per_team=options["surveys"],
+            scenarios=options["scenario"],
+            seed=options["seed"],
+        )
+
+        meta = results["meta"]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✓ Load test on {meta['database']}: {meta['surveys']} surveys, "
+                f"{meta['responses']} responses, {meta['clients']} clients"
+            )
+        )
+        for name, stats in results["scenarios"].items():
+            self.stdout.write(
+                f"  {name:<18} {stats['throughput_rps']:>8} req/s  "
+                f"p50 {stats['p50_ms']:>8} ms  p99 {stats['p99_ms']:>8} ms  "
+                f"queries {stats['p50_queries']}  errors {stats['errors']}"
+            )
+
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump(results, f, indent=2, default=str)
+            self.stdout.write(f"  Results written to {options['output']}")
+
+        if baseline is None:
+            return
+
+        rows = compare_results(results, baseline, options["threshold"])
+        self.stdout.write(
+            f"\nCompared with {options['baseline']} ({baseline['meta'].get('commit')})"
+        )
+        for row in rows:
+            changes = "  ".join(
+                f"{key} {row[key]['baseline']} → {row[key]['current']} ({row[key]['change']:+.0%})"
+                for key in ("throughput_rps", "p50_ms", "p99_ms", "p50_queries")
+            )
+            line = f"  {row['scenario']:<18} {changes}"
+            self.stdout.write(self.style.ERROR(line) if row["regressions"] else line)
+
+        regressed = [row["scenario"] for row in rows if row["regressions"]]
+        if regressed and options["fail_on_regression"]:
+            raise CommandError(f"Regressions in: {', '.join(regressed)}")
+        if not regressed:
+            self.stdout.write(self.style.SUCCESS("✓ No regressions"))
@@ -0,0 +1,85 @@
+from django.core.management.base import BaseCommand, CommandError
+from sc_api.apps.schema.models import Survey
+from sc_api.apps.survey.purge import (
+    DEFAULT_BATCH_SIZE,
+    expired_responses,
+    purge_expired_responses,
+    survey_retention_days,
+)
+
+
+class Command(BaseCommand):
+    help = "Delete survey responses older than a retention window, in bounded batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument("oids", nargs="*", help="Survey oids (all surveys when omitted)")
+        parser.add_argument(
+            "--older-than",
+            type=int,
+            metavar="DAYS",
+            help="Retention window for every selected survey; by default each survey's "
+            'configs["retention_days"] is used and surveys without one are skipped',
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Maximum rows per DELETE"
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="Seconds to pause between batches, to limit load on a busy database",
+        )
+        parser.add_argument(
+            "--skip-stats",
+            action="store_true",
+            help="Do not rebuild question stats of purged surveys (run rebuild_question_stats later)",
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Only count the responses that would be deleted"
+        )
+
+    def handle(self, *args, **options):
+        surveys = Survey.objects.all()
+        if options["oids"]:
+            surveys = surveys.filter(oid__in=options["oids"])
+            if surveys.count() != len(set(options["oids"])):
+                raise CommandError("Some survey oids were not found.")
+
+        if options["older_than"] is not None and options["older_than"] < 0:
+            raise CommandError("--older-than must not be negative.")
+
+        if options["dry_run"]:
+            self.dry_run(surveys, options["older_than"])
+            return
+
+        def progress(survey, deleted):
+            self.stdout.write(f"  ↻ {survey.title} ({survey.oid}): {deleted} deleted")
+
+        purged = purge_expired_responses(
+            surveys,
+            retention_days=options["older_than"],
+            batch_size=options["batch_size"],
+            sleep=options["sleep"],
+            rebuild_stats=not options["skip_stats"],
+            progress=progress,
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✓ Purged {sum(purged.values())} responses from {len(purged)} surveys"
+            )
+        )
+
+    def dry_run(self, surveys, older_than):
+        total = 0
+        for survey in surveys.order_by("pk"):
+            days = older_than if older_than is not None else survey_retention_days(survey)
+            if days is None:
+                continue
+            count = expired_responses(survey, days).count()
+            if count:
+                self.stdout.write(
+                    f"  {survey.title} ({survey.oid}): {count} older than {days} days"
+                )
+                total += count
+        self.stdout.write(self.style.SUCCESS(f"✓ {total} responses would be purged"))
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand, CommandError
+from sc_api.apps.schema.models import Survey
+from sc_api.apps.survey.stats import rebuild_question_stats
+
+
+class Command(BaseCommand):
+    help = "Recompute per-question result stats from stored survey responses"
+
+    def add_arguments(self, parser):
+        parser.add_argument("oids", nargs="*", help="Survey oids to rebuild")
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Rebuild stats for every survey",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Responses fetched from the database per round trip",
+        )
+
+    def handle(self, *args, **options):
+        if not options["oids"] and not options["all"]:
+            raise CommandError("Pass one or more survey oids, or --all.")
+
+        surveys = Survey.objects.only("id", "oid", "title", "questions")
+        if not options["all"]:
+            surveys = surveys.filter(oid__in=options["oids"])
+
+        rebuilt = 0
+        for survey in surveys.iterator():
+            scanned = rebuild_question_stats(survey, options["chunk_size"])
+            self.stdout.write(f"  ↻ {survey.title}: {scanned} responses")
+            rebuilt += 1
+
+        self.stdout.write(self.style.SUCCESS(f"✓ Rebuilt question stats for {rebuilt} surveys"))
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from sc_api.apps.schema.models import Survey
+from sc_api.apps.survey.services import reconcile_response_counters
+
+
+class Command(BaseCommand):
+    help = "Recompute drifted survey response counters from the responses table"
+
+    def add_arguments(self, parser):
+        parser.add_argument("oids", nargs="*", help="Survey oids to check (all surveys if omitted)")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Surveys rewritten per UPDATE",
+        )
+
+    def handle(self, *args, **options):
+        surveys = Survey.objects.all()
+        if options["oids"]:
+            surveys = surveys.filter(oid__in=options["oids"])
+
+        corrected = reconcile_response_counters(surveys, options["batch_size"])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"✓ Response counters reconciled. Corrected: {corrected} surveys")
+        )
@@ -4,6 +4,8 @@ import os
 from django.conf import settings
 from django.core.management.base import BaseCommand
 from sc_api.apps.schema.models import Respondent, Survey, SurveyResponse, Team, User
+from sc_api.apps.survey.demo import delete_demo_data
+from sc_api.apps.survey.purge import purge_respondents, purge_responses, purge_surveys
 
 
 class Command(BaseCommand):
@@ -15,8 +17,16 @@ class Command(BaseCommand):
             action="store_true",
             help="Force deletion without confirmation",
         )
+        parser.add_argument(
+            "--prefix",
+            help="Remove data generated by load_demo_data --teams with this prefix instead",
+        )
 
     def handle(self, *args, **options):
+        if options["prefix"]:
+            self.remove_generated(options["prefix"], options["force"])
+            return
+
         demo_dir = os.path.join(settings.RESOURCES_DIR, "demo_data")
 
         if not os.path.exists(demo_dir):
@@ -48,11 +58,14 @@ class Command(BaseCommand):
             respondent_emails = [r["email"] for r in respondents_data]
             survey_titles = [s["title"] for s in surveys_data]
 
+            survey_ids = list(
+                Survey.objects.filter(title__in=survey_titles).values_list("pk", flat=True)
+            )
             team_count = Team.objects.filter(name=team_name).count()
             user_count = User.objects.filter(email=user_email).count()
             respondent_count = Respondent.objects.filter(email__in=respondent_emails).count()
-            survey_count = Survey.objects.filter(title__in=survey_titles).count()
-            response_count = SurveyResponse.objects.filter(survey__title__in=survey_titles).count()
+            survey_count = len(survey_ids)
+            response_count = SurveyResponse.objects.filter(survey_id__in=survey_ids).count()
 
             self.stdout.write(f"  📁 Team: {team_name} ({team_count} record)")
             self.stdout.write(f"  👤 User: {user_email} ({user_count} record)")
@@ -78,15 +91,17 @@ class Command(BaseCommand):
 
             deleted_counts = {}
 
-            deleted_counts["responses"] = SurveyResponse.objects.filter(
-                survey__title__in=survey_titles
-            ).delete()[0]
+            # Responses and respondents are removed in batches with set-based
+            # deletes; the few surveys, users and teams go through the ORM.
+            deleted_counts["responses"] = purge_responses(
+                SurveyResponse.objects.filter(survey_id__in=survey_ids)
+            )
 
-            deleted_counts["surveys"] = Survey.objects.filter(title__in=survey_titles).delete()[0]
+            deleted_counts["surveys"] = purge_surveys(Survey.objects.filter(pk__in=survey_ids))
 
-            deleted_counts["respondents"] = Respondent.objects.filter(
-                email__in=respondent_emails
-            ).delete()[0]
+            deleted_counts["respondents"] = purge_respondents(
+                Respondent.objects.filter(email__in=respondent_emails)
+            )
 
             deleted_counts["users"] = User.objects.filter(email=user_email).delete()[0]
 
@@ -109,3 +124,34 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR(f"Invalid JSON format: {e}"))
         except Exception as e:
             self.stdout.write(self.style.ERROR(f"Error removing demo data: {e}"))
+
+    def remove_generated(self, prefix, force):
+        teams = Team.objects.filter(name__startswith=f"{prefix}-team-")
+        team_count = teams.count()
+        response_count = SurveyResponse.objects.filter(survey__team__in=teams).count()
+
+        if team_count == 0:
+            self.stdout.write(self.style.SUCCESS(f'✓ No generated data with prefix "{prefix}".'))
+            return
+
+        if not force:
+            confirmation = input(
+                f"\nDelete {team_count} generated teams and {response_count} responses? (yes/no): "
+            )
+            if confirmation.lower() not in ["yes", "y"]:
+                self.stdout.write(self.style.WARNING("Deletion cancelled."))
+                return
+
+        def progress(deleted):
+            self.stdout.write(f"  ↻ responses: {deleted} deleted")
+
+        deleted = delete_demo_data(prefix, progress=progress)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"\n   Generated data deleted successfully!"
+                f'\n   Teams: {deleted["teams"]}'
+                f'\n   Users: {deleted["users"]}'
+                f'\n   Respondents: {deleted["respondents"]}'
+                f'\n   Surveys: {deleted["surveys"]}'
+            )
+        )
@@ -0,0 +1,52 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from sc_api.apps.utils.email import deliver_queued_emails
+
+
+class Command(BaseCommand):
+    help = "Deliver queued outbound emails (invitations and confirmations)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.EMAIL_OUTBOX["BATCH_SIZE"],
+            help="Number of emails sent per SMTP connection",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling the outbox instead of exiting once it is drained",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="Seconds to wait between polls when --loop is set",
+        )
+
+    def handle(self, *args, **options):
+        totals = {"sent": 0, "failed": 0}
+
+        while True:
+            result = deliver_queued_emails(options["batch_size"])
+            totals["sent"] += result["sent"]
+            totals["failed"] += result["failed"]
+
+            if result["claimed"]:
+                self.stdout.write(
+                    f"  ✉ Batch: {result['sent']} sent, {result['failed']} failed/retrying"
+                )
+                continue
+
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✓ Outbox drained. Sent: {totals['sent']}, Failed/retrying: {totals['failed']}"
+            )
+        )
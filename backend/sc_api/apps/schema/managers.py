@@ -1,4 +1,6 @@
 from django.contrib.auth.models import BaseUserManager
+from django.db import models, transaction
+from django.db.models import Count, Q
 
 
 class UserManager(BaseUserManager):
@@ -15,3 +17,29 @@ class UserManager(BaseUserManager):
         extra_fields.setdefault("is_staff", True)
         extra_fields.setdefault("is_superuser", True)
         return self.create_user(email, password, **extra_fields)
+
+
+class SurveyResponseQuerySet(models.QuerySet):
+    def delete(self):
+        """
+        Delete the responses and decrement their surveys' response counters.
+
+        Responses removed by a cascade (e.g. deleting a respondent) bypass this;
+        the reconcile_response_counters command repairs the counters afterwards.
+        """
+        with transaction.atomic(using=self.db):
+            removed = list(
+                self.order_by()
+                .values("survey_id")
+                .annotate(total=Count("id"), complete=Count("id", filter=Q(is_complete=True)))
+            )
+            result = super().delete()
+            survey_model = self.model._meta.get_field("survey").related_model
+            for row in removed:
+                survey_model.decrement_response_counters(
+                    row["survey_id"], row["total"], row["complete"]
+                )
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.1 on 2026-10-17 12:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0003_outboundemail_survey_response"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="surveyresponse",
+            name="enforce_single_response",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddConstraint(
+            model_name="surveyresponse",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("enforce_single_response", True), ("is_complete", True)),
+                fields=("survey", "respondent"),
+                name="unique_complete_response_per_respondent",
+            ),
+        ),
+    ]
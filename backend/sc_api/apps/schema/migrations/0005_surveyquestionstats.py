@@ -0,0 +1,63 @@
+# Generated by Django 5.2.1 on 2026-10-17 12:28
+
+import uuid
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0004_surveyresponse_single_response"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SurveyQuestionStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "oid",
+                    models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+                ),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("question_key", models.CharField(max_length=64)),
+                ("answer_count", models.PositiveIntegerField(default=0)),
+                ("option_counts", models.JSONField(default=dict)),
+                ("numeric_count", models.PositiveIntegerField(default=0)),
+                ("numeric_sum", models.FloatField(default=0)),
+                ("numeric_sumsq", models.FloatField(default=0)),
+                ("numeric_min", models.FloatField(blank=True, null=True)),
+                ("numeric_max", models.FloatField(blank=True, null=True)),
+                (
+                    "survey",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="question_stats",
+                        to="schema.survey",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "Survey Question Stats",
+                "db_table": "survey_question_stats",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("survey", "question_key"),
+                        name="unique_question_stats_per_survey",
+                    )
+                ],
+            },
+        ),
+    ]
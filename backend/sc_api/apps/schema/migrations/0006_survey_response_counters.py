@@ -0,0 +1,45 @@
+# Generated by Django 5.2.1 on 2026-10-17 12:34
+
+from django.db import migrations, models
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_response_counters(apps, schema_editor):
+    Survey = apps.get_model("schema", "Survey")
+    SurveyResponse = apps.get_model("schema", "SurveyResponse")
+
+    responses = SurveyResponse.objects.filter(survey=OuterRef("pk")).order_by().values("survey")
+    Survey.objects.update(
+        total_responses=Coalesce(Subquery(responses.annotate(n=Count("pk")).values("n")), 0),
+        complete_responses=Coalesce(
+            Subquery(responses.filter(is_complete=True).annotate(n=Count("pk")).values("n")), 0
+        ),
+        last_response_at=Subquery(responses.annotate(last=Max("created_at")).values("last")),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0005_surveyquestionstats"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="survey",
+            name="complete_responses",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="survey",
+            name="last_response_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="survey",
+            name="total_responses",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_response_counters, migrations.RunPython.noop),
+    ]
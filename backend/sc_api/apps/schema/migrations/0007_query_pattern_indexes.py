@@ -0,0 +1,40 @@
+# Generated by Django 5.2.1 on 2026-10-17 12:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0006_survey_response_counters"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="survey",
+            index=models.Index(fields=["team", "-created_at"], name="survey_team_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="survey",
+            index=models.Index(
+                condition=models.Q(("status", "published")),
+                fields=["oid"],
+                name="survey_published_oid_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="surveyresponse",
+            index=models.Index(
+                condition=models.Q(("is_complete", True)),
+                fields=["survey", "respondent", "-created_at"],
+                name="survey_response_lookup_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="surveyresponse",
+            index=models.Index(
+                fields=["survey", "-created_at", "-id"],
+                name="survey_response_created_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,87 @@
+from django.db import OperationalError, migrations
+
+# Survey title/description search (sc_api.apps.survey.search): trigram GIN indexes
+# on PostgreSQL, an FTS5 trigram table kept in sync by triggers on SQLite.
+
+POSTGRESQL_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    # Match the UPPER(col::text) LIKE expression Django emits for icontains.
+    "CREATE INDEX IF NOT EXISTS survey_title_trgm_idx "
+    "ON survey USING gin (UPPER(title::text) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS survey_description_trgm_idx "
+    "ON survey USING gin (UPPER(description) gin_trgm_ops)",
+]
+
+POSTGRESQL_BACKWARD = [
+    "DROP INDEX IF EXISTS survey_title_trgm_idx",
+    "DROP INDEX IF EXISTS survey_description_trgm_idx",
+]
+
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS survey_search USING fts5("
+    "title, description, content='survey', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS survey_search_ai AFTER INSERT ON survey BEGIN "
+    "INSERT INTO survey_search(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS survey_search_ad AFTER DELETE ON survey BEGIN "
+    "INSERT INTO survey_search(survey_search, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS survey_search_au AFTER UPDATE OF title, description "
+    "ON survey BEGIN "
+    "INSERT INTO survey_search(survey_search, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO survey_search(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    "INSERT INTO survey_search(survey_search) VALUES ('rebuild')",
+]
+
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS survey_search_ai",
+    "DROP TRIGGER IF EXISTS survey_search_ad",
+    "DROP TRIGGER IF EXISTS survey_search_au",
+    "DROP TABLE IF EXISTS survey_search",
+]
+
+
+def _sqlite_has_fts5_trigram(schema_editor):
+    # The trigram tokenizer needs FTS5 and SQLite 3.34+.
+    with schema_editor.connection.cursor() as cursor:
+        try:
+            cursor.execute("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x, tokenize='trigram')")
+        except OperationalError:
+            return False
+        cursor.execute("DROP TABLE temp.fts5_probe")
+    return True
+
+
+def _run(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        _run(schema_editor, POSTGRESQL_FORWARD)
+    elif vendor == "sqlite" and _sqlite_has_fts5_trigram(schema_editor):
+        # Without FTS5 (or on other databases) search falls back to icontains.
+        _run(schema_editor, SQLITE_FORWARD)
+
+
+def drop_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        _run(schema_editor, POSTGRESQL_BACKWARD)
+    elif vendor == "sqlite":
+        _run(schema_editor, SQLITE_BACKWARD)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0007_query_pattern_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
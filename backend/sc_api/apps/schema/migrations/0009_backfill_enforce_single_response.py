@@ -0,0 +1,40 @@
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_enforce_single_response(apps, schema_editor):
+    """
+    Flag the earliest complete response per respondent on single-response surveys.
+
+    Responses stored before 0004 all have the flag unset, so the unique
+    constraint did not protect them. Duplicates that already exist are kept,
+    unflagged; only the earliest one blocks further submissions.
+    """
+    Survey = apps.get_model("schema", "Survey")
+    SurveyResponse = apps.get_model("schema", "SurveyResponse")
+    first_complete = (
+        SurveyResponse.objects.filter(
+            survey=OuterRef("survey"), respondent=OuterRef("respondent"), is_complete=True
+        )
+        .order_by("created_at", "id")
+        .values("id")[:1]
+    )
+    SurveyResponse.objects.filter(enforce_single_response=True).update(
+        enforce_single_response=False
+    )
+    SurveyResponse.objects.filter(
+        survey__in=Survey.objects.filter(allow_multiple_responses=False),
+        is_complete=True,
+        id=Subquery(first_complete),
+    ).update(enforce_single_response=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0008_survey_search"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_enforce_single_response, migrations.RunPython.noop),
+    ]
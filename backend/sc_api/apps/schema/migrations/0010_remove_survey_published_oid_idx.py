@@ -0,0 +1,16 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0009_backfill_enforce_single_response"),
+    ]
+
+    operations = [
+        # Duplicated the unique oid index, which the planner always prefers.
+        migrations.RemoveIndex(
+            model_name="survey",
+            name="survey_published_oid_idx",
+        ),
+    ]
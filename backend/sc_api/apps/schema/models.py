@@ -1,15 +1,19 @@
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import EmailValidator
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from sc_api.apps.schema.abstract_models import GlobalAbstractModel
 from sc_api.apps.schema.choices import (
+    EMAIL_KIND_CHOICES,
+    EMAIL_STATUS_CHOICES,
     ROLE_CHOICES,
     SURVEY_CATEGORY_CHOICES,
     SURVEY_STATUS_CHOICES,
 )
-from sc_api.apps.schema.managers import UserManager
+from sc_api.apps.schema.managers import SurveyResponseQuerySet, UserManager
 
 
 class Respondent(GlobalAbstractModel):
@@ -38,30 +42,99 @@ class Survey(GlobalAbstractModel):
     end_date = models.DateTimeField(null=True, blank=True)
     questions = models.JSONField(default=list)
     configs = models.JSONField(default=dict)
+    # Maintained on submission and deletion; reconcile with reconcile_response_counters.
+    total_responses = models.PositiveIntegerField(default=0, editable=False)
+    complete_responses = models.PositiveIntegerField(default=0, editable=False)
+    last_response_at = models.DateTimeField(null=True, blank=True, editable=False)
 
     class Meta:
         db_table = "survey"
         verbose_name_plural = "Surveys"
         ordering = ["-created_at"]
+        indexes = [
+            # Team survey list, newest first.
+            models.Index(fields=["team", "-created_at"], name="survey_team_created_idx"),
+        ]
+
+    # Only written by the F()/reconcile helpers below, never by save().
+    COUNTER_FIELDS = ("total_responses", "complete_responses", "last_response_at")
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        """
+        Save the survey without writing its response counters.
+
+        The in-memory counters go stale as soon as another request counts a
+        response, so updates leave them out of `update_fields`; writing them
+        back would undo those concurrent increments.
+        """
+        if not self._state.adding:
+            update_fields = kwargs.get("update_fields")
+            if update_fields is None:
+                deferred = self.get_deferred_fields()
+                update_fields = [
+                    field.attname
+                    for field in self._meta.concrete_fields
+                    if not field.primary_key and field.attname not in deferred
+                ]
+            kwargs["update_fields"] = [
+                name for name in update_fields if name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
     @property
     def response_count(self):
-        return self.responses.count()
+        return self.total_responses
+
+    @classmethod
+    def increment_response_counters(cls, survey_id, is_complete, created_at):
+        """Count a new response with a single UPDATE, without touching `updated_at`."""
+        return cls.objects.filter(pk=survey_id).update(
+            total_responses=F("total_responses") + 1,
+            complete_responses=F("complete_responses") + int(bool(is_complete)),
+            last_response_at=Greatest(Coalesce("last_response_at", created_at), created_at),
+        )
+
+    @classmethod
+    def decrement_response_counters(cls, survey_id, total, complete):
+        """Uncount deleted responses; `last_response_at` falls back to the newest remaining one."""
+        return cls.objects.filter(pk=survey_id).update(
+            total_responses=F("total_responses") - total,
+            complete_responses=F("complete_responses") - complete,
+            last_response_at=Subquery(
+                SurveyResponse.objects.filter(survey=OuterRef("pk"))
+                .order_by("-created_at")
+                .values("created_at")[:1]
+            ),
+        )
 
     @property
     def is_active(self):
-        if self.status != "published":
+        return self.compute_is_active(self.status, self.start_date, self.end_date)
+
+    @staticmethod
+    def compute_is_active(status, start_date, end_date, now=None):
+        if status != "published":
             return False
-        now = timezone.now()
-        if self.start_date and now < self.start_date:
+        now = now or timezone.now()
+        if start_date and now < start_date:
             return False
-        if self.end_date and now > self.end_date:
+        if end_date and now > end_date:
             return False
         return True
 
+    @staticmethod
+    def is_active_condition(now=None):
+        """compute_is_active as a Q object, so it can be evaluated in SQL."""
+        now = now or timezone.now()
+        return (
+            models.Q(status="published")
+            & (models.Q(start_date__isnull=True) | models.Q(start_date__lte=now))
+            & (models.Q(end_date__isnull=True) | models.Q(end_date__gte=now))
+        )
+
     @property
     def public_url(self):
         return f"/surveys/{self.oid}/"
@@ -81,25 +154,150 @@ class SurveyResponse(GlobalAbstractModel):
     answers = models.JSONField(default=dict)
     is_complete = models.BooleanField(default=False)
     completed_at = models.DateTimeField(null=True, blank=True)
+    # Set from `not survey.allow_multiple_responses` at submission time so the
+    # single-response rule can be enforced by a partial unique constraint; kept
+    # in sync when the setting changes (sync_single_response_flags).
+    enforce_single_response = models.BooleanField(default=False, editable=False)
+
+    objects = SurveyResponseQuerySet.as_manager()
 
     class Meta:
         db_table = "survey_response"
         verbose_name_plural = "Survey Responses"
         ordering = ["-created_at"]
+        indexes = [
+            # Submission checks and duplicate lookups only look for complete
+            # responses, newest first (`.first()`).
+            models.Index(
+                fields=["survey", "respondent", "-created_at"],
+                condition=models.Q(is_complete=True),
+                name="survey_response_lookup_idx",
+            ),
+            # Keyset-paginated response lists, newest first.
+            models.Index(
+                fields=["survey", "-created_at", "-id"], name="survey_response_created_idx"
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["survey", "respondent"],
+                condition=models.Q(is_complete=True, enforce_single_response=True),
+                name="unique_complete_response_per_respondent",
+            )
+        ]
 
     def save(self, *args, **kwargs):
         if self.is_complete and not self.completed_at:
             self.completed_at = timezone.now()
         super().save(*args, **kwargs)
 
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            Survey.decrement_response_counters(self.survey_id, 1, int(self.is_complete))
+        return result
+
     def __str__(self):
         return f"{self.survey.title} - {self.respondent.full_name}"
 
+    @classmethod
+    def sync_single_response_flags(cls, surveys):
+        """
+        Re-derive `enforce_single_response` for the responses of `surveys`.
+
+        On single-response surveys the earliest complete response of each
+        respondent is flagged, so the constraint rejects any further one;
+        duplicates submitted while multiple responses were allowed are kept,
+        unflagged. Multi-response surveys have no flagged responses. Flags are
+        cleared before they are set, so the constraint never sees two at once.
+        """
+        first_complete = (
+            cls.objects.filter(
+                survey=OuterRef("survey"), respondent=OuterRef("respondent"), is_complete=True
+            )
+            .order_by("created_at", "id")
+            .values("id")[:1]
+        )
+        with transaction.atomic():
+            cls.objects.filter(survey__in=surveys, enforce_single_response=True).update(
+                enforce_single_response=False
+            )
+            cls.objects.filter(
+                survey__in=surveys.filter(allow_multiple_responses=False),
+                is_complete=True,
+                id=Subquery(first_complete),
+            ).update(enforce_single_response=True)
+
     @property
     def response_url(self):
         return f"/surveys/{self.survey.oid}/response/{self.oid}/"
 
 
+class SurveyQuestionStats(GlobalAbstractModel):
+    """
+    Running aggregates of one question's answers, updated on every submission.
+
+    `option_counts` holds option picks for choice questions and the histogram
+    for ratings. Deleting responses does not update these rows; run the
+    rebuild_question_stats command to recompute them.
+    """
+
+    survey = models.ForeignKey(Survey, on_delete=models.CASCADE, related_name="question_stats")
+    question_key = models.CharField(max_length=64)
+    answer_count = models.PositiveIntegerField(default=0)
+    option_counts = models.JSONField(default=dict)
+    numeric_count = models.PositiveIntegerField(default=0)
+    numeric_sum = models.FloatField(default=0)
+    numeric_sumsq = models.FloatField(default=0)
+    numeric_min = models.FloatField(null=True, blank=True)
+    numeric_max = models.FloatField(null=True, blank=True)
+
+    class Meta:
+        db_table = "survey_question_stats"
+        verbose_name_plural = "Survey Question Stats"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["survey", "question_key"], name="unique_question_stats_per_survey"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.survey_id} - {self.question_key}"
+
+
+class OutboundEmail(GlobalAbstractModel):
+    batch_id = models.UUIDField(null=True, blank=True, db_index=True)
+    kind = models.CharField(max_length=20, choices=EMAIL_KIND_CHOICES)
+    survey = models.ForeignKey(
+        Survey, on_delete=models.CASCADE, null=True, blank=True, related_name="outbound_emails"
+    )
+    survey_response = models.ForeignKey(
+        SurveyResponse,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="outbound_emails",
+    )
+    recipient = models.EmailField()
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    status = models.CharField(max_length=20, choices=EMAIL_STATUS_CHOICES, default="queued")
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    claim_token = models.UUIDField(null=True, blank=True, db_index=True, editable=False)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "outbound_email"
+        verbose_name_plural = "Outbound Emails"
+        ordering = ["created_at"]
+        indexes = [models.Index(fields=["status", "next_attempt_at"])]
+
+    def __str__(self):
+        return f"{self.get_kind_display()} to {self.recipient} ({self.status})"
+
+
 class Team(GlobalAbstractModel):
     name = models.CharField(max_length=255, unique=True)
 
@@ -0,0 +1,380 @@
+import math
+from itertools import islice
+
+import numpy as np
+from sc_api.apps.schema.models import SurveyResponse
+from sc_api.apps.survey.questions import (
+    answer_key,
+    answer_keys,
+    question_kind,
+    question_options,
+    rating_scale,
+)
+from sc_api.apps.utils.database import replica_alias
+
+CATEGORICAL_KINDS = ("choice", "multi_choice")
+NUMERIC_KINDS = ("rating", "number")
+
+
+def _is_blank(value):
+    return value is None or value == "" or value == []
+
+
+def _to_float(value):
+    if value is None or isinstance(value, bool):
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _float_or_none(value):
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+class AnswerColumn:
+    """
+    One question's answers as NumPy arrays, aligned by response row.
+
+    Choice answers are integer-coded against the question's options (-1 when
+    unanswered or not an option), checkbox answers are an (n, options) boolean
+    matrix and ratings/numbers are float64 with NaN for missing values. A row
+    counts as answered when it holds a value of the question's type.
+
+    Answers are added a chunk at a time with `extend()`; only the encoded
+    arrays are kept, and `finish()` joins them once every chunk is in.
+    """
+
+    def __init__(self, key, question, kind):
+        self.key = key
+        self.question = question
+        self.kind = kind
+        self.labels = question_options(question) if kind in CATEGORICAL_KINDS else []
+        self.codes = None
+        self.indicators = None
+        self.values = None
+        self._option_codes = {label: code for code, label in enumerate(self.labels)}
+        self._chunks = []
+
+    def _encode(self, raw):
+        """The column's array for one chunk of raw answers."""
+        codes = self._option_codes
+        if self.kind == "choice":
+            return np.array(
+                [
+                    (
+                        -1
+                        if value is None
+                        else codes.get(value if type(value) is str else str(value), -1)
+                    )
+                    for value in raw
+                ],
+                dtype=np.int32,
+            )
+        if self.kind == "multi_choice":
+            rows, options = [], []
+            for row, value in enumerate(raw):
+                if not value:
+                    continue
+                for option in value if isinstance(value, list) else [value]:
+                    code = codes.get(str(option))
+                    if code is not None:
+                        rows.append(row)
+                        options.append(code)
+            indicators = np.zeros((len(raw), len(self.labels)), dtype=bool)
+            indicators[rows, options] = True
+            return indicators
+        if self.kind in NUMERIC_KINDS:
+            return np.array([_to_float(value) for value in raw], dtype=np.float64)
+        return np.array([not _is_blank(value) for value in raw], dtype=bool)
+
+    def extend(self, raw):
+        self._chunks.append(self._encode(raw))
+
+    def finish(self):
+        if self._chunks:
+            data = np.concatenate(self._chunks)
+        else:
+            data = self._encode([])
+        self._chunks = []
+
+        if self.kind == "choice":
+            self.codes = data
+            self.answered = self.codes >= 0
+        elif self.kind == "multi_choice":
+            self.indicators = data
+            self.answered = self.indicators.any(axis=1)
+        elif self.kind in NUMERIC_KINDS:
+            self.values = data
+            self.answered = ~np.isnan(self.values)
+        else:
+            self.answered = data
+        return self
+
+    def indicator_matrix(self):
+        """(n, options) boolean matrix of picked options, for either categorical kind."""
+        if self.indicators is not None:
+            return self.indicators
+        matrix = np.zeros((len(self.codes), len(self.labels)), dtype=bool)
+        valid = np.flatnonzero(self.codes >= 0)
+        matrix[valid, self.codes[valid]] = True
+        return matrix
+
+    def category_pairs(self, mask):
+        """(row indices, option codes) of every option picked in the masked rows."""
+        if self.codes is not None:
+            rows = np.flatnonzero(mask & (self.codes >= 0))
+            return rows, self.codes[rows]
+        return np.nonzero(self.indicators & mask[:, None])
+
+
+class SurveyAnswerFrame:
+    """
+    A survey's responses loaded once into per-question NumPy columns.
+
+    Every statistic is computed with whole-array operations over the columns,
+    so the per-response Python work is limited to the initial load.
+    """
+
+    def __init__(self, questions, rows, chunk_size=5000):
+        """
+        Args:
+            questions: Survey.questions
+            rows: iterable of (answers, is_complete) tuples
+            chunk_size: Rows decoded at a time; only the encoded columns outlive a chunk
+        """
+        self.columns = {}
+        key_pairs = []
+        for index, question in enumerate(questions):
+            keys = answer_keys(question, index)
+            key_pairs.append(keys)
+            self.columns[keys[0]] = AnswerColumn(keys[0], question, question_kind(question))
+        columns = list(self.columns.values())
+
+        complete = []
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            complete.append(np.array([bool(is_complete) for _, is_complete in chunk], dtype=bool))
+            for keys, column in zip(key_pairs, columns):
+                if len(keys) == 1:
+                    raw = [answers.get(keys[0]) for answers, _ in chunk]
+                else:
+                    raw = [answers.get(keys[0], answers.get(keys[1])) for answers, _ in chunk]
+                column.extend(raw)
+
+        self.complete = np.concatenate(complete) if complete else np.zeros(0, dtype=bool)
+        self.size = len(self.complete)
+        for column in columns:
+            column.finish()
+
+    @classmethod
+    def from_survey(cls, survey, chunk_size=5000):
+        # Analytics tolerate replication lag, so they read from the replica when there is one.
+        rows = (
+            SurveyResponse.objects.using(replica_alias())
+            .filter(survey=survey)
+            .values_list("answers", "is_complete")
+            .iterator(chunk_size=chunk_size)
+        )
+        return cls(survey.questions, rows, chunk_size)
+
+    def column(self, key, kinds):
+        column = self.columns.get(key)
+        if column is None:
+            raise ValueError(f"Unknown question: {key}")
+        if column.kind not in kinds:
+            raise ValueError(f"{key} must be a {' or '.join(kinds)} question.")
+        return column
+
+    def summary(self):
+        """Per-question answer counts, option counts and numeric summaries."""
+        results = []
+
+        for key, column in self.columns.items():
+            result = {
+                "key": key,
+                "question": column.question.get("question", ""),
+                "type": column.question.get("type"),
+                "answered": int(column.answered.sum()),
+            }
+
+            if column.kind in CATEGORICAL_KINDS:
+                counts = column.indicator_matrix().sum(axis=0)
+                result["options"] = [
+                    {"option": label, "count": int(count)}
+                    for label, count in zip(column.labels, counts)
+                ]
+            elif column.kind in NUMERIC_KINDS:
+                values = column.values[~np.isnan(column.values)]
+                if column.kind == "rating":
+                    scale = rating_scale(column.question)
+                    ratings = values[(values >= 1) & (values <= scale)].astype(np.int64)
+                    histogram = np.bincount(ratings, minlength=scale + 1)[1:]
+                    result["histogram"] = [
+                        {"rating": rating, "count": int(count)}
+                        for rating, count in enumerate(histogram, start=1)
+                    ]
+                result.update(
+                    {
+                        "mean": float(values.mean()) if values.size else None,
+                        "median": float(np.median(values)) if values.size else None,
+                        "stddev": float(values.std()) if values.size else None,
+                        "min": float(values.min()) if values.size else None,
+                        "max": float(values.max()) if values.size else None,
+                    }
+                )
+
+            results.append(result)
+
+        return results
+
+    def crosstab(self, row_key, column_key):
+        """
+        Option x option contingency table of two categorical questions.
+
+        Returns:
+            dict: Row and column labels and `counts[row][column]`
+        """
+        rows = self.column(row_key, CATEGORICAL_KINDS)
+        columns = self.column(column_key, CATEGORICAL_KINDS)
+
+        if rows.codes is not None and columns.codes is not None:
+            valid = (rows.codes >= 0) & (columns.codes >= 0)
+            cells = rows.codes[valid] * len(columns.labels) + columns.codes[valid]
+            counts = np.bincount(cells, minlength=len(rows.labels) * len(columns.labels))
+            counts = counts.reshape(len(rows.labels), len(columns.labels))
+        else:
+            # Checkbox questions pick several options per row, so count co-occurrences
+            # with a matrix product of the indicator matrices.
+            counts = rows.indicator_matrix().T.astype(np.float64) @ columns.indicator_matrix()
+            counts = np.rint(counts).astype(np.int64)
+
+        return {
+            "rows": row_key,
+            "columns": column_key,
+            "row_labels": rows.labels,
+            "column_labels": columns.labels,
+            "counts": counts.tolist(),
+        }
+
+    def numeric_by_category(self, value_key, category_key):
+        """
+        Count, mean and median of a rating/number question per option of a categorical one.
+        """
+        values = self.column(value_key, NUMERIC_KINDS)
+        category = self.column(category_key, CATEGORICAL_KINDS)
+
+        row_indices, codes = category.category_pairs(~np.isnan(values.values))
+        samples = values.values[row_indices]
+        groups = len(category.labels)
+
+        counts = np.bincount(codes, minlength=groups)
+        sums = np.bincount(codes, weights=samples, minlength=groups)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / counts
+
+        # Sort samples by (option, value); each option's median then sits at a
+        # fixed offset inside its contiguous run.
+        ordered = samples[np.lexsort((samples, codes))]
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        medians = np.full(groups, np.nan)
+        present = counts > 0
+        if present.any():
+            low = starts[present] + (counts[present] - 1) // 2
+            high = starts[present] + counts[present] // 2
+            medians[present] = (ordered[low] + ordered[high]) / 2
+
+        return {
+            "value": value_key,
+            "category": category_key,
+            "groups": [
+                {
+                    "option": label,
+                    "count": int(count),
+                    "mean": _float_or_none(mean),
+                    "median": _float_or_none(median),
+                }
+                for label, count, mean, median in zip(category.labels, counts, means, medians)
+            ],
+        }
+
+    def funnel(self):
+        """
+        Completion funnel in question order.
+
+        `reached` counts responses whose last answered question is at or after
+        the step; `answered` counts responses that answered the step itself.
+        """
+        columns = list(self.columns.values())
+        steps = len(columns)
+        if not steps:
+            return {"started": self.size, "completed": int(self.complete.sum()), "steps": []}
+
+        answered = np.column_stack([column.answered for column in columns])
+        any_answered = answered.any(axis=1)
+        last = np.where(any_answered, steps - 1 - np.argmax(answered[:, ::-1], axis=1), -1)
+        reached = np.bincount(last[any_answered], minlength=steps)[::-1].cumsum()[::-1]
+        answered_counts = answered.sum(axis=0)
+
+        funnel_steps = []
+        previous = self.size
+        for column, reached_count, answered_count in zip(columns, reached, answered_counts):
+            funnel_steps.append(
+                {
+                    "key": column.key,
+                    "question": column.question.get("question", ""),
+                    "reached": int(reached_count),
+                    "answered": int(answered_count),
+                    "drop_off": int(previous - reached_count),
+                }
+            )
+            previous = reached_count
+
+        return {
+            "started": self.size,
+            "completed": int(self.complete.sum()),
+            "steps": funnel_steps,
+        }
+
+
+def build_analytics(survey, crosstabs=(), group_by=(), frame=None):
+    """
+    Compute the analytics payload for a survey.
+
+    Args:
+        survey: Survey instance
+        crosstabs: (row key, column key) pairs of categorical questions
+        group_by: Categorical question keys to break every rating/number question down by
+        frame: Preloaded SurveyAnswerFrame (loaded from the database when omitted)
+
+    Returns:
+        dict: summary, funnel, crosstabs and by_category sections
+
+    Raises:
+        ValueError: If a requested question is unknown or of the wrong type
+    """
+    frame = frame or SurveyAnswerFrame.from_survey(survey)
+    for category_key in group_by:
+        frame.column(category_key, CATEGORICAL_KINDS)
+    numeric_keys = [
+        answer_key(question, index)
+        for index, question in enumerate(survey.questions)
+        if question_kind(question) in NUMERIC_KINDS
+    ]
+
+    return {
+        "responses": frame.size,
+        "summary": frame.summary(),
+        "funnel": frame.funnel(),
+        "crosstabs": [frame.crosstab(row_key, column_key) for row_key, column_key in crosstabs],
+        "by_category": [
+            frame.numeric_by_category(value_key, category_key)
+            for category_key in group_by
+            for value_key in numeric_keys
+        ],
+    }
@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class SurveyConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "sc_api.apps.survey"
+
+    def ready(self):
+        from sc_api.apps.survey import signals  # noqa: F401
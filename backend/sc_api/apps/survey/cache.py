@@ -0,0 +1,68 @@
+import uuid
+
+from django.conf import settings
+from django.shortcuts import get_object_or_404
+from sc_api.apps.schema.models import Survey
+from sc_api.apps.survey.serializers import SurveyPublicSerializer
+from sc_api.apps.utils.cache import build_cache
+
+public_survey_cache = build_cache(settings.SURVEY_PUBLIC_CACHE)
+
+
+def _version_key(oid):
+    return f"survey:public:version:{oid}"
+
+
+def _payload_key(oid, version):
+    return f"survey:public:{oid}:{version}"
+
+
+def _current_version(oid):
+    version = public_survey_cache.get(_version_key(oid))
+    if version is None:
+        version = uuid.uuid4().hex
+        public_survey_cache.set(_version_key(oid), version)
+    return version
+
+
+def get_public_survey(oid):
+    """
+    Return the cached public payload of a published survey.
+
+    The entry is stored under the survey's current content version, so a reader
+    racing an invalidation can only ever write to a version nobody reads again.
+    `is_active` is not cached; it is recomputed from the stored schedule on
+    every call so start/end dates take effect without waiting for expiry.
+
+    Args:
+        oid: Survey oid
+
+    Returns:
+        tuple: (public survey data including a fresh `is_active` flag, survey updated_at)
+
+    Raises:
+        Http404: If no published survey exists with this oid
+    """
+    key = _payload_key(oid, _current_version(oid))
+    entry = public_survey_cache.get(key)
+
+    if entry is None:
+        survey = get_object_or_404(Survey.objects.filter(status="published"), oid=oid)
+        payload = dict(SurveyPublicSerializer(survey).data)
+        payload.pop("is_active", None)
+        entry = {
+            "payload": payload,
+            "status": survey.status,
+            "start_date": survey.start_date,
+            "end_date": survey.end_date,
+            "updated_at": survey.updated_at,
+        }
+        public_survey_cache.set(key, entry)
+
+    is_active = Survey.compute_is_active(entry["status"], entry["start_date"], entry["end_date"])
+    return {**entry["payload"], "is_active": is_active}, entry["updated_at"]
+
+
+def invalidate_public_survey(oid):
+    """Move a survey to a new content version so cached payloads are no longer served."""
+    public_survey_cache.set(_version_key(oid), uuid.uuid4().hex)
@@ -0,0 +1,355 @@
+import csv
+import io
+import json
+import os
+import random
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.utils import timezone
+from sc_api.apps.schema.models import (
+    Respondent,
+    Survey,
+    SurveyQuestionStats,
+    SurveyResponse,
+    Team,
+    User,
+)
+from sc_api.apps.survey.purge import purge_respondents, purge_surveys
+from sc_api.apps.survey.questions import (
+    answer_key,
+    question_kind,
+    question_options,
+    rating_scale,
+)
+from sc_api.apps.survey.stats import accumulate
+
+# Covers every question kind, in addition to the surveys in demo_data/survey.json.
+MIXED_SURVEY = {
+    "title": "Customer Onboarding Survey",
+    "description": "How was your first month with the product?",
+    "category": "feedback",
+    "status": "published",
+    "allow_multiple_responses": False,
+    "questions": [
+        {
+            "id": "q1",
+            "type": "radio",
+            "question": "Which plan are you on?",
+            "required": True,
+            "options": ["Free", "Pro", "Team", "Enterprise"],
+        },
+        {
+            "id": "q2",
+            "type": "checkbox",
+            "question": "Which features have you used?",
+            "options": ["Forms", "Reports", "Exports", "API", "Webhooks", "SSO"],
+        },
+        {"id": "q3", "type": "rating", "question": "How easy was setup?", "scale": 5},
+        {"id": "q4", "type": "number", "question": "How many seats do you use?"},
+        {"id": "q5", "type": "date", "question": "When did you start?"},
+        {"id": "q6", "type": "text", "question": "Anything we could do better?"},
+    ],
+    "configs": {"theme": "default", "show_progress": True},
+}
+
+TEXT_ANSWERS = [
+    "Great team collaboration and flexible working hours",
+    "Setup took longer than expected",
+    "Documentation could use more examples",
+    "Works well for our use case",
+    "Support was quick to respond",
+]
+
+DEMO_PASSWORD = "test@123"
+
+
+def load_survey_templates():
+    """Survey definitions from demo_data/survey.json plus MIXED_SURVEY."""
+    with open(os.path.join(settings.RESOURCES_DIR, "demo_data", "survey.json"), "r") as f:
+        return json.load(f) + [MIXED_SURVEY]
+
+
+def answer_sampler(question):
+    """
+    Return `sample(rng)` producing plausible answers for a question's type.
+
+    Options, scales and dates are resolved once, so generating millions of
+    answers only costs the random draws.
+    """
+    kind = question_kind(question)
+    if kind == "choice":
+        options = question_options(question)
+        return lambda rng: rng.choice(options)
+    if kind == "multi_choice":
+        options = question_options(question)
+        return lambda rng: rng.sample(options, rng.randint(1, len(options)))
+    if kind == "rating":
+        scale = rating_scale(question)
+        return lambda rng: rng.randint(1, scale)
+    if kind == "number":
+        return lambda rng: rng.randint(1, 500)
+    if kind == "date":
+        today = timezone.now().date()
+        dates = [(today - timedelta(days=days)).isoformat() for days in range(366)]
+        return lambda rng: rng.choice(dates)
+    if question.get("type") == "email":
+        return lambda rng: f"user{rng.randint(1, 10**6)}@example.com"
+    if question.get("type") == "phone":
+        return lambda rng: f"+1555{rng.randint(0, 10**7 - 1):07d}"
+    return lambda rng: rng.choice(TEXT_ANSWERS)
+
+
+def answer_samplers(questions):
+    """(answer key, sampler) per question, for synthesize_answers."""
+    return [
+        (answer_key(question, index), answer_sampler(question))
+        for index, question in enumerate(questions)
+    ]
+
+
+def synthesize_answers(questions, rng, complete=True, samplers=None):
+    """
+    Answers keyed like frontend submissions (`question_<n>`).
+
+    Incomplete responses stop after a random number of questions. Pass
+    `samplers` from answer_samplers() when generating many responses.
+    """
+    samplers = samplers or answer_samplers(questions)
+    answered = len(samplers) if complete else rng.randint(0, max(len(samplers) - 1, 0))
+    return {key: sample(rng) for key, sample in samplers[:answered]}
+
+
+# Columns written per generated response, in COPY order (attnames).
+RESPONSE_COLUMNS = [
+    "oid",
+    "created_at",
+    "updated_at",
+    "survey_id",
+    "respondent_id",
+    "answers",
+    "is_complete",
+    "completed_at",
+    "enforce_single_response",
+]
+
+
+def _bulk_insert_responses(rows):
+    SurveyResponse.objects.bulk_create(
+        [SurveyResponse(**dict(zip(RESPONSE_COLUMNS, row))) for row in rows]
+    )
+
+
+def _copy_responses(rows):
+    """Stream response rows into PostgreSQL with COPY ... FROM STDIN (CSV)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(json.dumps(value) if isinstance(value, dict) else value for value in row)
+    buffer.seek(0)
+
+    sql = (
+        f"COPY {SurveyResponse._meta.db_table} ({', '.join(RESPONSE_COLUMNS)}) "
+        "FROM STDIN WITH (FORMAT csv)"
+    )
+    with connection.cursor() as cursor:
+        raw_cursor = cursor.cursor
+        if hasattr(raw_cursor, "copy_expert"):  # psycopg2
+            raw_cursor.copy_expert(sql, buffer)
+        else:  # psycopg 3
+            with raw_cursor.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+
+
+def _generate_responses(survey, respondent_ids, rng, now, insert, batch_size):
+    """
+    Insert one survey's responses in batches, one transaction per batch.
+
+    Counters and question stats are accumulated from the generated answers
+    and written once at the end, so no response is read back.
+    """
+    questions = survey.questions
+    samplers = answer_samplers(questions)
+    keys = [key for key, _ in samplers]
+    kinds = [question_kind(question) for question in questions]
+    stats = {key: SurveyQuestionStats(survey=survey, question_key=key) for key in keys}
+    enforce_single_response = not survey.allow_multiple_responses
+    total = complete_count = 0
+    last_response_at = None
+
+    for start in range(0, len(respondent_ids), batch_size):
+        rows = []
+        end = start + batch_size
+        for respondent_id in respondent_ids[start:end]:
+            complete = rng.random() < 0.9
+            answers = synthesize_answers(questions, rng, complete, samplers)
+            created_at = now - timedelta(seconds=rng.randint(0, 90 * 24 * 3600))
+            rows.append(
+                (
+                    uuid.uuid4(),
+                    created_at,
+                    now,
+                    survey.pk,
+                    respondent_id,
+                    answers,
+                    complete,
+                    created_at if complete else None,
+                    enforce_single_response,
+                )
+            )
+            if complete:
+                complete_count += 1
+                for key, kind in zip(keys, kinds):
+                    accumulate(stats[key], kind, answers.get(key))
+            if last_response_at is None or created_at > last_response_at:
+                last_response_at = created_at
+
+        with transaction.atomic():
+            insert(rows)
+        total += len(rows)
+
+    with transaction.atomic():
+        Survey.objects.filter(pk=survey.pk).update(
+            total_responses=total,
+            complete_responses=complete_count,
+            last_response_at=last_response_at,
+        )
+        SurveyQuestionStats.objects.bulk_create(stats.values())
+    return total
+
+
+def generate_demo_data(
+    teams,
+    surveys_per_team,
+    responses_per_survey,
+    prefix="demo",
+    seed=0,
+    batch_size=1000,
+    use_copy=False,
+    progress=None,
+):
+    """
+    Create synthetic teams, owners, surveys and responses with bulk inserts.
+
+    Every team gets one owner and `surveys_per_team` published surveys cycled
+    from the demo templates. The same `responses_per_survey` respondents answer
+    every survey; about 90% of responses are complete. Response counters and
+    question stats are computed while generating, not rebuilt per row.
+
+    Args:
+        teams: Number of teams
+        surveys_per_team: Surveys created in each team
+        responses_per_survey: Responses (and respondents) per survey
+        prefix: Prefix of team names and emails, used by delete_demo_data
+        seed: Random seed, so runs are reproducible
+        batch_size: Rows per INSERT/COPY and per transaction
+        use_copy: Load responses with COPY (PostgreSQL only)
+        progress: Optional callable(survey, responses) called after each survey
+
+    Returns:
+        dict: Created teams, users and surveys, plus respondent and response counts
+
+    Raises:
+        ValueError: If use_copy is set on a database other than PostgreSQL
+    """
+    if use_copy and connection.vendor != "postgresql":
+        raise ValueError("COPY is only supported on PostgreSQL.")
+
+    rng = random.Random(seed)
+    templates = load_survey_templates()
+    password = make_password(DEMO_PASSWORD)
+    now = timezone.now()
+
+    with transaction.atomic():
+        team_objs = Team.objects.bulk_create(
+            [Team(name=f"{prefix}-team-{index}") for index in range(teams)],
+            batch_size=batch_size,
+        )
+        users = User.objects.bulk_create(
+            [
+                User(
+                    email=f"{prefix}-owner-{index}@example.com",
+                    password=password,
+                    first_name="Demo",
+                    last_name=f"Owner {index}",
+                    team=team,
+                    role="admin",
+                )
+                for index, team in enumerate(team_objs)
+            ],
+            batch_size=batch_size,
+        )
+        surveys = Survey.objects.bulk_create(
+            [
+                Survey(
+                    **{key: value for key, value in template.items() if key != "title"},
+                    title=f"{template['title']} #{team_index * surveys_per_team + index + 1}",
+                    created_by=user,
+                    team=team,
+                )
+                for team_index, (team, user) in enumerate(zip(team_objs, users))
+                for index, template in (
+                    (index, templates[index % len(templates)]) for index in range(surveys_per_team)
+                )
+            ],
+            batch_size=batch_size,
+        )
+
+    # Only respondent ids are kept, so millions of respondents fit in memory.
+    respondent_ids = []
+    for start in range(0, responses_per_survey, batch_size):
+        with transaction.atomic():
+            respondents = Respondent.objects.bulk_create(
+                [
+                    Respondent(
+                        email=f"{prefix}-respondent-{index}@example.com",
+                        full_name=f"Respondent {index}",
+                        phone_number=f"+1555{index:07d}",
+                    )
+                    for index in range(start, min(start + batch_size, responses_per_survey))
+                ]
+            )
+        respondent_ids.extend(respondent.pk for respondent in respondents)
+
+    insert = _copy_responses if use_copy else _bulk_insert_responses
+    responses = 0
+    for survey in surveys:
+        created = _generate_responses(survey, respondent_ids, rng, now, insert, batch_size)
+        responses += created
+        if progress:
+            progress(survey, created)
+
+    return {
+        "teams": team_objs,
+        "users": users,
+        "surveys": surveys,
+        "respondents": len(respondent_ids),
+        "responses": responses,
+    }
+
+
+def delete_demo_data(prefix="demo", batch_size=5000, progress=None):
+    """
+    Remove everything generate_demo_data created with this prefix.
+
+    Responses and respondents are purged in batches with set-based deletes;
+    surveys, users and teams go through the ORM so their signals still fire.
+    """
+    teams = Team.objects.filter(name__startswith=f"{prefix}-team-")
+    deleted = {
+        "surveys": purge_surveys(
+            Survey.objects.filter(team__in=teams), batch_size=batch_size, progress=progress
+        ),
+        "respondents": purge_respondents(
+            Respondent.objects.filter(email__startswith=f"{prefix}-respondent-"),
+            batch_size=batch_size,
+        ),
+        "users": User.objects.filter(email__startswith=f"{prefix}-owner-")
+        .delete()[1]
+        .get("schema.User", 0),
+    }
+    deleted["teams"] = teams.delete()[1].get("schema.Team", 0)
+    return deleted
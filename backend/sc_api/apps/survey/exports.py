@@ -0,0 +1,350 @@
+import csv
+import json
+import zlib
+from datetime import datetime, timezone
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from sc_api.apps.schema.models import SurveyResponse
+from sc_api.apps.survey.questions import (
+    answer_key,
+    get_answer,
+    question_kind,
+    question_options,
+)
+from sc_api.apps.utils.database import replica_alias
+
+EXPORT_FORMATS = {
+    "csv": {"content_type": "text/csv", "extension": "csv"},
+    "ndjson": {"content_type": "application/x-ndjson", "extension": "ndjson"},
+}
+
+RESPONSE_COLUMNS = {
+    "response_id": "oid",
+    "submitted_at": "created_at",
+    "completed_at": "completed_at",
+    "is_complete": "is_complete",
+    "respondent_name": "respondent__full_name",
+    "respondent_email": "respondent__email",
+    "respondent_phone": "respondent__phone_number",
+}
+
+# Rows are buffered into chunks of roughly this size before being yielded.
+STREAM_BUFFER_SIZE = 64 * 1024
+
+# Spreadsheets evaluate cells starting with these as formulas (CSV injection).
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _question_header(question, index):
+    return f"{answer_key(question, index)}: {question.get('question', '').strip()}"
+
+
+def build_export_columns(questions):
+    """
+    Flatten a survey's questions into export columns, in question order.
+
+    Checkbox questions are expanded into one 0/1 column per option; every other
+    question maps to a single column.
+
+    Returns:
+        list: (header, getter) pairs where getter(row) reads a values() row
+    """
+    columns = [
+        (header, lambda row, column=column: row[column])
+        for header, column in RESPONSE_COLUMNS.items()
+    ]
+
+    for index, question in enumerate(questions):
+        header = _question_header(question, index)
+
+        if question_kind(question) == "multi_choice":
+            for option in question_options(question):
+
+                def getter(row, question=question, index=index, option=option):
+                    selected = get_answer(row["answers"], question, index) or []
+                    if not isinstance(selected, list):
+                        selected = [selected]
+                    return 1 if option in map(str, selected) else 0
+
+                columns.append((f"{header} [{option}]", getter))
+        else:
+            columns.append(
+                (
+                    header,
+                    lambda row, question=question, index=index: get_answer(
+                        row["answers"], question, index
+                    ),
+                )
+            )
+
+    return columns
+
+
+def iter_response_rows(survey, chunk_size=2000):
+    """
+    Iterate a survey's responses as values() dicts without caching the queryset.
+
+    On PostgreSQL this uses a server-side cursor, so memory stays bounded by
+    `chunk_size` regardless of the number of responses. Rows are read from the
+    replica when one is configured.
+    """
+    return (
+        SurveyResponse.objects.using(replica_alias())
+        .filter(survey=survey)
+        .order_by("created_at", "id")
+        .values("answers", *RESPONSE_COLUMNS.values())
+        .iterator(chunk_size=chunk_size)
+    )
+
+
+class _Echo:
+    """File-like object whose write() returns the value, for use with csv.writer."""
+
+    def write(self, value):
+        return value
+
+
+def _buffered(lines):
+    buffer, size = [], 0
+    for line in lines:
+        buffer.append(line)
+        size += len(line)
+        if size >= STREAM_BUFFER_SIZE:
+            yield "".join(buffer).encode()
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer).encode()
+
+
+def _csv_text(value):
+    """Prefix formula-like text with `'` so spreadsheets show it as text."""
+    return "'" + value if value.startswith(FORMULA_PREFIXES) else value
+
+
+def _csv_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, cls=DjangoJSONEncoder)
+    if isinstance(value, str):
+        return _csv_text(value)
+    return value
+
+
+def stream_csv(survey, chunk_size=2000):
+    columns = build_export_columns(survey.questions)
+    writer = csv.writer(_Echo())
+
+    def lines():
+        yield writer.writerow([header for header, _ in columns])
+        for row in iter_response_rows(survey, chunk_size):
+            yield writer.writerow([_csv_value(getter(row)) for _, getter in columns])
+
+    return _buffered(lines())
+
+
+def stream_ndjson(survey, chunk_size=2000):
+    columns = build_export_columns(survey.questions)
+    encoder = DjangoJSONEncoder()
+
+    def lines():
+        for row in iter_response_rows(survey, chunk_size):
+            yield encoder.encode({header: getter(row) for header, getter in columns}) + "\n"
+
+    return _buffered(lines())
+
+
+def gzip_stream(chunks):
+    """Gzip-compress a stream of byte chunks incrementally."""
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def stream_export(survey, file_format="csv", gzip=False, chunk_size=2000):
+    """
+    Stream a survey's responses as CSV or NDJSON byte chunks.
+
+    Args:
+        survey: Survey instance
+        file_format: "csv" or "ndjson"
+        gzip: Compress the stream with gzip
+        chunk_size: Rows fetched from the database per round trip
+
+    Returns:
+        iterator: Byte chunks
+    """
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {file_format}")
+
+    stream = (stream_csv if file_format == "csv" else stream_ndjson)(survey, chunk_size)
+    return gzip_stream(stream) if gzip else stream
+
+
+def export_filename(survey, file_format, gzip=False):
+    extension = {**EXPORT_FORMATS, **COLUMNAR_FORMATS}[file_format]["extension"]
+    return f"survey-{survey.oid}-responses.{extension}{'.gz' if gzip else ''}"
+
+
+COLUMNAR_FORMATS = {
+    "parquet": {"extension": "parquet"},
+    "arrow": {"extension": "arrow"},
+}
+
+
+def _to_float(value):
+    try:
+        return float(value) if value not in (None, "") and not isinstance(value, bool) else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_int(value):
+    number = _to_float(value)
+    return int(number) if number is not None and number.is_integer() else None
+
+
+def _to_timestamp(value):
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _to_list(value):
+    if value in (None, ""):
+        return None
+    return [str(item) for item in value] if isinstance(value, list) else [str(value)]
+
+
+def _to_string(value):
+    if value is None:
+        return None
+    return value if isinstance(value, str) else json.dumps(value, cls=DjangoJSONEncoder)
+
+
+def build_columnar_schema(questions):
+    """
+    Build an Arrow schema with one typed column per question.
+
+    Ratings are int32, numbers float64, dates UTC timestamps, checkboxes lists of
+    strings and everything else strings. Question columns are named by their
+    answer key; the question text is kept in the field metadata.
+
+    Returns:
+        tuple: (pyarrow.Schema, list of (column name, converter, values getter))
+    """
+    import pyarrow as pa
+
+    timestamp = pa.timestamp("us", tz="UTC")
+    fields = [
+        pa.field("response_id", pa.string()),
+        pa.field("submitted_at", timestamp),
+        pa.field("completed_at", timestamp),
+        pa.field("is_complete", pa.bool_()),
+        pa.field("respondent_name", pa.string()),
+        pa.field("respondent_email", pa.string()),
+        pa.field("respondent_phone", pa.string()),
+    ]
+    columns = [
+        ("response_id", str, lambda row: row["oid"]),
+        ("submitted_at", None, lambda row: row["created_at"]),
+        ("completed_at", None, lambda row: row["completed_at"]),
+        ("is_complete", None, lambda row: row["is_complete"]),
+        ("respondent_name", None, lambda row: row["respondent__full_name"]),
+        ("respondent_email", None, lambda row: row["respondent__email"]),
+        ("respondent_phone", None, lambda row: row["respondent__phone_number"]),
+    ]
+
+    types = {
+        "rating": (pa.int32(), _to_int),
+        "number": (pa.float64(), _to_float),
+        "date": (timestamp, _to_timestamp),
+        "multi_choice": (pa.list_(pa.string()), _to_list),
+    }
+
+    for index, question in enumerate(questions):
+        name = answer_key(question, index)
+        arrow_type, converter = types.get(question_kind(question), (pa.string(), _to_string))
+        fields.append(
+            pa.field(name, arrow_type, metadata={"question": question.get("question", "")})
+        )
+        columns.append(
+            (
+                name,
+                converter,
+                lambda row, question=question, index=index: get_answer(
+                    row["answers"], question, index
+                ),
+            )
+        )
+
+    return pa.schema(fields), columns
+
+
+def write_columnar_export(survey, path, file_format="parquet", batch_size=50000):
+    """
+    Write a survey's responses to a Parquet or Arrow IPC file.
+
+    Rows are read with a server-side cursor and written as bounded row groups
+    (record batches for Arrow), so memory is limited by `batch_size`.
+
+    Args:
+        survey: Survey instance
+        path: Output file path
+        file_format: "parquet" or "arrow"
+        batch_size: Rows per row group / record batch
+
+    Returns:
+        int: Number of rows written
+
+    Raises:
+        ImproperlyConfigured: If pyarrow is not installed
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImproperlyConfigured("Columnar exports require pyarrow (pip install pyarrow).")
+
+    if file_format not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unsupported columnar format: {file_format}")
+
+    schema, columns = build_columnar_schema(survey.questions)
+    if file_format == "parquet":
+        writer = pq.ParquetWriter(path, schema, compression="zstd")
+    else:
+        writer = pa.ipc.new_file(path, schema)
+
+    def flush(data):
+        batch = pa.RecordBatch.from_pydict(data, schema=schema)
+        if file_format == "parquet":
+            writer.write_batch(batch, row_group_size=batch_size)
+        else:
+            writer.write_batch(batch)
+
+    written = 0
+    data = {name: [] for name, _, _ in columns}
+    try:
+        for row in iter_response_rows(survey, chunk_size=min(batch_size, 5000)):
+            for name, converter, getter in columns:
+                value = getter(row)
+                data[name].append(converter(value) if converter else value)
+            written += 1
+            if written % batch_size == 0:
+                flush(data)
+                data = {name: [] for name, _, _ in columns}
+
+        if written % batch_size or not written:
+            flush(data)
+    finally:
+        writer.close()
+
+    return written
@@ -0,0 +1,89 @@
+from django.db.models import BooleanField, Case, F, Value, When
+from django.utils import timezone
+from sc_api.apps.schema.choices import SURVEY_CATEGORY_CHOICES, SURVEY_STATUS_CHOICES
+from sc_api.apps.schema.models import Survey
+
+CATEGORY_LABELS = dict(SURVEY_CATEGORY_CHOICES)
+STATUS_LABELS = dict(SURVEY_STATUS_CHOICES)
+
+# Survey columns selected for the list; the questions/configs JSON is never read.
+# `id` is only used as the pagination tie-breaker.
+LIST_COLUMNS = [
+    "id",
+    "oid",
+    "title",
+    "description",
+    "category",
+    "status",
+    "total_responses",
+    "complete_responses",
+    "last_response_at",
+    "created_at",
+    "updated_at",
+]
+
+
+def _datetime_formatter():
+    """
+    DRF's default ISO 8601 DateTimeField output, with the current timezone
+    resolved once instead of per value.
+    """
+    tz = timezone.get_current_timezone()
+
+    def format_datetime(value):
+        if value is None:
+            return None
+        value = value.astimezone(tz).isoformat()
+        return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+    return format_datetime
+
+
+def survey_list_values(queryset, now=None):
+    """
+    `.values()` rows of the list columns, with the creator's names, the team
+    name and `is_active` resolved in the same query.
+    """
+    return queryset.values(
+        *LIST_COLUMNS,
+        created_by_first_name=F("created_by__first_name"),
+        created_by_last_name=F("created_by__last_name"),
+        team_name=F("team__name"),
+        is_active=Case(
+            When(Survey.is_active_condition(now), then=Value(True)),
+            default=Value(False),
+            output_field=BooleanField(),
+        ),
+    )
+
+
+def survey_list_rows(rows):
+    """
+    Build the survey list payload from survey_list_values() rows, without
+    instantiating models or serializers.
+
+    Produces the same dicts as SurveyListSerializer: display labels come from
+    the choice maps and `created_by_name` mirrors User.get_full_name.
+    """
+    format_datetime = _datetime_formatter()
+    return [
+        {
+            "oid": str(row["oid"]),
+            "title": row["title"],
+            "description": row["description"],
+            "category": row["category"],
+            "category_display": CATEGORY_LABELS.get(row["category"], row["category"]),
+            "status": row["status"],
+            "status_display": STATUS_LABELS.get(row["status"], row["status"]),
+            "created_by_name": f"{row['created_by_first_name']} {row['created_by_last_name']}".strip(),
+            "team_name": row["team_name"],
+            "total_responses": row["total_responses"],
+            "complete_responses": row["complete_responses"],
+            "last_response_at": format_datetime(row["last_response_at"]),
+            "is_active": row["is_active"],
+            "public_url": f"/surveys/{row['oid']}/",
+            "created_at": format_datetime(row["created_at"]),
+            "updated_at": format_datetime(row["updated_at"]),
+        }
+        for row in rows
+    ]
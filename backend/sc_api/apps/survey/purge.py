@@ -0,0 +1,214 @@
+import time
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+from sc_api.apps.schema.models import (
+    OutboundEmail,
+    Survey,
+    SurveyQuestionStats,
+    SurveyResponse,
+)
+from sc_api.apps.survey.stats import rebuild_question_stats
+from sc_api.apps.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_BATCH_SIZE = 5000
+
+
+def delete_in_batches(
+    queryset, delete_batch=None, batch_size=DEFAULT_BATCH_SIZE, sleep=0, progress=None
+):
+    """
+    Delete a queryset in primary key ranges of at most `batch_size` rows.
+
+    Each range is deleted with one set-based DELETE in its own transaction, so
+    no rows are loaded into Python and locks are held briefly. Only use this
+    for models without delete signals or Python-side cascades to honour, or
+    pass a `delete_batch(range_queryset) -> int` that handles them.
+
+    Args:
+        queryset: Rows to delete
+        delete_batch: Deletes one pk-range queryset and returns the rows removed
+        batch_size: Maximum rows per DELETE
+        sleep: Seconds to pause between batches, to leave room for other traffic
+        progress: Optional callable(total_deleted) called after each batch
+
+    Returns:
+        int: Number of rows deleted
+    """
+    delete_batch = delete_batch or _raw_delete
+    queryset = queryset.order_by()
+    deleted = 0
+    last_pk = None
+
+    while True:
+        remaining = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        pks = list(remaining.order_by("pk").values_list("pk", flat=True)[:batch_size])
+        if not pks:
+            return deleted
+
+        with transaction.atomic():
+            deleted += delete_batch(queryset.filter(pk__gte=pks[0], pk__lte=pks[-1]))
+        last_pk = pks[-1]
+
+        if progress:
+            progress(deleted)
+        if sleep:
+            time.sleep(sleep)
+
+
+def _raw_delete(queryset):
+    # A single DELETE statement: no collector, no signals.
+    return queryset._raw_delete(queryset.db)
+
+
+def _delete_response_batch(responses):
+    """Delete a range of responses, their outbound emails, and uncount them."""
+    removed = list(
+        responses.values("survey_id").annotate(
+            total=Count("id"), complete=Count("id", filter=Q(is_complete=True))
+        )
+    )
+    if not removed:
+        return 0
+
+    _raw_delete(OutboundEmail.objects.filter(survey_response__in=responses.values("pk")))
+    deleted = _raw_delete(responses)
+    for row in removed:
+        Survey.decrement_response_counters(row["survey_id"], row["total"], row["complete"])
+    return deleted
+
+
+def purge_responses(responses, batch_size=DEFAULT_BATCH_SIZE, sleep=0, progress=None):
+    """
+    Delete survey responses in bounded batches, keeping survey counters right.
+
+    Confirmation/invitation emails attached to the responses are deleted with
+    them. Question stats are not touched; see purge_expired_responses.
+
+    Returns:
+        int: Number of responses deleted
+    """
+    return delete_in_batches(responses, _delete_response_batch, batch_size, sleep, progress)
+
+
+def purge_respondents(respondents, batch_size=DEFAULT_BATCH_SIZE, sleep=0, progress=None):
+    """Delete respondents in bounded batches, purging their responses first."""
+
+    def delete_batch(batch):
+        purge_responses(SurveyResponse.objects.filter(respondent__in=batch.values("pk")))
+        return _raw_delete(batch)
+
+    return delete_in_batches(respondents, delete_batch, batch_size, sleep, progress)
+
+
+def purge_surveys(surveys, batch_size=DEFAULT_BATCH_SIZE, sleep=0, progress=None):
+    """
+    Delete surveys, purging their responses, stats and emails in batches first.
+
+    The surveys themselves go through the ORM so cache invalidation signals
+    fire; by then nothing is left for the collector to cascade to.
+
+    Returns:
+        int: Number of surveys deleted
+    """
+    survey_ids = list(surveys.values_list("pk", flat=True))
+    if not survey_ids:
+        return 0
+
+    purge_responses(
+        SurveyResponse.objects.filter(survey_id__in=survey_ids), batch_size, sleep, progress
+    )
+    delete_in_batches(OutboundEmail.objects.filter(survey_id__in=survey_ids), batch_size=batch_size)
+    _raw_delete(SurveyQuestionStats.objects.filter(survey_id__in=survey_ids))
+    return Survey.objects.filter(pk__in=survey_ids).delete()[1].get("schema.Survey", 0)
+
+
+def expired_responses(survey, retention_days, now=None):
+    """Responses of a survey created more than `retention_days` ago."""
+    cutoff = (now or timezone.now()) - timedelta(days=retention_days)
+    return SurveyResponse.objects.filter(survey=survey, created_at__lt=cutoff)
+
+
+def parse_retention_days(value):
+    """
+    Validate a `configs["retention_days"]` value.
+
+    Returns:
+        int or None: The window in days, or None when it is unset
+
+    Raises:
+        ValueError: If the value is not a non-negative whole number of days
+    """
+    if value in (None, ""):
+        return None
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    raise ValueError("retention_days must be a non-negative whole number of days.")
+
+
+def survey_retention_days(survey):
+    """
+    Retention window configured on the survey (`configs["retention_days"]`), if any.
+
+    An invalid value is logged and treated as unset, so one bad survey does not
+    abort a purge run.
+    """
+    configs = survey.configs if isinstance(survey.configs, dict) else {}
+    try:
+        return parse_retention_days(configs.get("retention_days"))
+    except ValueError:
+        logger.warning(
+            "purge.invalid_retention_days",
+            survey=survey.oid,
+            value=configs.get("retention_days"),
+        )
+        return None
+
+
+def purge_expired_responses(
+    surveys,
+    retention_days=None,
+    batch_size=DEFAULT_BATCH_SIZE,
+    sleep=0,
+    rebuild_stats=True,
+    progress=None,
+):
+    """
+    Delete responses older than each survey's retention window.
+
+    Args:
+        surveys: Surveys to purge
+        retention_days: Window applied to every survey; when omitted each
+            survey's own `configs["retention_days"]` is used and surveys
+            without one are skipped
+        batch_size: Maximum responses per DELETE
+        sleep: Seconds to pause between batches
+        rebuild_stats: Recompute question stats of surveys that lost responses
+        progress: Optional callable(survey, deleted) called after each batch
+
+    Returns:
+        dict: Survey oid -> number of responses deleted, for surveys that lost any
+    """
+    now = timezone.now()
+    purged = {}
+    for survey in surveys.order_by("pk"):
+        days = retention_days if retention_days is not None else survey_retention_days(survey)
+        if days is None:
+            continue
+
+        def report(total, survey=survey):
+            if progress:
+                progress(survey, total)
+
+        deleted = purge_responses(expired_responses(survey, days, now), batch_size, sleep, report)
+        if deleted:
+            purged[survey.oid] = deleted
+            if rebuild_stats:
+                rebuild_question_stats(survey)
+    return purged
@@ -0,0 +1,68 @@
+CHOICE_QUESTION_TYPES = ("radio", "dropdown")
+MULTI_CHOICE_QUESTION_TYPES = ("checkbox",)
+NUMERIC_QUESTION_TYPES = ("number", "rating")
+TEXT_QUESTION_TYPES = ("text", "textarea", "email", "phone")
+
+DEFAULT_RATING_SCALE = 5
+
+
+def answer_key(question, index):
+    """Key the frontend stores a question's answer under, e.g. `question_3`."""
+    return f"question_{question.get('order') or index + 1}"
+
+
+def answer_keys(question, index):
+    """All keys an answer may be stored under: the frontend key, then the question id."""
+    keys = [answer_key(question, index)]
+    if question.get("id") is not None and str(question["id"]) not in keys:
+        keys.append(str(question["id"]))
+    return keys
+
+
+def get_answer(answers, question, index, default=None):
+    """Look up a question's answer by any of its keys."""
+    for key in answer_keys(question, index):
+        if key in answers:
+            return answers[key]
+    return default
+
+
+def question_kind(question):
+    """
+    Normalize a question type to the kind used for storage and analytics.
+
+    Returns one of "choice", "multi_choice", "rating", "number", "date" or "text".
+    Known types are classified by type alone, since the frontend saves an empty
+    `options` list on every question. An unknown or legacy type (e.g.
+    "multiple_choice" in the demo data) counts as single choice only when it has
+    options.
+    """
+    question_type = question.get("type")
+    if question_type in MULTI_CHOICE_QUESTION_TYPES:
+        return "multi_choice"
+    if question_type in CHOICE_QUESTION_TYPES:
+        return "choice"
+    if question_type in ("rating", "number", "date"):
+        return question_type
+    if question_type in TEXT_QUESTION_TYPES:
+        return "text"
+    options = question.get("options")
+    if isinstance(options, list) and options:
+        return "choice"
+    return "text"
+
+
+def question_options(question):
+    """Options of a choice question as strings, in schema order."""
+    options = question.get("options")
+    if not isinstance(options, list):
+        return []
+    return [str(option) for option in options]
+
+
+def rating_scale(question):
+    """Upper bound of a rating question (1..scale)."""
+    options = question.get("options")
+    if isinstance(options, dict) and options.get("max_rating"):
+        return int(options["max_rating"])
+    return int(question.get("scale") or DEFAULT_RATING_SCALE)
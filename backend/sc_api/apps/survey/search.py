@@ -0,0 +1,55 @@
+from django.db import connections
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+# Created by schema migration 0008 when SQLite ships FTS5 with the trigram tokenizer.
+SQLITE_SEARCH_TABLE = "survey_search"
+SQLITE_SEARCH_TRIGGERS = ("survey_search_ai", "survey_search_ad", "survey_search_au")
+
+# Trigram indexes cannot answer shorter terms.
+MIN_TRIGRAM_LENGTH = 3
+
+_sqlite_search_ready = {}
+
+
+def sqlite_search_ready(using="default"):
+    """
+    Whether the FTS5 survey index and its sync triggers exist on an SQLite database.
+
+    A migration that rebuilds the survey table on SQLite drops the triggers;
+    search then falls back to icontains instead of reading a stale index.
+    """
+    if using not in _sqlite_search_ready:
+        with connections[using].cursor() as cursor:
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE name IN (%s, %s, %s, %s)",
+                [SQLITE_SEARCH_TABLE, *SQLITE_SEARCH_TRIGGERS],
+            )
+            _sqlite_search_ready[using] = len(cursor.fetchall()) == 4
+    return _sqlite_search_ready[using]
+
+
+def search_surveys(queryset, term):
+    """
+    Filter surveys whose title or description contains `term` (case-insensitive).
+
+    PostgreSQL answers the icontains filter from the pg_trgm GIN indexes on
+    UPPER(title) and UPPER(description); SQLite uses the FTS5 trigram table.
+    Other databases, and terms shorter than a trigram, scan with icontains.
+    """
+    term = term.strip()
+    if not term:
+        return queryset
+
+    vendor = connections[queryset.db].vendor
+    if vendor == "sqlite" and len(term) >= MIN_TRIGRAM_LENGTH and sqlite_search_ready(queryset.db):
+        # A quoted FTS5 string is a phrase; with the trigram tokenizer that is a substring match.
+        phrase = '"{}"'.format(term.replace('"', '""'))
+        return queryset.filter(
+            id__in=RawSQL(
+                f"SELECT rowid FROM {SQLITE_SEARCH_TABLE} WHERE {SQLITE_SEARCH_TABLE} MATCH %s",
+                [phrase],
+            )
+        )
+
+    return queryset.filter(Q(title__icontains=term) | Q(description__icontains=term))
@@ -1,6 +1,8 @@
 from django.utils import timezone
 from rest_framework import serializers
+from sc_api.apps.schema.choices import QUESTION_TYPE_CHOICES
 from sc_api.apps.schema.models import Survey
+from sc_api.apps.survey.purge import parse_retention_days
 
 
 class SurveyListSerializer(serializers.ModelSerializer):
@@ -23,6 +25,8 @@ class SurveyListSerializer(serializers.ModelSerializer):
             "created_by_name",
             "team_name",
             "total_responses",
+            "complete_responses",
+            "last_response_at",
             "is_active",
             "public_url",
             "created_at",
@@ -57,6 +61,8 @@ class SurveyDetailSerializer(serializers.ModelSerializer):
             "team",
             "team_name",
             "total_responses",
+            "complete_responses",
+            "last_response_at",
             "is_active",
             "public_url",
             "edit_url",
@@ -109,18 +115,7 @@ class SurveyCreateUpdateSerializer(serializers.ModelSerializer):
             if "type" not in question:
                 raise serializers.ValidationError(f"Question {i} must have a type.")
 
-            valid_types = [
-                "text",
-                "textarea",
-                "number",
-                "email",
-                "phone",
-                "date",
-                "radio",
-                "checkbox",
-                "dropdown",
-                "rating",
-            ]
+            valid_types = [value for value, _ in QUESTION_TYPE_CHOICES]
             if question["type"] not in valid_types:
                 raise serializers.ValidationError(f"Question {i} has invalid type.")
 
@@ -141,6 +136,17 @@ class SurveyCreateUpdateSerializer(serializers.ModelSerializer):
 
         return value
 
+    def validate_configs(self, value):
+        if not isinstance(value, dict):
+            raise serializers.ValidationError("Configs must be an object.")
+
+        try:
+            parse_retention_days(value.get("retention_days"))
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
+
+        return value
+
     def validate_start_date(self, value):
         if value:
             if timezone.is_naive(value):
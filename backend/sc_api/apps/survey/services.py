@@ -0,0 +1,161 @@
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from sc_api.apps.schema.models import Respondent, Survey, SurveyResponse
+from sc_api.apps.survey.stats import record_response_stats
+from sc_api.apps.utils.email import queue_submission_confirmation_email
+
+
+class DuplicateSubmissionError(Exception):
+    """Raised when a respondent already completed a survey that allows a single response."""
+
+    def __init__(self, existing_response):
+        super().__init__("You have already submitted a response to this survey.")
+        self.existing_response = existing_response
+
+
+def get_view_submission_url(survey_response):
+    return f"{settings.FRONTEND_BASE_URL}/surveys/submission/{survey_response.oid}/view"
+
+
+def upsert_respondent(email, full_name, phone_number):
+    """
+    Insert or update a respondent by email in a single INSERT ... ON CONFLICT.
+
+    Only `id`, `email`, `full_name` and `phone_number` of the returned instance
+    reflect the stored row; `oid` and `created_at` are those of the attempted
+    insert.
+    """
+    respondent = Respondent(email=email, full_name=full_name, phone_number=phone_number)
+    Respondent.objects.bulk_create(
+        [respondent],
+        update_conflicts=True,
+        unique_fields=["email"],
+        update_fields=["full_name", "phone_number", "updated_at"],
+    )
+    return respondent
+
+
+def submit_survey_response(survey, respondent_info, answers):
+    """
+    Record a completed survey response atomically.
+
+    The respondent is upserted, the response inserted and the survey's
+    response counters and question stats updated in one transaction.
+    For surveys that do not allow multiple responses, uniqueness is enforced
+    by the `unique_complete_response_per_respondent` constraint instead of a
+    pre-check, so concurrent double submits cannot both succeed.
+
+    Args:
+        survey: Published Survey instance
+        respondent_info: dict with full_name, email and phone
+        answers: dict of answers keyed by question
+
+    Returns:
+        SurveyResponse: The created response
+
+    Raises:
+        DuplicateSubmissionError: If the respondent already completed this survey
+    """
+    with transaction.atomic():
+        respondent = upsert_respondent(
+            email=respondent_info["email"],
+            full_name=respondent_info["full_name"],
+            phone_number=respondent_info["phone"],
+        )
+
+        single_response = not survey.allow_multiple_responses
+        try:
+            # Only the single-response constraint can fail here, so the savepoint
+            # needed to recover from it is skipped for multi-response surveys.
+            with transaction.atomic(savepoint=single_response):
+                survey_response = SurveyResponse.objects.create(
+                    survey=survey,
+                    respondent=respondent,
+                    answers=answers,
+                    is_complete=True,
+                    enforce_single_response=single_response,
+                )
+        except IntegrityError:
+            if not single_response:
+                raise
+            existing_response = SurveyResponse.objects.filter(
+                survey=survey, respondent=respondent, is_complete=True
+            ).first()
+            if existing_response is None:
+                raise
+            raise DuplicateSubmissionError(existing_response)
+
+        queue_submission_confirmation_email(
+            survey_response=survey_response,
+            view_submission_url=get_view_submission_url(survey_response),
+        )
+
+        # Every submission to the survey updates these rows, which stay locked
+        # until commit; doing it last keeps concurrent submissions waiting for
+        # the shortest time.
+        Survey.increment_response_counters(
+            survey.id, survey_response.is_complete, survey_response.created_at
+        )
+        record_response_stats(survey, answers)
+
+    return survey_response
+
+
+def response_counter_expressions():
+    """Survey.update() expressions recomputing the response counters from the responses table."""
+    responses = SurveyResponse.objects.filter(survey=OuterRef("pk")).order_by().values("survey")
+    return {
+        "total_responses": Coalesce(Subquery(responses.annotate(n=Count("pk")).values("n")), 0),
+        "complete_responses": Coalesce(
+            Subquery(responses.filter(is_complete=True).annotate(n=Count("pk")).values("n")), 0
+        ),
+        "last_response_at": Subquery(responses.annotate(last=Max("created_at")).values("last")),
+    }
+
+
+def reconcile_response_counters(surveys=None, batch_size=500):
+    """
+    Recompute the denormalized response counters of surveys that drifted.
+
+    Drift is detected by comparing the stored counters with the recomputed
+    values; only drifted surveys are rewritten, each batch in one UPDATE.
+
+    Args:
+        surveys: Survey queryset to check (all surveys when omitted)
+        batch_size: Surveys rewritten per UPDATE
+
+    Returns:
+        int: Number of surveys whose counters were corrected
+    """
+    surveys = Survey.objects.all() if surveys is None else surveys
+    expressions = response_counter_expressions()
+    rows = (
+        surveys.order_by()
+        .annotate(
+            actual_total=expressions["total_responses"],
+            actual_complete=expressions["complete_responses"],
+            actual_last=expressions["last_response_at"],
+        )
+        .values_list(
+            "pk",
+            "total_responses",
+            "complete_responses",
+            "last_response_at",
+            "actual_total",
+            "actual_complete",
+            "actual_last",
+        )
+    )
+
+    drifted = [
+        pk
+        for pk, total, complete, last, actual_total, actual_complete, actual_last in rows.iterator()
+        if (total, complete, last) != (actual_total, actual_complete, actual_last)
+    ]
+    for start in range(0, len(drifted), batch_size):
+        end = start + batch_size
+        Survey.objects.filter(pk__in=drifted[start:end]).update(**expressions)
+
+    return len(drifted)
@@ -0,0 +1,43 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from sc_api.apps.schema.models import Survey, SurveyResponse
+from sc_api.apps.survey.cache import invalidate_public_survey
+
+
+@receiver(post_save, sender=Survey)
+@receiver(post_delete, sender=Survey)
+def invalidate_survey_caches(sender, instance, using, **kwargs):
+    # Bumping the version before commit would let a concurrent reader cache the
+    # still-visible old row under the new version, so wait for the commit.
+    transaction.on_commit(partial(invalidate_public_survey, instance.oid), using=using)
+
+
+@receiver(pre_save, sender=Survey)
+def track_single_response_setting(sender, instance, using, update_fields=None, **kwargs):
+    instance._single_response_changed = False
+    if instance._state.adding or (
+        update_fields is not None and "allow_multiple_responses" not in update_fields
+    ):
+        return
+    stored = (
+        sender.objects.using(using)
+        .filter(pk=instance.pk)
+        .values_list("allow_multiple_responses", flat=True)
+        .first()
+    )
+    instance._single_response_changed = (
+        stored is not None and stored != instance.allow_multiple_responses
+    )
+
+
+@receiver(post_save, sender=Survey)
+def sync_single_response_flags(sender, instance, using, **kwargs):
+    # The unique constraint only sees flagged responses, so re-flag them whenever
+    # allow_multiple_responses is switched.
+    if getattr(instance, "_single_response_changed", False):
+        SurveyResponse.sync_single_response_flags(
+            sender.objects.using(using).filter(pk=instance.pk)
+        )
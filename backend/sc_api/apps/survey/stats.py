@@ -0,0 +1,197 @@
+import math
+
+from django.db import transaction
+from sc_api.apps.schema.models import SurveyQuestionStats, SurveyResponse
+from sc_api.apps.survey.questions import (
+    answer_key,
+    get_answer,
+    question_kind,
+    question_options,
+    rating_scale,
+)
+
+STATS_FIELDS = [
+    "answer_count",
+    "option_counts",
+    "numeric_count",
+    "numeric_sum",
+    "numeric_sumsq",
+    "numeric_min",
+    "numeric_max",
+    "updated_at",
+]
+
+
+def _to_number(value):
+    if isinstance(value, bool):
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+def _is_answered(value):
+    return not (value is None or value == "" or value == [])
+
+
+def accumulate(stats, kind, value):
+    """Add one answer to a SurveyQuestionStats row (in memory)."""
+    if not _is_answered(value):
+        return
+
+    stats.answer_count += 1
+
+    if kind == "choice":
+        stats.option_counts[str(value)] = stats.option_counts.get(str(value), 0) + 1
+    elif kind == "multi_choice":
+        for option in value if isinstance(value, list) else [value]:
+            stats.option_counts[str(option)] = stats.option_counts.get(str(option), 0) + 1
+    elif kind in ("rating", "number"):
+        number = _to_number(value)
+        if number is None:
+            return
+        if kind == "rating":
+            bucket = str(int(number))
+            stats.option_counts[bucket] = stats.option_counts.get(bucket, 0) + 1
+        stats.numeric_count += 1
+        stats.numeric_sum += number
+        stats.numeric_sumsq += number * number
+        stats.numeric_min = number if stats.numeric_min is None else min(stats.numeric_min, number)
+        stats.numeric_max = number if stats.numeric_max is None else max(stats.numeric_max, number)
+
+
+def _locked_stats(survey, keys):
+    # Locks are taken in question_key order, so concurrent submissions touching
+    # overlapping questions queue up instead of deadlocking.
+    rows = (
+        SurveyQuestionStats.objects.select_for_update()
+        .filter(survey=survey, question_key__in=keys)
+        .order_by("question_key")
+    )
+    stats = {row.question_key: row for row in rows}
+
+    missing = [key for key in keys if key not in stats]
+    if missing:
+        SurveyQuestionStats.objects.bulk_create(
+            [SurveyQuestionStats(survey=survey, question_key=key) for key in missing],
+            ignore_conflicts=True,
+        )
+        rows = (
+            SurveyQuestionStats.objects.select_for_update()
+            .filter(survey=survey, question_key__in=missing)
+            .order_by("question_key")
+        )
+        stats.update({row.question_key: row for row in rows})
+
+    return stats
+
+
+def record_response_stats(survey, answers):
+    """
+    Fold one completed response into the survey's question stats.
+
+    Must run inside the submission transaction, as late as possible: only the
+    stats rows of answered questions are locked, and they stay locked until
+    the transaction commits. Concurrent submissions answering the same
+    questions apply their increments one after the other; unanswered
+    questions are not touched.
+    """
+    answered = []
+    for index, question in enumerate(survey.questions):
+        value = get_answer(answers, question, index)
+        if _is_answered(value):
+            answered.append((answer_key(question, index), question_kind(question), value))
+    if not answered:
+        return
+
+    stats = _locked_stats(survey, sorted({key for key, _, _ in answered}))
+    for key, kind, value in answered:
+        accumulate(stats[key], kind, value)
+
+    SurveyQuestionStats.objects.bulk_update(list(stats.values()), STATS_FIELDS)
+
+
+def rebuild_question_stats(survey, chunk_size=2000):
+    """
+    Recompute a survey's question stats from all of its completed responses.
+
+    The existing stats rows are locked for the duration of the scan, so
+    submissions arriving meanwhile wait and are applied on top of the rebuilt
+    totals.
+
+    Returns:
+        int: Number of responses scanned
+    """
+    questions = survey.questions
+    keys = [answer_key(question, index) for index, question in enumerate(questions)]
+    kinds = [question_kind(question) for question in questions]
+    stats = {key: SurveyQuestionStats(survey=survey, question_key=key) for key in keys}
+
+    with transaction.atomic():
+        list(SurveyQuestionStats.objects.select_for_update().filter(survey=survey))
+
+        scanned = 0
+        answers_iter = (
+            SurveyResponse.objects.filter(survey=survey, is_complete=True)
+            .values_list("answers", flat=True)
+            .iterator(chunk_size=chunk_size)
+        )
+        for answers in answers_iter:
+            for index, question in enumerate(questions):
+                accumulate(stats[keys[index]], kinds[index], get_answer(answers, question, index))
+            scanned += 1
+
+        SurveyQuestionStats.objects.filter(survey=survey).delete()
+        SurveyQuestionStats.objects.bulk_create(stats.values())
+
+    return scanned
+
+
+def build_results(survey):
+    """
+    Build per-question results from the stats rows, in question order.
+
+    Cost is O(questions): one query for the stats rows, no response scans.
+    """
+    stats = {row.question_key: row for row in survey.question_stats.all()}
+    results = []
+
+    for index, question in enumerate(survey.questions):
+        key = answer_key(question, index)
+        kind = question_kind(question)
+        row = stats.get(key) or SurveyQuestionStats(survey=survey, question_key=key)
+        result = {
+            "key": key,
+            "question": question.get("question", ""),
+            "type": question.get("type"),
+            "answer_count": row.answer_count,
+        }
+
+        if kind in ("choice", "multi_choice"):
+            result["options"] = [
+                {"option": option, "count": row.option_counts.get(option, 0)}
+                for option in question_options(question)
+            ]
+        if kind == "rating":
+            result["histogram"] = [
+                {"rating": rating, "count": row.option_counts.get(str(rating), 0)}
+                for rating in range(1, rating_scale(question) + 1)
+            ]
+        if kind in ("rating", "number"):
+            count = row.numeric_count
+            mean = row.numeric_sum / count if count else None
+            variance = max(row.numeric_sumsq / count - mean * mean, 0) if count else None
+            result.update(
+                {
+                    "mean": mean,
+                    "stddev": math.sqrt(variance) if variance is not None else None,
+                    "min": row.numeric_min,
+                    "max": row.numeric_max,
+                }
+            )
+
+        results.append(result)
+
+    return results
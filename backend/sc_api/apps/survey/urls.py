@@ -1,9 +1,14 @@
 from django.urls import path
 from sc_api.apps.survey.views import (
+    SurveyAnalyticsView,
     SurveyDetailView,
+    SurveyExportView,
+    SurveyInviteStatusView,
     SurveyListCreateView,
     SurveyPublicView,
     SurveyPublishView,
+    SurveyResponseListView,
+    SurveyResultsView,
     SurveySendInvitesView,
     SurveySubmissionCheckView,
     SurveySubmissionView,
@@ -14,8 +19,17 @@ urlpatterns = [
     path("", SurveyListCreateView.as_view(), name="survey_list_create"),
     path("<str:oid>/", SurveyDetailView.as_view(), name="survey_detail"),
     path("<str:oid>/publish/", SurveyPublishView.as_view(), name="survey_publish"),
+    path("<str:oid>/responses/", SurveyResponseListView.as_view(), name="survey_responses"),
+    path("<str:oid>/results/", SurveyResultsView.as_view(), name="survey_results"),
+    path("<str:oid>/analytics/", SurveyAnalyticsView.as_view(), name="survey_analytics"),
+    path("<str:oid>/export/", SurveyExportView.as_view(), name="survey_export"),
     path("<str:oid>/fill/", SurveyPublicView.as_view(), name="survey_public"),
     path("<str:oid>/send-invites/", SurveySendInvitesView.as_view(), name="survey_send_invites"),
+    path(
+        "<str:oid>/invites/<uuid:batch_id>/",
+        SurveyInviteStatusView.as_view(),
+        name="survey_invite_status",
+    ),
     path(
         "<str:oid>/check-submission/", SurveySubmissionCheckView.as_view(), name="check_submission"
     ),
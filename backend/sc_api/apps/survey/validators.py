@@ -0,0 +1,212 @@
+import math
+import re
+from datetime import date, datetime
+
+from django.conf import settings
+from sc_api.apps.survey.questions import (
+    answer_keys,
+    question_kind,
+    question_options,
+    rating_scale,
+)
+from sc_api.apps.utils.cache import LocalLRUCache
+
+EMAIL_PATTERN = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
+PHONE_PATTERN = re.compile(r"^[0-9+()\-.\s]{3,30}$")
+
+# Compiled validators hold closures, so they stay in-process regardless of the
+# configured cache backend.
+_compiled_validators = LocalLRUCache(max_entries=512, timeout=None)
+
+
+class AnswerValidationError(Exception):
+    """Raised when submitted answers do not match the survey's questions."""
+
+    def __init__(self, errors):
+        super().__init__("Some answers are invalid.")
+        self.errors = errors
+
+
+def _is_blank(value):
+    return value is None or value == "" or value == []
+
+
+def _text(max_length):
+    def check(value):
+        if not isinstance(value, str):
+            raise ValueError("Must be text.")
+        if len(value) > max_length:
+            raise ValueError(f"Must be at most {max_length} characters.")
+        return value
+
+    return check
+
+
+def _pattern(pattern, message):
+    def check(value):
+        if not isinstance(value, str) or not pattern.match(value):
+            raise ValueError(message)
+        return value
+
+    return check
+
+
+def _number(value):
+    if isinstance(value, bool):
+        raise ValueError("Must be a number.")
+    try:
+        number = float(value if isinstance(value, (int, float)) else str(value).strip())
+    except (OverflowError, ValueError):
+        raise ValueError("Must be a number.")
+    if not math.isfinite(number):
+        raise ValueError("Must be a finite number.")
+    if isinstance(value, int):
+        return value
+    return int(number) if number.is_integer() else number
+
+
+def _rating(scale):
+    def check(value):
+        rating = _number(value)
+        if rating != int(rating) or not 1 <= rating <= scale:
+            raise ValueError(f"Must be a whole number from 1 to {scale}.")
+        return int(rating)
+
+    return check
+
+
+def _date(value):
+    if not isinstance(value, str):
+        raise ValueError("Must be a date.")
+    try:
+        if len(value) == 10:
+            date.fromisoformat(value)
+        else:
+            datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError("Must be an ISO date (YYYY-MM-DD).")
+    return value
+
+
+def _choice(options):
+    def check(value):
+        if str(value) not in options:
+            raise ValueError("Must be one of the question's options.")
+        return str(value)
+
+    return check
+
+
+def _multi_choice(options):
+    def check(value):
+        if not isinstance(value, list):
+            raise ValueError("Must be a list of options.")
+        selected = [str(item) for item in value]
+        if len(set(selected)) != len(selected):
+            raise ValueError("Options must not repeat.")
+        if not options.issuperset(selected):
+            raise ValueError("Must only contain the question's options.")
+        return selected
+
+    return check
+
+
+def _compile_checker(question, max_text_length):
+    kind = question_kind(question)
+    question_type = question.get("type")
+
+    if kind == "multi_choice":
+        return _multi_choice(frozenset(question_options(question)))
+    if kind == "choice":
+        return _choice(frozenset(question_options(question)))
+    if kind == "rating":
+        return _rating(rating_scale(question))
+    if kind == "number":
+        return _number
+    if kind == "date":
+        return _date
+    if question_type == "email":
+        return _pattern(EMAIL_PATTERN, "Must be a valid email address.")
+    if question_type == "phone":
+        return _pattern(PHONE_PATTERN, "Must be a valid phone number.")
+    return _text(max_text_length)
+
+
+class CompiledSurveyValidator:
+    """
+    Answer validator for one version of a survey's questions.
+
+    Option sets, rating bounds and type coercers are built once at compile
+    time, so validating a submission is a single pass over its answers.
+    """
+
+    def __init__(self, questions, max_text_length):
+        self.checkers = {}
+        self.canonical_keys = {}
+        self.required = {}
+
+        for index, question in enumerate(questions):
+            keys = answer_keys(question, index)
+            checker = _compile_checker(question, max_text_length)
+            for key in keys:
+                self.checkers[key] = checker
+                self.canonical_keys[key] = keys[0]
+            if question.get("required"):
+                self.required[keys[0]] = question.get("question", keys[0])
+
+    def validate(self, answers):
+        """
+        Validate and coerce submitted answers.
+
+        Args:
+            answers: dict of answers keyed by `question_<n>` or question id
+
+        Returns:
+            dict: Coerced answers keyed by `question_<n>`
+
+        Raises:
+            AnswerValidationError: With a per-key error mapping
+        """
+        if not isinstance(answers, dict):
+            raise AnswerValidationError({"responses": "Must be an object."})
+
+        cleaned = {}
+        errors = {}
+
+        for key, value in answers.items():
+            checker = self.checkers.get(key)
+            if checker is None:
+                errors[key] = "Unknown question."
+                continue
+            if _is_blank(value):
+                continue
+            try:
+                cleaned[self.canonical_keys[key]] = checker(value)
+            except ValueError as e:
+                errors[key] = str(e)
+
+        for key, title in self.required.items():
+            if key not in cleaned and key not in errors:
+                errors[key] = f"{title} is required."
+
+        if errors:
+            raise AnswerValidationError(errors)
+
+        return cleaned
+
+
+def get_survey_validator(survey):
+    """
+    Return the compiled validator for the survey's current questions.
+
+    Compiled validators are cached per survey oid and `updated_at`, so an edit
+    to the questions compiles a new one on the next submission.
+    """
+    key = (survey.oid, survey.updated_at)
+    validator = _compiled_validators.get(key)
+    if validator is None:
+        validator = CompiledSurveyValidator(
+            survey.questions, settings.SURVEY_SUBMISSION["MAX_TEXT_LENGTH"]
+        )
+        _compiled_validators.set(key, validator)
+    return validator
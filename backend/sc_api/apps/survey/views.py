@@ -1,48 +1,112 @@
 import re
 
 from django.conf import settings
-from django.db.models import Count
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.dateparse import parse_datetime
 from rest_framework import status
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from sc_api.apps.schema.models import Respondent, Survey, SurveyResponse
+from sc_api.apps.schema.choices import EMAIL_STATUS_CHOICES
+from sc_api.apps.schema.models import OutboundEmail, Respondent, Survey, SurveyResponse
+from sc_api.apps.survey.analytics import build_analytics
+from sc_api.apps.survey.cache import get_public_survey
+from sc_api.apps.survey.exports import EXPORT_FORMATS, export_filename, stream_export
+from sc_api.apps.survey.listing import (
+    CATEGORY_LABELS,
+    STATUS_LABELS,
+    survey_list_rows,
+    survey_list_values,
+)
+from sc_api.apps.survey.search import search_surveys
 from sc_api.apps.survey.serializers import (
     SurveyCreateUpdateSerializer,
     SurveyDetailSerializer,
-    SurveyListSerializer,
-    SurveyPublicSerializer,
+)
+from sc_api.apps.survey.services import (
+    DuplicateSubmissionError,
+    get_view_submission_url,
+    submit_survey_response,
+)
+from sc_api.apps.survey.stats import build_results
+from sc_api.apps.survey.validators import AnswerValidationError, get_survey_validator
+from sc_api.apps.utils.conditional import (
+    make_etag,
+    not_modified_response,
+    set_validators,
 )
 from sc_api.apps.utils.email import (
-    send_submission_confirmation_email,
-    send_survey_emails,
+    queue_survey_emails,
 )
+from sc_api.apps.utils.log import get_logger
+from sc_api.apps.utils.pagination import KeysetPaginator
+
+logger = get_logger(__name__)
 
 
 class SurveyListCreateView(APIView):
     permission_classes = [IsAuthenticated]
+    paginator = KeysetPaginator(field="created_at", page_size=50, max_page_size=500)
+
+    # Query parameter -> accepted values of the comma-separated status/category filters.
+    choice_filters = {"status": STATUS_LABELS, "category": CATEGORY_LABELS}
+
+    def get_queryset(self, team, params):
+        queryset = Survey.objects.filter(team=team)
+
+        for param, choices in self.choice_filters.items():
+            values = [value.strip() for value in params.get(param, "").split(",") if value.strip()]
+            if not values:
+                continue
+            unknown = [value for value in values if value not in choices]
+            if unknown:
+                raise ValueError(f"Unknown {param}: {', '.join(unknown)}")
+            queryset = queryset.filter(**{f"{param}__in": values})
+
+        for param, lookup in (
+            ("created_after", "created_at__gte"),
+            ("created_before", "created_at__lt"),
+        ):
+            if params.get(param):
+                value = parse_datetime(params[param])
+                if value is None:
+                    raise ValueError(f"{param} must be an ISO 8601 datetime.")
+                queryset = queryset.filter(**{lookup: value})
+
+        if params.get("is_active") in ("true", "false"):
+            condition = Survey.is_active_condition()
+            if params["is_active"] == "true":
+                queryset = queryset.filter(condition)
+            else:
+                queryset = queryset.exclude(condition)
+
+        if params.get("search"):
+            queryset = search_surveys(queryset, params["search"])
+
+        return queryset
 
     def get(self, request):
         try:
-            queryset = (
-                Survey.objects.filter(team=request.user.team)
-                .select_related("created_by", "team")
-                .annotate(total_responses=Count("responses"))
-                .order_by("-created_at")
+            params = request.query_params
+            queryset = survey_list_values(self.get_queryset(request.user.team, params))
+            rows, next_cursor = self.paginator.paginate(
+                queryset, params.get("cursor"), params.get("page_size")
             )
 
-            serializer = SurveyListSerializer(queryset, many=True)
-
             return Response(
                 {
                     "success": True,
                     "data": {
-                        "surveys": serializer.data,
+                        "surveys": survey_list_rows(rows),
+                        "next_cursor": next_cursor,
+                        "has_more": next_cursor is not None,
                     },
                 }
             )
 
+        except ValueError as e:
+            return Response({"success": False, "error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             return Response(
                 {"success": False, "error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -80,19 +144,35 @@ class SurveyDetailView(APIView):
 
     def get_object(self, oid, user):
         return get_object_or_404(
-            Survey.objects.select_related("created_by", "team").annotate(
-                total_responses=Count("responses")
-            ),
+            Survey.objects.select_related("created_by", "team"),
             oid=oid,
             team=user.team,
         )
 
+    def get_validators(self, survey):
+        etag = make_etag(
+            survey.oid,
+            survey.updated_at.isoformat(),
+            survey.total_responses,
+            survey.complete_responses,
+        )
+        last_modified = max(filter(None, (survey.updated_at, survey.last_response_at)))
+        return etag, last_modified
+
     def get(self, request, oid):
         try:
+            # Response counters are stored on the survey row, so the validators
+            # come from the same single query as the payload.
             survey = self.get_object(oid, request.user)
-            serializer = SurveyDetailSerializer(survey)
+            etag, last_modified = self.get_validators(survey)
+            not_modified = not_modified_response(request, etag, last_modified)
+            if not_modified:
+                return not_modified
 
-            return Response({"success": True, "data": serializer.data})
+            serializer = SurveyDetailSerializer(survey)
+            return set_validators(
+                Response({"success": True, "data": serializer.data}), etag, last_modified
+            )
 
         except Exception as e:
             return Response({"success": False, "error": str(e)}, status=status.HTTP_404_NOT_FOUND)
@@ -169,16 +249,22 @@ class SurveyPublicView(APIView):
 
     def get(self, request, oid):
         try:
-            survey = get_object_or_404(Survey.objects.filter(status="published"), oid=oid)
+            data, updated_at = get_public_survey(oid)
 
-            if not survey.is_active:
+            if not data["is_active"]:
                 return Response(
                     {"success": False, "error": "This survey is not currently active."},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            serializer = SurveyPublicSerializer(survey)
-            return Response({"success": True, "data": serializer.data})
+            etag = make_etag(data["oid"], updated_at.isoformat())
+            not_modified = not_modified_response(request, etag, updated_at)
+            if not_modified:
+                return not_modified
+
+            return set_validators(
+                Response({"success": True, "data": data}), etag, updated_at, "public, no-cache"
+            )
 
         except Exception:
             return Response(
@@ -223,99 +309,51 @@ class SurveyPublicView(APIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            respondent, created = Respondent.objects.get_or_create(
-                email=respondent_info.get("email"),
-                defaults={
-                    "full_name": respondent_info.get("full_name"),
-                    "phone_number": respondent_info.get("phone"),
-                },
-            )
-
-            existing_response = SurveyResponse.objects.filter(
-                survey=survey, respondent=respondent, is_complete=True
-            ).first()
-
-            if existing_response:
-                view_submission_url = (
-                    f"{settings.FRONTEND_BASE_URL}/surveys/submission/{existing_response.oid}/view"
+            try:
+                responses = get_survey_validator(survey).validate(responses)
+            except AnswerValidationError as e:
+                return Response(
+                    {"success": False, "error": str(e), "errors": e.errors},
+                    status=status.HTTP_400_BAD_REQUEST,
                 )
+
+            try:
+                survey_response = submit_survey_response(survey, respondent_info, responses)
+            except DuplicateSubmissionError as e:
+                existing_response = e.existing_response
                 return Response(
                     {
                         "success": False,
-                        "error": "You have already submitted a response to this survey.",
+                        "error": str(e),
                         "data": {
                             "already_submitted": True,
                             "response_id": existing_response.oid,
-                            "view_submission_url": view_submission_url,
+                            "view_submission_url": get_view_submission_url(existing_response),
                             "submitted_at": existing_response.created_at,
                         },
                     },
                     status=status.HTTP_409_CONFLICT,
                 )
 
-            if not created:
-                updated = False
-                if respondent.full_name != respondent_info.get("full_name"):
-                    respondent.full_name = respondent_info.get("full_name")
-                    updated = True
-                if respondent.phone_number != respondent_info.get("phone"):
-                    respondent.phone_number = respondent_info.get("phone")
-                    updated = True
-                if updated:
-                    respondent.save()
-
-            survey_response = SurveyResponse.objects.create(
-                survey=survey,
-                respondent=respondent,
-                answers=responses,
-                is_complete=True,
-            )
-
-            view_submission_url = (
-                f"{settings.FRONTEND_BASE_URL}/surveys/submission/{survey_response.oid}/view"
-            )
-
-            try:
-                email_result = send_submission_confirmation_email(
-                    survey_response=survey_response, view_submission_url=view_submission_url
-                )
-
-                if email_result["success"]:
-                    print(
-                        f"Confirmation email sent successfully to {survey_response.respondent.email}"
-                    )
-                else:
-                    print(f"Failed to send confirmation email: {email_result['error']}")
-
-            except Exception as email_error:
-                print(f"Error sending confirmation email: {str(email_error)}")
-
             return Response(
                 {
                     "success": True,
-                    "message": "Thank you for your response! A confirmation email has been sent to you.",
+                    "message": "Thank you for your response! A confirmation email will be sent to you shortly.",
                     "data": {
                         "response_id": survey_response.oid,
                         "survey_title": survey.title,
                         "submitted_at": survey_response.created_at,
                         "completed_at": survey_response.completed_at,
                         "answers_count": len(responses),
-                        "view_submission_url": view_submission_url,
-                        "email_sent": (
-                            email_result.get("success", False)
-                            if "email_result" in locals()
-                            else False
-                        ),
+                        "view_submission_url": get_view_submission_url(survey_response),
+                        "email_sent": "queued",
                     },
                 },
                 status=status.HTTP_201_CREATED,
             )
 
         except Exception as e:
-            print(f"Error in survey submission: {str(e)}")
-            import traceback
-
-            traceback.print_exc()
+            logger.exception("survey.submission_error", survey=oid)
             return Response(
                 {"success": False, "error": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -346,7 +384,7 @@ class SurveySendInvitesView(APIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            result = send_survey_emails(
+            result = queue_survey_emails(
                 survey=survey,
                 emails=emails,
                 survey_url=survey_url,
@@ -359,13 +397,53 @@ class SurveySendInvitesView(APIView):
                     {"success": False, "error": result["error"]}, status=status.HTTP_400_BAD_REQUEST
                 )
 
-            success_message = f"Successfully sent {result['sent_count']} survey invitations"
-            if result.get("failed_emails"):
-                success_message += f" ({len(result['failed_emails'])} failed)"
+            success_message = f"Queued {result['queued_count']} survey invitations"
+            if result.get("invalid_emails"):
+                success_message += f" ({len(result['invalid_emails'])} invalid)"
 
             return Response(
                 {"success": True, "message": success_message, "data": result},
-                status=status.HTTP_200_OK,
+                status=status.HTTP_202_ACCEPTED,
+            )
+
+        except Exception as e:
+            return Response(
+                {"success": False, "error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class SurveyInviteStatusView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, oid, batch_id):
+        try:
+            survey = get_object_or_404(Survey, oid=oid, team=request.user.team)
+            recipients = list(
+                OutboundEmail.objects.filter(survey=survey, batch_id=batch_id)
+                .order_by("id")
+                .values("recipient", "status", "attempts", "last_error", "sent_at")
+            )
+
+            if not recipients:
+                return Response(
+                    {"success": False, "error": "Invitation batch not found."},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+
+            counts = {value: 0 for value, _ in EMAIL_STATUS_CHOICES}
+            for recipient in recipients:
+                counts[recipient["status"]] += 1
+
+            return Response(
+                {
+                    "success": True,
+                    "data": {
+                        "batch_id": batch_id,
+                        "total": len(recipients),
+                        "counts": counts,
+                        "recipients": recipients,
+                    },
+                }
             )
 
         except Exception as e:
@@ -380,6 +458,22 @@ class SurveySubmissionView(APIView):
 
     def get(self, request, response_oid):
         try:
+            current = get_object_or_404(
+                SurveyResponse.objects.values(
+                    "oid", "updated_at", "survey__updated_at", "respondent__updated_at"
+                ),
+                oid=response_oid,
+            )
+            etag = make_etag(*current.values())
+            last_modified = max(
+                current["updated_at"],
+                current["survey__updated_at"],
+                current["respondent__updated_at"],
+            )
+            not_modified = not_modified_response(request, etag, last_modified)
+            if not_modified:
+                return not_modified
+
             survey_response = get_object_or_404(
                 SurveyResponse.objects.select_related("survey", "respondent"), oid=response_oid
             )
@@ -404,7 +498,9 @@ class SurveySubmissionView(APIView):
                 "is_complete": survey_response.is_complete,
             }
 
-            return Response({"success": True, "data": response_data})
+            return set_validators(
+                Response({"success": True, "data": response_data}), etag, last_modified
+            )
 
         except Exception:
             return Response(
@@ -454,3 +550,224 @@ class SurveySubmissionCheckView(APIView):
             return Response(
                 {"success": False, "error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+class SurveyResponseListView(APIView):
+    permission_classes = [IsAuthenticated]
+    paginator = KeysetPaginator(field="created_at", page_size=50, max_page_size=500)
+
+    # Public field name -> columns loaded for it; `answers` is only read when requested.
+    fields = {
+        "oid": ("oid",),
+        "respondent": ("respondent__full_name", "respondent__email", "respondent__phone_number"),
+        "answers": ("answers",),
+        "is_complete": ("is_complete",),
+        "completed_at": ("completed_at",),
+        "created_at": ("created_at",),
+    }
+
+    def get_queryset(self, survey_id, params):
+        queryset = SurveyResponse.objects.filter(survey_id=survey_id)
+
+        for param, lookup in (
+            ("completed_after", "completed_at__gte"),
+            ("completed_before", "completed_at__lt"),
+        ):
+            if params.get(param):
+                value = parse_datetime(params[param])
+                if value is None:
+                    raise ValueError(f"{param} must be an ISO 8601 datetime.")
+                queryset = queryset.filter(**{lookup: value})
+
+        if params.get("is_complete") in ("true", "false"):
+            queryset = queryset.filter(is_complete=params["is_complete"] == "true")
+
+        return queryset
+
+    def to_representation(self, row, fields):
+        data = {}
+        for field in fields:
+            if field == "respondent":
+                data["respondent"] = {
+                    "full_name": row["respondent__full_name"],
+                    "email": row["respondent__email"],
+                    "phone": row["respondent__phone_number"],
+                }
+            else:
+                data[field] = row[field]
+        return data
+
+    def get(self, request, oid):
+        try:
+            survey_id = (
+                Survey.objects.filter(oid=oid, team=request.user.team)
+                .values_list("id", flat=True)
+                .first()
+            )
+            if survey_id is None:
+                return Response(
+                    {"success": False, "error": "Survey not found."},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+
+            params = request.query_params
+            fields = [f.strip() for f in params.get("fields", "").split(",") if f.strip()]
+            fields = fields or list(self.fields)
+            unknown_fields = [field for field in fields if field not in self.fields]
+            if unknown_fields:
+                raise ValueError(f"Unknown fields: {', '.join(unknown_fields)}")
+
+            columns = {"id", "created_at"}
+            for field in fields:
+                columns.update(self.fields[field])
+
+            queryset = self.get_queryset(survey_id, params).values(*columns)
+            rows, next_cursor = self.paginator.paginate(
+                queryset, params.get("cursor"), params.get("page_size")
+            )
+
+            return Response(
+                {
+                    "success": True,
+                    "data": {
+                        "responses": [self.to_representation(row, fields) for row in rows],
+                        "next_cursor": next_cursor,
+                        "has_more": next_cursor is not None,
+                    },
+                }
+            )
+
+        except ValueError as e:
+            return Response({"success": False, "error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response(
+                {"success": False, "error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class SurveyExportView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, oid):
+        try:
+            survey = get_object_or_404(
+                Survey.objects.only("id", "oid", "questions"), oid=oid, team=request.user.team
+            )
+            # `format` is reserved by DRF for renderer selection.
+            file_format = request.query_params.get("file_format", "csv")
+            gzip = request.query_params.get("gzip") in ("1", "true")
+
+            if file_format not in EXPORT_FORMATS:
+                return Response(
+                    {"success": False, "error": 'Invalid file_format. Use "csv" or "ndjson".'},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            response = StreamingHttpResponse(
+                stream_export(survey, file_format, gzip),
+                content_type=(
+                    "application/gzip" if gzip else EXPORT_FORMATS[file_format]["content_type"]
+                ),
+            )
+            response["Content-Disposition"] = (
+                f'attachment; filename="{export_filename(survey, file_format, gzip)}"'
+            )
+            return response
+
+        except Http404:
+            return Response(
+                {"success": False, "error": "Survey not found."}, status=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as e:
+            return Response(
+                {"success": False, "error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class SurveyResultsView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, oid):
+        try:
+            survey = get_object_or_404(
+                Survey.objects.only("id", "oid", "title", "questions").prefetch_related(
+                    "question_stats"
+                ),
+                oid=oid,
+                team=request.user.team,
+            )
+
+            return Response(
+                {
+                    "success": True,
+                    "data": {
+                        "survey_oid": str(survey.oid),
+                        "title": survey.title,
+                        "questions": build_results(survey),
+                    },
+                }
+            )
+
+        except Http404:
+            return Response(
+                {"success": False, "error": "Survey not found."}, status=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as e:
+            return Response(
+                {"success": False, "error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class SurveyAnalyticsView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, oid):
+        try:
+            survey = get_object_or_404(
+                Survey.objects.only("id", "oid", "title", "questions", "total_responses"),
+                oid=oid,
+                team=request.user.team,
+            )
+
+            max_responses = settings.SURVEY_ANALYTICS["MAX_RESPONSES"]
+            if survey.total_responses > max_responses:
+                return Response(
+                    {
+                        "success": False,
+                        "error": f"Analytics are limited to {max_responses} responses; "
+                        f"this survey has {survey.total_responses}. Export the responses instead.",
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            crosstabs = []
+            for value in request.query_params.getlist("crosstab"):
+                keys = [key.strip() for key in value.split(",")]
+                if len(keys) != 2 or not all(keys):
+                    raise ValueError(
+                        "crosstab must be two question keys, e.g. question_1,question_2"
+                    )
+                crosstabs.append(tuple(keys))
+            group_by = [key for key in request.query_params.getlist("group_by") if key]
+
+            return Response(
+                {
+                    "success": True,
+                    "data": {
+                        "survey_oid": str(survey.oid),
+                        "title": survey.title,
+                        **build_analytics(survey, crosstabs, group_by),
+                    },
+                }
+            )
+
+        except Http404:
+            return Response(
+                {"success": False, "error": "Survey not found."}, status=status.HTTP_404_NOT_FOUND
+            )
+        except ValueError as e:
+            return Response({"success": False, "error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response(
+                {"success": False, "error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -0,0 +1,96 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import caches
+
+
+class LocalLRUCache:
+    """
+    Thread-safe in-process LRU cache with per-entry expiry.
+
+    Entries live in the worker process only, so invalidation does not reach
+    other workers; keep the timeout short when running several processes.
+    """
+
+    def __init__(self, max_entries=1024, timeout=60):
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _expiry(self, timeout):
+        timeout = self.timeout if timeout is None else timeout
+        return time.monotonic() + timeout if timeout else None
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            value, expires_at = item
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout=None):
+        with self._lock:
+            self._data[key] = (value, self._expiry(timeout))
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class DjangoCache:
+    """Adapter exposing a configured Django cache alias through the same interface."""
+
+    def __init__(self, alias="default", timeout=300):
+        self.alias = alias
+        self.timeout = timeout
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def get(self, key, default=None):
+        return self.cache.get(key, default)
+
+    def set(self, key, value, timeout=None):
+        self.cache.set(key, value, self.timeout if timeout is None else timeout)
+
+    def delete(self, key):
+        self.cache.delete(key)
+
+    def clear(self):
+        self.cache.clear()
+
+
+def build_cache(options):
+    """
+    Build a cache from a settings dict.
+
+    Args:
+        options: dict with BACKEND ("local" or "django"), TIMEOUT, MAX_ENTRIES and ALIAS
+
+    Returns:
+        LocalLRUCache or DjangoCache
+    """
+    backend = options.get("BACKEND", "local")
+    timeout = options.get("TIMEOUT", 60)
+
+    if backend == "local":
+        return LocalLRUCache(max_entries=options.get("MAX_ENTRIES", 1024), timeout=timeout)
+    if backend == "django":
+        return DjangoCache(alias=options.get("ALIAS", "default"), timeout=timeout)
+
+    raise ValueError(f"Unknown cache backend: {backend}")
@@ -0,0 +1,199 @@
+import gzip
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.cache import patch_vary_headers
+from sc_api.apps.utils.cache import build_cache
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+compression_cache = build_cache(settings.COMPRESSION_CACHE)
+
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def _count(name):
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def get_compression_cache_stats():
+    """Hit/miss counters of the precompressed-body cache in this process."""
+    with _stats_lock:
+        hits, misses = _stats["hits"], _stats["misses"]
+    total = hits + misses
+    return {"hits": hits, "misses": misses, "hit_ratio": hits / total if total else None}
+
+
+def reset_compression_cache_stats():
+    with _stats_lock:
+        _stats.update(hits=0, misses=0)
+
+
+def _gzip(body, level):
+    # mtime=0 keeps the output a pure function of the body.
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def _brotli(body, level):
+    return brotli.compress(body, quality=level)
+
+
+def _zstd(body, level):
+    return zstandard.ZstdCompressor(level=level).compress(body)
+
+
+# Content-Encoding token -> compress(body, level), for the codecs installed here.
+CODECS = {"gzip": _gzip}
+if brotli is not None:
+    CODECS["br"] = _brotli
+if zstandard is not None:
+    CODECS["zstd"] = _zstd
+
+
+def compress(body, encoding, level):
+    return CODECS[encoding](body, level)
+
+
+def parse_accept_encoding(header):
+    """Accept-Encoding as {coding: q-value}, codings lowercased."""
+    accepted = {}
+    for item in header.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+def negotiate_encoding(header, encodings):
+    """
+    Pick the content coding for a response.
+
+    Args:
+        header: The request's Accept-Encoding header
+        encodings: Codings the server offers, most preferred first
+
+    Returns:
+        str: The offered coding with the highest q-value (ties go to the server's
+        preference), or None when the client accepts none of them
+    """
+    if not header:
+        return None
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+    chosen, chosen_quality = None, 0.0
+    for encoding in encodings:
+        quality = accepted.get(encoding, wildcard)
+        if quality > chosen_quality:
+            chosen, chosen_quality = encoding, quality
+    return chosen
+
+
+class CompressionMiddleware:
+    """
+    Compress API responses with zstd, brotli or gzip, negotiated from Accept-Encoding.
+
+    Only non-streaming bodies of at least MIN_SIZE bytes with one of
+    CONTENT_TYPES are compressed. The default types leave HTML out, so pages
+    that embed CSRF tokens are not exposed to compression side channels
+    (BREACH). Strong ETags become weak, as with Django's GZipMiddleware.
+
+    Responses that are `Cache-Control: public` and carry a strong ETag (the
+    public survey payload) are byte-identical for a given ETag, so their
+    compressed bodies are cached and reused instead of compressed per request.
+    """
+
+    def __init__(self, get_response):
+        self.options = settings.COMPRESSION
+        self.encodings = [encoding for encoding in self.options["ENCODINGS"] if encoding in CODECS]
+        if not self.options["ENABLED"] or not self.encodings:
+            raise MiddlewareNotUsed()
+        self.content_types = set(self.options["CONTENT_TYPES"])
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not self._compressible(response):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = negotiate_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""), self.encodings)
+        if encoding is None:
+            return response
+
+        start = time.perf_counter()
+        body = response.content
+        compressed = self._compressed_body(request, response, encoding)
+        profile = getattr(request, "_profile", None)
+        if profile is not None:
+            profile.response_bytes = len(body)
+            profile.compress_duration = time.perf_counter() - start
+
+        if len(compressed) >= len(body):
+            return response
+
+        response.content = compressed
+        response.headers["Content-Encoding"] = encoding
+        response.headers["Content-Length"] = str(len(compressed))
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        return response
+
+    def _compressible(self, response):
+        if response.streaming or response.has_header("Content-Encoding"):
+            return False
+        content_type = response.get("Content-Type", "").split(";")[0].strip().lower()
+        return (
+            content_type in self.content_types and len(response.content) >= self.options["MIN_SIZE"]
+        )
+
+    def _cache_key(self, request, response, encoding):
+        etag = response.get("ETag", "")
+        cache_control = response.get("Cache-Control", "").lower()
+        if (
+            request.method not in ("GET", "HEAD")
+            or response.status_code != 200
+            or not etag.startswith('"')
+            or "public" not in [directive.strip() for directive in cache_control.split(",")]
+        ):
+            return None
+        raw = "|".join([request.path, etag, response["Content-Type"], encoding])
+        return "compressed:" + hashlib.sha1(raw.encode()).hexdigest()
+
+    def _compressed_body(self, request, response, encoding):
+        level = self.options["LEVELS"][encoding]
+        key = self._cache_key(request, response, encoding)
+        if key is None:
+            return compress(response.content, encoding, level)
+
+        compressed = compression_cache.get(key)
+        if compressed is None:
+            _count("misses")
+            compressed = compress(response.content, encoding, level)
+            compression_cache.set(key, compressed)
+        else:
+            _count("hits")
+        return compressed
@@ -0,0 +1,54 @@
+import hashlib
+
+from django.utils.http import http_date, parse_etags, parse_http_date_safe, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def make_etag(*parts):
+    """Build a strong ETag from the given parts (oid, timestamps, counters...)."""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return quote_etag(digest)
+
+
+def not_modified_response(request, etag, last_modified=None):
+    """
+    Evaluate If-None-Match / If-Modified-Since against the current validators.
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted when the
+    client sent no entity tags.
+
+    Args:
+        request: Incoming request
+        etag: Current strong ETag of the resource
+        last_modified: Current modification datetime of the resource
+
+    Returns:
+        Response: An empty 304 response if the client copy is fresh, otherwise None
+    """
+    if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+    if_modified_since = request.META.get("HTTP_IF_MODIFIED_SINCE")
+
+    if if_none_match:
+        # Weak comparison: compressed responses carry the weak form of the ETag.
+        etags = [tag.removeprefix("W/") for tag in parse_etags(if_none_match)]
+        fresh = "*" in etags or etag in etags
+    elif if_modified_since and last_modified:
+        since = parse_http_date_safe(if_modified_since)
+        fresh = since is not None and int(last_modified.timestamp()) <= since
+    else:
+        fresh = False
+
+    if not fresh:
+        return None
+
+    return set_validators(Response(status=status.HTTP_304_NOT_MODIFIED), etag, last_modified)
+
+
+def set_validators(response, etag, last_modified=None, cache_control="private, no-cache"):
+    """Attach ETag, Last-Modified and a revalidation Cache-Control header to a response."""
+    response["ETag"] = etag
+    if last_modified:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    response["Cache-Control"] = cache_control
+    return response
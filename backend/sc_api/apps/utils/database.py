@@ -0,0 +1,164 @@
+import time
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from sc_api.apps.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# Configured from DATABASE_REPLICA_* in settings; reads stay on default without it.
+REPLICA_ALIAS = "replica"
+
+
+def replica_alias():
+    """
+    The alias read-heavy, lag-tolerant queries (analytics, exports) should use.
+
+    The read replica when one is configured, otherwise the default database.
+    Anything that must see its own writes keeps using the default alias.
+    """
+    return REPLICA_ALIAS if REPLICA_ALIAS in settings.DATABASES else DEFAULT_DB_ALIAS
+
+
+class PrimaryReplicaRouter:
+    """
+    Send every write to the default database and never migrate the replica.
+
+    Reads are not routed: querysets use the default database unless they opt in
+    with `.using(replica_alias())`. Writes go to the primary even for instances
+    loaded from the replica, which Django would otherwise save back to it.
+    """
+
+    def db_for_read(self, model, **hints):
+        return None
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data.
+        aliases = {DEFAULT_DB_ALIAS, REPLICA_ALIAS}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == REPLICA_ALIAS:
+            return False
+        return None
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 2)
+
+
+def check_connection(alias, samples=5):
+    """
+    Open a connection on `alias` and measure what it costs.
+
+    Args:
+        alias: The DATABASES alias to check
+        samples: Connections to reopen after the first one, for `reconnect_ms`
+
+    Returns:
+        dict: `connect_ms` is the first connection (opening the pool, when
+        pooled), `reconnect_ms` the median of `samples` further close/connect
+        cycles, which is what a request pays without persistent connections or
+        a pool (a pool checkout, when pooled), and `query_ms` a `SELECT 1`
+        round trip. `error` is set instead when the database is unreachable.
+    """
+    connection = connections[alias]
+    options = connection.settings_dict
+    pool = getattr(connection, "pool", None)
+    result = {
+        "alias": alias,
+        "vendor": connection.vendor,
+        "engine": options["ENGINE"],
+        "host": options.get("HOST") or None,
+        "pooled": pool is not None,
+        "conn_max_age": options["CONN_MAX_AGE"],
+        "health_checks": options["CONN_HEALTH_CHECKS"],
+        "error": None,
+    }
+
+    try:
+        connection.close()
+        start = time.perf_counter()
+        connection.ensure_connection()
+        result["connect_ms"] = _ms(time.perf_counter() - start)
+
+        reconnects = []
+        for _ in range(samples):
+            connection.close()
+            start = time.perf_counter()
+            connection.ensure_connection()
+            reconnects.append(time.perf_counter() - start)
+        reconnects.sort()
+        result["reconnect_ms"] = _ms(reconnects[len(reconnects) // 2]) if reconnects else None
+
+        start = time.perf_counter()
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+        result["query_ms"] = _ms(time.perf_counter() - start)
+
+        if pool is not None:
+            stats = pool.get_stats()
+            result["pool"] = {
+                "min_size": stats["pool_min"],
+                "max_size": stats["pool_max"],
+                "size": stats["pool_size"],
+                "available": stats["pool_available"],
+            }
+    except DatabaseError as e:
+        result["error"] = str(e).strip() or e.__class__.__name__
+    finally:
+        # Return the connection (to the pool, when pooled) instead of leaving
+        # it open on the thread that ran the check.
+        connection.close()
+
+    return result
+
+
+def check_connections(aliases=None, samples=5):
+    """`check_connection` for each alias, all of DATABASES by default."""
+    return [check_connection(alias, samples) for alias in aliases or settings.DATABASES]
+
+
+def startup_check():
+    """
+    Log the connection setup cost of every database once the app has loaded.
+
+    Called from the WSGI/ASGI entry points when DATABASE_STARTUP_CHECK is on.
+    An unreachable database is logged as an error but does not stop the worker.
+
+    Every connection is closed afterwards, and psycopg pools are shut down and
+    left to reopen lazily, so that nothing opened here is inherited by worker
+    processes forked from a preloading master (`gunicorn --preload`).
+    """
+    try:
+        _log_startup_check()
+    finally:
+        connections.close_all()
+        for connection in connections.all(initialized_only=True):
+            if getattr(connection, "pool", None) is not None:
+                connection.close_pool()
+
+
+def _log_startup_check():
+    for result in check_connections():
+        if result["error"]:
+            logger.error(
+                "database.startup_check_failed", alias=result["alias"], error=result["error"]
+            )
+            continue
+        logger.info(
+            "database.startup_check",
+            alias=result["alias"],
+            vendor=result["vendor"],
+            pooled=result["pooled"],
+            conn_max_age=result["conn_max_age"],
+            connect_ms=result["connect_ms"],
+            reconnect_ms=result["reconnect_ms"],
+            query_ms=result["query_ms"],
+        )
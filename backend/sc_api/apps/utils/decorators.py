@@ -1,10 +1,10 @@
-import logging
 from functools import wraps
 
 from rest_framework import status
 from rest_framework.response import Response
+from sc_api.apps.utils.log import get_logger
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 def params_required(params=()):
@@ -17,7 +17,7 @@ def params_required(params=()):
                         raise AttributeError
                 except AttributeError:
                     message = f"{param} missing in the request payload"
-                    logger.error(message)
+                    logger.warning("request.param_missing", param=param)
                     return Response(data={"message": message}, status=status.HTTP_400_BAD_REQUEST)
             return func(self, request, *args, **kwargs)
 
@@ -1,10 +1,22 @@
-import logging
 import re
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 
 from django.conf import settings
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage, get_connection, send_mail
+from django.db import close_old_connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from sc_api.apps.schema.models import OutboundEmail
+from sc_api.apps.utils.log import get_logger
 
-logger = logging.getLogger(__name__)
+# Recipient addresses are kept out of the logs; events carry ids and counts.
+logger = get_logger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
 
 
 def validate_emails(emails):
@@ -23,43 +35,19 @@ def validate_emails(emails):
     return valid_emails, invalid_emails
 
 
-def send_survey_emails(survey, emails, survey_url, custom_message="", sender=None):
+def build_invitation_email(survey, survey_url, custom_message="", sender=None):
     """
-    Send survey invitation emails to a list of recipients.
+    Build the subject and body of a survey invitation.
 
     Args:
         survey: Survey instance
-        emails: List of email addresses
         survey_url: URL to the survey
         custom_message: Optional custom message to include
         sender: User sending the emails
 
     Returns:
-        dict: Results of email sending operation
-    """
-    logger.info(f"Starting to send emails for survey: {survey.title}")
-    logger.info(f"Email settings - Backend: {settings.EMAIL_BACKEND}")
-    logger.info(f"Email settings - Host: {getattr(settings, 'EMAIL_HOST', 'Not set')}")
-    logger.info(f"Email settings - Port: {getattr(settings, 'EMAIL_PORT', 'Not set')}")
-    logger.info(f"Email settings - TLS: {getattr(settings, 'EMAIL_USE_TLS', 'Not set')}")
-    logger.info(f"Email settings - User: {getattr(settings, 'EMAIL_HOST_USER', 'Not set')}")
-    logger.info(f"Email settings - From: {settings.DEFAULT_FROM_EMAIL}")
-    logger.info(f"Total emails to process: {len(emails)}")
-
-    # Validate emails
-    valid_emails, invalid_emails = validate_emails(emails)
-    logger.info(f"Valid emails: {valid_emails}")
-    logger.info(f"Invalid emails: {invalid_emails}")
-
-    if not valid_emails:
-        logger.warning("No valid email addresses provided")
-        return {
-            "success": False,
-            "error": "No valid email addresses provided",
-            "invalid_emails": invalid_emails,
-        }
-
-    # Create email content
+        tuple: (subject, body)
+    """
     subject = f"You're invited to participate in: {survey.title}"
 
     body = f"""Hello,
@@ -79,74 +67,235 @@ Best regards,
 {sender.get_full_name() or sender.email if sender else 'Survey Team'}
 {sender.team.name if sender and sender.team else ''}
 """
+    return subject, body
 
-    logger.info(f"Email subject: {subject}")
-    logger.info(f"Email body length: {len(body)} characters")
-
-    # Send emails
-    sent_count = 0
-    failed_emails = []
 
-    for email in valid_emails:
-        try:
-            logger.info(f"Attempting to send email to: {email}")
+def queue_survey_emails(survey, emails, survey_url, custom_message="", sender=None):
+    """
+    Queue survey invitation emails in the outbox for the delivery worker.
 
-            send_mail(
-                subject=subject,
-                message=body,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[email],
-                fail_silently=False,
-            )
+    Args:
+        survey: Survey instance
+        emails: List of email addresses
+        survey_url: URL to the survey
+        custom_message: Optional custom message to include
+        sender: User sending the emails
 
-            sent_count += 1
-            logger.info(f"Successfully sent email to: {email}")
+    Returns:
+        dict: Batch id and counts of queued / invalid addresses
+    """
+    valid_emails, invalid_emails = validate_emails(emails)
 
-        except Exception as e:
-            error_message = str(e)
-            logger.error(f"Failed to send email to {email}: {error_message}")
-            failed_emails.append({"email": email, "error": error_message})
+    if not valid_emails:
+        logger.warning("email.no_valid_recipients", survey=survey.oid, invalid=len(invalid_emails))
+        return {
+            "success": False,
+            "error": "No valid email addresses provided",
+            "invalid_emails": invalid_emails,
+        }
 
-    logger.info(f"Email sending complete. Sent: {sent_count}, Failed: {len(failed_emails)}")
+    subject, body = build_invitation_email(survey, survey_url, custom_message, sender)
+    recipients = list(dict.fromkeys(valid_emails))
+    batch_id = uuid.uuid4()
+
+    OutboundEmail.objects.bulk_create(
+        [
+            OutboundEmail(
+                batch_id=batch_id,
+                kind="invitation",
+                survey=survey,
+                recipient=email,
+                subject=subject,
+                body=body,
+            )
+            for email in recipients
+        ],
+        batch_size=settings.EMAIL_OUTBOX["BATCH_SIZE"],
+    )
+    logger.info("email.invites_queued", survey=survey.oid, batch=batch_id, queued=len(recipients))
 
-    # Prepare results
     result = {
         "success": True,
-        "sent_count": sent_count,
+        "batch_id": batch_id,
+        "queued_count": len(recipients),
         "total_attempted": len(valid_emails),
         "survey_title": survey.title,
     }
 
     if invalid_emails:
         result["invalid_emails"] = invalid_emails
-        logger.info(f"Invalid emails found: {invalid_emails}")
-
-    if failed_emails:
-        result["failed_emails"] = failed_emails
-        logger.error(f"Failed emails: {failed_emails}")
 
-    logger.info(f"Final result: {result}")
     return result
 
 
+def claim_queued_emails(batch_size, ids=None):
+    """
+    Claim due outbox rows for delivery by moving them to `sending`.
+
+    Rows stuck in `sending` longer than SENDING_TIMEOUT (a crashed worker) are
+    claimed again. The claim is a single UPDATE that re-checks the due condition
+    and stamps a fresh claim token, so concurrent workers never claim the same
+    row and no read-then-write transaction is held (which SQLite cannot upgrade
+    while another connection is writing).
+
+    Args:
+        batch_size: Maximum number of rows to claim
+        ids: Optional OutboundEmail ids to restrict the claim to
+
+    Returns:
+        list: Claimed OutboundEmail instances
+    """
+    now = timezone.now()
+    stale_before = now - timedelta(seconds=settings.EMAIL_OUTBOX["SENDING_TIMEOUT"])
+    due = Q(status="queued", next_attempt_at__lte=now) | Q(
+        status="sending", updated_at__lt=stale_before
+    )
+    queryset = (
+        OutboundEmail.objects.all() if ids is None else OutboundEmail.objects.filter(id__in=ids)
+    )
+    claimable = queryset.filter(due).order_by("next_attempt_at").values("id")[:batch_size]
+    claim_token = uuid.uuid4()
+
+    OutboundEmail.objects.filter(due, id__in=claimable).update(
+        status="sending", claim_token=claim_token, attempts=F("attempts") + 1, updated_at=now
+    )
+
+    return list(OutboundEmail.objects.filter(claim_token=claim_token).order_by("id"))
+
+
+def _record_failure(outbound_email, error_message):
+    outbound_email.last_error = error_message
+    if outbound_email.attempts >= settings.EMAIL_OUTBOX["MAX_ATTEMPTS"]:
+        outbound_email.status = "failed"
+    else:
+        backoff = settings.EMAIL_OUTBOX["RETRY_BACKOFF"] * 2 ** (outbound_email.attempts - 1)
+        outbound_email.status = "queued"
+        outbound_email.next_attempt_at = timezone.now() + timedelta(seconds=backoff)
+    outbound_email.save(update_fields=["status", "last_error", "next_attempt_at", "updated_at"])
+
+
+def deliver_emails(outbound_emails):
+    """
+    Deliver claimed outbox rows over a single backend connection.
+
+    Failed messages are re-queued with exponential backoff until MAX_ATTEMPTS,
+    after which they are marked as failed.
+
+    Args:
+        outbound_emails: OutboundEmail instances in `sending` state
+
+    Returns:
+        dict: Number of sent and failed messages
+    """
+    sent_ids = []
+    failed_count = 0
+
+    try:
+        connection = get_connection(fail_silently=False)
+        connection.open()
+    except Exception as e:
+        logger.error("email.connection_failed", error=e, emails=len(outbound_emails))
+        for outbound_email in outbound_emails:
+            _record_failure(outbound_email, str(e))
+        return {"sent": 0, "failed": len(outbound_emails)}
+
+    try:
+        for outbound_email in outbound_emails:
+            message = EmailMessage(
+                outbound_email.subject,
+                outbound_email.body,
+                settings.DEFAULT_FROM_EMAIL,
+                [outbound_email.recipient],
+                connection=connection,
+            )
+            try:
+                connection.send_messages([message])
+                sent_ids.append(outbound_email.id)
+            except Exception as e:
+                logger.warning(
+                    "email.send_failed",
+                    email=outbound_email.id,
+                    attempts=outbound_email.attempts,
+                    error=e,
+                )
+                _record_failure(outbound_email, str(e))
+                failed_count += 1
+    finally:
+        connection.close()
+
+    now = timezone.now()
+    OutboundEmail.objects.filter(id__in=sent_ids).update(
+        status="sent", sent_at=now, last_error="", updated_at=now
+    )
+
+    return {"sent": len(sent_ids), "failed": failed_count}
+
+
+def deliver_queued_emails(batch_size=None):
+    """
+    Claim and deliver one batch of due outbox emails.
+
+    Returns:
+        dict: Number of claimed, sent and failed messages
+    """
+    outbound_emails = claim_queued_emails(batch_size or settings.EMAIL_OUTBOX["BATCH_SIZE"])
+    if not outbound_emails:
+        return {"claimed": 0, "sent": 0, "failed": 0}
+
+    result = deliver_emails(outbound_emails)
+    logger.info("email.outbox_batch", sent=result["sent"], failed=result["failed"])
+    return {"claimed": len(outbound_emails), **result}
+
+
+def _deliver_claimed(ids):
+    try:
+        outbound_emails = claim_queued_emails(len(ids), ids=ids)
+        if outbound_emails:
+            deliver_emails(outbound_emails)
+    except Exception:
+        logger.exception("email.background_delivery_failed", emails=len(ids))
+    finally:
+        close_old_connections()
+
+
+def deliver_emails_in_background(ids):
+    """
+    Deliver specific outbox rows on the background executor.
+
+    Does nothing when EMAIL_OUTBOX BACKGROUND_WORKERS is 0; the rows then wait
+    for the send_queued_emails worker.
+
+    Args:
+        ids: OutboundEmail ids to deliver
+    """
+    global _executor
+
+    workers = settings.EMAIL_OUTBOX["BACKGROUND_WORKERS"]
+    if not workers or not ids:
+        return
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="outbox")
+
+    _executor.submit(_deliver_claimed, list(ids))
+
+
 def test_email_connection():
     """
     Test email connection and settings.
     Call this function to verify email configuration.
     """
-    logger.info("Testing email connection...")
 
     try:
-        from django.core.mail import get_connection
-
         connection = get_connection()
         connection.open()
-        logger.info("Email connection successful!")
+        logger.info("email.connection_ok")
         connection.close()
         return True
 
     except Exception as e:
-        logger.error(f"Email connection failed: {str(e)}")
+        logger.error("email.connection_failed", error=e)
         return False
 
 
@@ -160,7 +309,6 @@ def send_test_email(to_email):
     Returns:
         dict: Result of test email
     """
-    logger.info(f"Sending test email to: {to_email}")
 
     try:
         send_mail(
@@ -171,32 +319,29 @@ def send_test_email(to_email):
             fail_silently=False,
         )
 
-        logger.info(f"Test email sent successfully to: {to_email}")
+        logger.info("email.test_sent")
         return {"success": True, "message": f"Test email sent successfully to {to_email}"}
 
     except Exception as e:
         error_message = str(e)
-        logger.error(f"Test email failed: {error_message}")
+        logger.error("email.test_failed", error=error_message)
         return {"success": False, "error": error_message}
 
 
-def send_submission_confirmation_email(survey_response, view_submission_url):
+def build_confirmation_email(survey_response, view_submission_url):
     """
-    Send confirmation email to respondent with link to view their submission.
+    Build the subject and body of a submission confirmation.
 
     Args:
         survey_response: SurveyResponse instance
         view_submission_url: URL where user can view their submitted data
 
     Returns:
-        dict: Result of email sending operation
+        tuple: (subject, body)
     """
-    logger.info(f"Sending submission confirmation email for response: {survey_response.oid}")
-
     respondent = survey_response.respondent
     survey = survey_response.survey
 
-    # Create email content
     subject = f"Thank you for completing: {survey.title}"
 
     body = f"""Hello {respondent.full_name},
@@ -217,26 +362,34 @@ If you have any questions about this survey, please contact the survey administr
 Best regards,
 Survey Team
 """
+    return subject, body
 
-    logger.info(f"Sending confirmation email to: {respondent.email}")
 
-    try:
-        send_mail(
-            subject=subject,
-            message=body,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[respondent.email],
-            fail_silently=False,
-        )
+def queue_submission_confirmation_email(survey_response, view_submission_url):
+    """
+    Queue the confirmation email for a submission in the outbox.
 
-        logger.info(f"Confirmation email sent successfully to: {respondent.email}")
-        return {
-            "success": True,
-            "message": f"Confirmation email sent to {respondent.email}",
-            "recipient": respondent.email,
-        }
+    Must be called inside the transaction that creates the response. Once it
+    commits, the email is handed to the background executor so it usually goes
+    out within the request's lifetime; the outbox worker picks it up otherwise.
+    Delivery status and errors are kept on the OutboundEmail row linked to the
+    response.
 
-    except Exception as e:
-        error_message = str(e)
-        logger.error(f"Failed to send confirmation email to {respondent.email}: {error_message}")
-        return {"success": False, "error": error_message, "recipient": respondent.email}
+    Args:
+        survey_response: SurveyResponse instance
+        view_submission_url: URL where user can view their submitted data
+
+    Returns:
+        OutboundEmail: The queued email
+    """
+    subject, body = build_confirmation_email(survey_response, view_submission_url)
+    outbound_email = OutboundEmail.objects.create(
+        kind="confirmation",
+        survey=survey_response.survey,
+        survey_response=survey_response,
+        recipient=survey_response.respondent.email,
+        subject=subject,
+        body=body,
+    )
+    transaction.on_commit(lambda: deliver_emails_in_background([outbound_email.id]))
+    return outbound_email
@@ -0,0 +1,150 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+
+from django.conf import settings
+
+
+def _sample_rate(name):
+    """Sampling rate configured for the longest matching module prefix in LOG_SAMPLING."""
+    rates = getattr(settings, "LOG_SAMPLING", {})
+    matches = [prefix for prefix in rates if name == prefix or name.startswith(prefix + ".")]
+    return float(rates[max(matches, key=len)]) if matches else 1.0
+
+
+class StructuredLogger:
+    """
+    Level-gated event logger: `logger.info("email.batch_sent", sent=3, failed=0)`.
+
+    Fields are attached to the record as-is and only rendered by the formatter,
+    so a disabled level costs one `isEnabledFor` check and no formatting.
+    DEBUG and INFO events are sampled at the module's LOG_SAMPLING rate;
+    warnings and errors are always emitted.
+    """
+
+    def __init__(self, name):
+        self.logger = logging.getLogger(name)
+        self.sample_rate = _sample_rate(name)
+
+    def isEnabledFor(self, level):
+        return self.logger.isEnabledFor(level)
+
+    def _log(self, level, event, fields, exc_info=None):
+        if not self.logger.isEnabledFor(level):
+            return
+        if level < logging.WARNING and self.sample_rate < 1 and random.random() >= self.sample_rate:
+            return
+        # stacklevel=3 attributes the record to the caller of debug()/info()/...
+        self.logger.log(level, event, exc_info=exc_info, extra={"fields": fields}, stacklevel=3)
+
+    def debug(self, event, **fields):
+        self._log(logging.DEBUG, event, fields)
+
+    def info(self, event, **fields):
+        self._log(logging.INFO, event, fields)
+
+    def warning(self, event, **fields):
+        self._log(logging.WARNING, event, fields)
+
+    def error(self, event, exc_info=None, **fields):
+        self._log(logging.ERROR, event, fields, exc_info)
+
+    def exception(self, event, **fields):
+        self._log(logging.ERROR, event, fields, exc_info=True)
+
+
+def get_logger(name):
+    return StructuredLogger(name)
+
+
+def _render(value):
+    text = value if isinstance(value, str) else str(value)
+    return json.dumps(text) if not text or " " in text or '"' in text or "=" in text else text
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    Append an event's fields to the formatted line as `key=value` pairs, or
+    emit the whole record as one JSON object when `json_lines` is set.
+    """
+
+    def __init__(self, *args, json_lines=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.json_lines = json_lines
+
+    def formatMessage(self, record):
+        message = super().formatMessage(record)
+        fields = getattr(record, "fields", None)
+        if not fields:
+            return message
+        return f"{message} " + " ".join(f"{key}={_render(value)}" for key, value in fields.items())
+
+    def format(self, record):
+        if not self.json_lines:
+            return super().format(record)
+
+        data = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": record.getMessage(),
+            **{key: str(value) for key, value in (getattr(record, "fields", None) or {}).items()},
+        }
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(data)
+
+
+class QueuedFileHandler(QueueHandler):
+    """
+    Time-rotated file handler whose formatting and I/O run on a listener thread.
+
+    The request thread only resolves the message and enqueues the record; a
+    QueueListener formats it and writes it to a TimedRotatingFileHandler. The
+    listener is restarted in forked worker processes and stopped at exit.
+    """
+
+    def __init__(self, filename, when="midnight", backupCount=7, queue_size=10000):
+        super().__init__(queue.Queue(queue_size))
+        self.target = TimedRotatingFileHandler(filename, when=when, backupCount=backupCount)
+        self.listener = None
+        self._start_listener()
+        atexit.register(self._stop_listener)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._start_listener)
+
+    def _start_listener(self):
+        self.listener = QueueListener(self.queue, self.target, respect_handler_level=True)
+        self.listener.start()
+
+    def _stop_listener(self):
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+
+    def setFormatter(self, fmt):
+        # Formatting happens on the listener thread, in the target handler.
+        self.target.setFormatter(fmt)
+
+    def prepare(self, record):
+        # Merge args now so later mutation of the arguments cannot change the
+        # message; everything else is left for the listener thread.
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Shed records instead of blocking requests when the disk falls behind.
+            pass
+
+    def close(self):
+        self._stop_listener()
+        self.target.close()
+        super().close()
@@ -0,0 +1,289 @@
+import hmac
+import math
+import threading
+from collections import deque
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden, HttpResponseNotFound
+from sc_api.apps.authentication.cache import get_auth_cache_stats
+from sc_api.apps.utils.compression import get_compression_cache_stats
+from sc_api.apps.utils.stats import percentile
+
+# Request duration bucket upper bounds, in seconds
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Response body size bucket upper bounds (before compression), in bytes
+RESPONSE_SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class ViewStats:
+    """
+    Counters for one (view, method) pair.
+
+    Cumulative totals and duration buckets feed the Prometheus histogram; the
+    last `window` requests are also kept so recent percentiles can be reported.
+    """
+
+    def __init__(self, window):
+        self.requests = 0
+        self.errors = 0
+        self.duration = 0.0
+        self.db_queries = 0
+        self.db_duration = 0.0
+        self.render_duration = 0.0
+        self.response_bytes = 0
+        self.wire_bytes = 0
+        self.sized_responses = 0
+        self.buckets = [0] * len(DURATION_BUCKETS)
+        self.size_buckets = [0] * len(RESPONSE_SIZE_BUCKETS)
+        self.recent = deque(maxlen=window)
+
+    def observe(self, profile, status_code):
+        self.requests += 1
+        self.errors += status_code >= 500
+        self.duration += profile.duration
+        self.db_queries += profile.db_queries
+        self.db_duration += profile.db_duration
+        self.render_duration += profile.render_duration
+        self.response_bytes += profile.response_bytes or 0
+        self.wire_bytes += profile.wire_bytes or 0
+        for index, bound in enumerate(DURATION_BUCKETS):
+            if profile.duration <= bound:
+                self.buckets[index] += 1
+                break
+        if profile.response_bytes is not None:
+            self.sized_responses += 1
+            for index, bound in enumerate(RESPONSE_SIZE_BUCKETS):
+                if profile.response_bytes <= bound:
+                    self.size_buckets[index] += 1
+                    break
+        self.recent.append((profile.duration, profile.db_queries))
+
+
+class RequestMetrics:
+    """
+    Thread-safe in-process registry of per-view request statistics.
+
+    Each worker process keeps its own registry; scrape every worker (or run a
+    single one) to see the full picture.
+    """
+
+    def __init__(self, window=1000):
+        self.window = window
+        self._views = {}
+        self._lock = threading.Lock()
+
+    def observe(self, view, method, profile, status_code):
+        with self._lock:
+            stats = self._views.get((view, method))
+            if stats is None:
+                stats = self._views[(view, method)] = ViewStats(self.window)
+            stats.observe(profile, status_code)
+
+    def snapshot(self):
+        """Per-view totals, bucket counts and recent durations/query counts, copied under the lock."""
+        with self._lock:
+            return {
+                key: {
+                    "requests": stats.requests,
+                    "errors": stats.errors,
+                    "duration": stats.duration,
+                    "db_queries": stats.db_queries,
+                    "db_duration": stats.db_duration,
+                    "render_duration": stats.render_duration,
+                    "response_bytes": stats.response_bytes,
+                    "wire_bytes": stats.wire_bytes,
+                    "sized_responses": stats.sized_responses,
+                    "buckets": list(stats.buckets),
+                    "size_buckets": list(stats.size_buckets),
+                    "recent_durations": [duration for duration, _ in stats.recent],
+                    "recent_queries": [queries for _, queries in stats.recent],
+                }
+                for key, stats in self._views.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+
+
+request_metrics = RequestMetrics(window=settings.PROFILING["HISTOGRAM_WINDOW"])
+
+
+def _labels(**labels):
+    pairs = ",".join(
+        '{}="{}"'.format(
+            key, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        for key, value in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+def _number(value):
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return "NaN"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_prometheus(metrics=request_metrics):
+    """
+    Render the request statistics and authentication cache counters in the
+    Prometheus text exposition format.
+    """
+    snapshot = sorted(metrics.snapshot().items())
+    lines = []
+
+    def family(name, metric_type, help_text, samples):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        lines.extend(
+            f"{sample_name}{labels} {_number(value)}" for sample_name, labels, value in samples
+        )
+
+    def per_view(field):
+        return [
+            ("", _labels(view=view, method=method), stats[field])
+            for (view, method), stats in snapshot
+        ]
+
+    def named(name, samples):
+        return [(name + suffix, labels, value) for suffix, labels, value in samples]
+
+    histogram = []
+    for (view, method), stats in snapshot:
+        cumulative = 0
+        for bound, count in zip(DURATION_BUCKETS, stats["buckets"]):
+            cumulative += count
+            histogram.append(("_bucket", _labels(view=view, method=method, le=bound), cumulative))
+        histogram.append(
+            ("_bucket", _labels(view=view, method=method, le="+Inf"), stats["requests"])
+        )
+        histogram.append(("_sum", _labels(view=view, method=method), stats["duration"]))
+        histogram.append(("_count", _labels(view=view, method=method), stats["requests"]))
+
+    sizes = []
+    for (view, method), stats in snapshot:
+        cumulative = 0
+        for bound, count in zip(RESPONSE_SIZE_BUCKETS, stats["size_buckets"]):
+            cumulative += count
+            sizes.append(("_bucket", _labels(view=view, method=method, le=bound), cumulative))
+        sizes.append(
+            ("_bucket", _labels(view=view, method=method, le="+Inf"), stats["sized_responses"])
+        )
+        sizes.append(("_sum", _labels(view=view, method=method), stats["response_bytes"]))
+        sizes.append(("_count", _labels(view=view, method=method), stats["sized_responses"]))
+
+    recent = []
+    for (view, method), stats in snapshot:
+        for quantile in (0.5, 0.9, 0.99):
+            value = percentile(stats["recent_durations"], quantile * 100)
+            recent.append(("", _labels(view=view, method=method, quantile=quantile), value))
+
+    recent_queries = []
+    for (view, method), stats in snapshot:
+        for quantile in (0.5, 0.99):
+            value = percentile(stats["recent_queries"], quantile * 100)
+            recent_queries.append(("", _labels(view=view, method=method, quantile=quantile), value))
+
+    family(
+        "sc_http_request_duration_seconds",
+        "histogram",
+        "Request wall time per view.",
+        named("sc_http_request_duration_seconds", histogram),
+    )
+    family(
+        "sc_http_response_size_bytes",
+        "histogram",
+        "Non-streaming response body size per view, before compression.",
+        named("sc_http_response_size_bytes", sizes),
+    )
+    family(
+        "sc_http_request_recent_duration_seconds",
+        "gauge",
+        "Request wall time percentiles over the most recent requests per view.",
+        named("sc_http_request_recent_duration_seconds", recent),
+    )
+    family(
+        "sc_http_request_recent_db_queries",
+        "gauge",
+        "DB queries per request, percentiles over the most recent requests per view.",
+        named("sc_http_request_recent_db_queries", recent_queries),
+    )
+    for name, field, help_text in (
+        ("sc_http_request_errors_total", "errors", "Requests that returned a 5xx status."),
+        ("sc_http_db_queries_total", "db_queries", "DB queries executed while handling requests."),
+        ("sc_http_db_duration_seconds_total", "db_duration", "Time spent executing DB queries."),
+        (
+            "sc_http_render_duration_seconds_total",
+            "render_duration",
+            "Time spent rendering responses.",
+        ),
+        (
+            "sc_http_response_bytes_total",
+            "response_bytes",
+            "Bytes of non-streaming response bodies, before compression.",
+        ),
+        (
+            "sc_http_response_wire_bytes_total",
+            "wire_bytes",
+            "Bytes of non-streaming response bodies as sent, after compression.",
+        ),
+    ):
+        family(name, "counter", help_text, named(name, per_view(field)))
+
+    auth_cache = get_auth_cache_stats()
+    family(
+        "sc_auth_user_cache_requests_total",
+        "counter",
+        "Authenticated-user cache lookups by result.",
+        [
+            ("sc_auth_user_cache_requests_total", _labels(result="hit"), auth_cache["hits"]),
+            ("sc_auth_user_cache_requests_total", _labels(result="miss"), auth_cache["misses"]),
+        ],
+    )
+
+    compression_cache = get_compression_cache_stats()
+    family(
+        "sc_http_compression_cache_requests_total",
+        "counter",
+        "Precompressed-body cache lookups by result.",
+        [
+            (
+                "sc_http_compression_cache_requests_total",
+                _labels(result="hit"),
+                compression_cache["hits"],
+            ),
+            (
+                "sc_http_compression_cache_requests_total",
+                _labels(result="miss"),
+                compression_cache["misses"],
+            ),
+        ],
+    )
+
+    return "\n".join(lines) + "\n"
+
+
+def metrics_view(request):
+    """
+    Serve `/metrics` for Prometheus.
+
+    Only available while request profiling is enabled, and only to scrapers
+    sending METRICS_TOKEN as a bearer token; without a configured token the
+    endpoint refuses every request rather than expose traffic and error counts.
+    """
+    options = settings.PROFILING
+    if not options["ENABLED"]:
+        return HttpResponseNotFound()
+
+    token = options["METRICS_TOKEN"]
+    if not token:
+        return HttpResponseForbidden("Set PROFILING_METRICS_TOKEN to serve /metrics.")
+    supplied = request.META.get("HTTP_AUTHORIZATION", "").removeprefix("Bearer ")
+    if not hmac.compare_digest(supplied.encode(), token.encode()):
+        return HttpResponse(status=401)
+
+    return HttpResponse(render_prometheus(), content_type=PROMETHEUS_CONTENT_TYPE)
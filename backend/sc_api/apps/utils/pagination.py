@@ -0,0 +1,123 @@
+import base64
+import json
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+
+
+class KeysetPaginator:
+    """
+    Keyset (cursor) pagination in descending `(field, id)` order.
+
+    Each page is fetched with a `WHERE (field, id) < (cursor)` predicate instead of
+    OFFSET, so the cost of a page does not grow with its depth. `field` must be a
+    datetime; `id` breaks ties between rows sharing a timestamp.
+    """
+
+    def __init__(self, field="created_at", page_size=50, max_page_size=500):
+        self.field = field
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+
+    def get_page_size(self, value):
+        if value in (None, ""):
+            return self.page_size
+        page_size = int(value)
+        if page_size < 1:
+            raise ValueError("page_size must be positive.")
+        return min(page_size, self.max_page_size)
+
+    def encode_cursor(self, row):
+        value = row[self.field] if isinstance(row, dict) else getattr(row, self.field)
+        pk = row["id"] if isinstance(row, dict) else row.id
+        payload = json.dumps([value.isoformat(), pk])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, cursor):
+        try:
+            raw_value, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            value = parse_datetime(raw_value)
+        except (TypeError, ValueError):
+            raise ValueError("Invalid cursor.")
+        if value is None or not isinstance(pk, int):
+            raise ValueError("Invalid cursor.")
+        return value, pk
+
+    def paginate(self, queryset, cursor=None, page_size=None):
+        """
+        Return one page of the queryset.
+
+        Args:
+            queryset: QuerySet (model instances or values() dicts including `id`)
+            cursor: Opaque cursor returned by a previous page
+            page_size: Requested page size (capped at max_page_size)
+
+        Returns:
+            tuple: (rows, next_cursor or None)
+
+        Raises:
+            ValueError: If the cursor or page size is malformed
+        """
+        page_size = self.get_page_size(page_size)
+
+        if cursor:
+            value, pk = self.decode_cursor(cursor)
+            queryset = queryset.filter(
+                Q(**{f"{self.field}__lt": value}) | Q(**{self.field: value, "id__lt": pk})
+            )
+
+        rows = list(queryset.order_by(f"-{self.field}", "-id")[: page_size + 1])
+        if len(rows) <= page_size:
+            return rows, None
+
+        rows = rows[:page_size]
+        return rows, self.encode_cursor(rows[-1])
+
+
+def estimated_row_count(model, using="default"):
+    """
+    Planner estimate of a table's row count, or None when the database keeps none.
+
+    Only PostgreSQL is supported (`pg_class.reltuples`, refreshed by ANALYZE and
+    autovacuum); other databases return None.
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    # reltuples is -1 for tables that were never analyzed.
+    return row[0] if row and row[0] >= 0 else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator for large tables that avoids a full COUNT(*) per page.
+
+    Unfiltered querysets use the planner's row estimate once it exceeds
+    `exact_threshold`; filtered querysets count at most `max_count` rows, so
+    the page count saturates instead of scanning everything.
+    """
+
+    exact_threshold = 10000
+    max_count = 100000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not hasattr(queryset, "query"):
+            return super().count
+
+        if not queryset.query.where:
+            estimate = estimated_row_count(queryset.model, queryset.db)
+            if estimate is not None and estimate > self.exact_threshold:
+                return estimate
+
+        return queryset.order_by()[: self.max_count].count()
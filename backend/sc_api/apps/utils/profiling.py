@@ -0,0 +1,151 @@
+import cProfile
+import hmac
+import random
+import time
+import uuid
+from contextlib import ExitStack
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from sc_api.apps.utils.log import get_logger
+from sc_api.apps.utils.metrics import request_metrics
+
+logger = get_logger(__name__)
+
+
+class RequestProfile:
+    """Timings collected while handling one request; durations are in seconds."""
+
+    def __init__(self):
+        self.view = "unmatched"
+        self.duration = 0.0
+        self.db_queries = 0
+        self.db_duration = 0.0
+        self.render_duration = 0.0
+        self.compress_duration = 0.0
+        # Body size before and after CompressionMiddleware; None for streaming responses.
+        self.response_bytes = None
+        self.wire_bytes = None
+        self._render_started = None
+
+    def record_query(self, execute, sql, params, many, context):
+        # connection.execute_wrapper hook: counts and times every statement.
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_queries += 1
+            self.db_duration += time.perf_counter() - start
+
+    def start_render(self):
+        self._render_started = time.perf_counter()
+
+    def finish_render(self, response):
+        if self._render_started is not None:
+            self.render_duration = time.perf_counter() - self._render_started
+        return response
+
+    def server_timing(self):
+        app = max(
+            self.duration - self.db_duration - self.render_duration - self.compress_duration, 0
+        )
+        return ", ".join(
+            [
+                f"total;dur={self.duration * 1000:.2f}",
+                f'db;dur={self.db_duration * 1000:.2f};desc="{self.db_queries} queries"',
+                f"render;dur={self.render_duration * 1000:.2f}",
+                f"compress;dur={self.compress_duration * 1000:.2f}",
+                f"app;dur={app * 1000:.2f}",
+            ]
+        )
+
+
+def view_name(view_func):
+    """Class name for class-based views (`SurveyPublicView`), function name otherwise."""
+    view_class = getattr(view_func, "view_class", None) or getattr(view_func, "cls", None)
+    return (view_class or view_func).__name__
+
+
+class ProfilingMiddleware:
+    """
+    Opt-in request profiling, enabled with PROFILING_ENABLED.
+
+    For every request it records, per view: wall time, DB query count and time
+    (via `connection.execute_wrapper` on every configured database), response
+    rendering and compression time, and response size before and after
+    compression. The numbers are returned in a
+    `Server-Timing` header and aggregated in the in-process registry served at
+    `/metrics`.
+
+    Requests whose profile header carries METRICS_TOKEN are additionally run
+    under cProfile (subject to PROFILE_SAMPLE_RATE) when PROFILE_DIR is set; the
+    `.prof` dump name is returned in `X-Profile-Id`. Without a token nobody can
+    trigger a dump, so anonymous clients cannot fill the disk.
+    """
+
+    def __init__(self, get_response):
+        self.options = settings.PROFILING
+        if not self.options["ENABLED"]:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.profile_header = "HTTP_" + self.options["PROFILE_HEADER"].upper().replace("-", "_")
+
+    def __call__(self, request):
+        profile = RequestProfile()
+        request._profile = profile
+        profiler = self._profiler(request)
+
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(profile.record_query))
+            if profiler is not None:
+                profiler.enable()
+            try:
+                response = self.get_response(request)
+            finally:
+                if profiler is not None:
+                    profiler.disable()
+        profile.duration = time.perf_counter() - start
+
+        if not response.streaming:
+            profile.wire_bytes = len(response.content)
+            if profile.response_bytes is None:
+                profile.response_bytes = profile.wire_bytes
+
+        response.headers["Server-Timing"] = profile.server_timing()
+        if profiler is not None:
+            response.headers["X-Profile-Id"] = self._dump(profiler, profile.view)
+
+        request_metrics.observe(profile.view, request.method, profile, response.status_code)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._profile.view = view_name(view_func)
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered by the handler right after this hook.
+        response.add_post_render_callback(request._profile.finish_render)
+        request._profile.start_render()
+        return response
+
+    def _profiler(self, request):
+        token = self.options["METRICS_TOKEN"]
+        if not self.options["PROFILE_DIR"] or not token:
+            return None
+        supplied = request.META.get(self.profile_header)
+        if supplied is None or not hmac.compare_digest(supplied.encode(), token.encode()):
+            return None
+        if random.random() >= self.options["PROFILE_SAMPLE_RATE"]:
+            return None
+        return cProfile.Profile()
+
+    def _dump(self, profiler, view):
+        directory = Path(self.options["PROFILE_DIR"])
+        directory.mkdir(parents=True, exist_ok=True)
+        name = f"{view}-{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}.prof"
+        profiler.dump_stats(directory / name)
+        logger.info("profiling.dump", view=view, file=name)
+        return name
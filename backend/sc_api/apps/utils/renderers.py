@@ -0,0 +1,45 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is not installed
+    orjson = None
+
+# UUIDs, datetimes, dates and dataclasses are encoded natively by orjson; UTC
+# datetimes end in "Z" like DRF's encoder, and numpy arrays/scalars from the
+# analytics engine are written without converting them to lists first.
+ORJSON_OPTIONS = (orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY) if orjson else 0
+
+# Values orjson does not know (Decimal, lazy translations, querysets, timedelta, ...)
+# fall back to DRF's encoder, so output matches JSONRenderer for those too.
+_drf_default = JSONEncoder().default
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that serializes with orjson when it is installed.
+
+    Output is compact UTF-8 like the stock renderer (UNICODE_JSON and
+    COMPACT_JSON defaults); U+2028/U+2029 are still escaped. Indented output,
+    used by the browsable API, goes through the stock renderer, as does
+    everything when orjson is missing. Unlike the strict stdlib encoder,
+    orjson writes NaN and infinities as null instead of raising.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=_drf_default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # Non-string dict keys, integers beyond 64 bits, or deeper nesting than
+            # orjson allows: rare enough to hand to the stdlib encoder.
+            return super().render(data, accepted_media_type, renderer_context)
+        # U+2028/U+2029 in UTF-8, escaped so the output stays a JavaScript subset.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
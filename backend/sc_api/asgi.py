@@ -1,7 +1,13 @@
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "sc_api.settings")
 
 application = get_asgi_application()
+
+if settings.DATABASE_STARTUP_CHECK:
+    from sc_api.apps.utils.database import startup_check
+
+    startup_check()
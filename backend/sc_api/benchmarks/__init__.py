@@ -0,0 +1,9 @@
+# Benchmarks runnable with `python manage.py benchmark <name>`, mapped to their modules.
+BENCHMARKS = {
+    "analytics": "sc_api.benchmarks.analytics",
+    "json_rendering": "sc_api.benchmarks.json_rendering",
+    "load": "sc_api.benchmarks.load",
+    "request_logging": "sc_api.benchmarks.request_logging",
+    "submission": "sc_api.benchmarks.submission",
+    "survey_list": "sc_api.benchmarks.survey_list",
+}
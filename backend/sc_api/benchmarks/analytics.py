@@ -0,0 +1,193 @@
+import statistics
+
+import numpy as np
+from sc_api.apps.survey.analytics import SurveyAnswerFrame
+from sc_api.benchmarks.utils import timer
+
+QUESTIONS = [
+    {
+        "id": "q1",
+        "type": "radio",
+        "question": "Plan",
+        "options": ["Free", "Pro", "Team", "Enterprise"],
+    },
+    {
+        "id": "q2",
+        "type": "dropdown",
+        "question": "Region",
+        "options": ["NA", "EU", "APAC", "LATAM", "MEA"],
+    },
+    {
+        "id": "q3",
+        "type": "checkbox",
+        "question": "Features used",
+        "options": ["Forms", "Reports", "Exports", "API", "Webhooks", "SSO"],
+    },
+    {"id": "q4", "type": "rating", "question": "Satisfaction", "scale": 5},
+    {"id": "q5", "type": "number", "question": "Seats"},
+    {"id": "q6", "type": "text", "question": "Comments"},
+]
+
+
+def generate_rows(size, seed=0):
+    """Synthetic (answers, is_complete) rows; later questions are skipped more often."""
+    rng = np.random.default_rng(seed)
+    plans = rng.integers(0, 4, size).tolist()
+    regions = rng.integers(0, 5, size).tolist()
+    # At least one feature, so a reached checkbox question is never blank.
+    features = rng.integers(1, 64, size).tolist()
+    ratings = rng.integers(1, 6, size).tolist()
+    seats = rng.integers(1, 500, size).tolist()
+    # Index of the last question each respondent answered (0-5).
+    stops = np.minimum(rng.geometric(0.15, size) + 1, 6).tolist()
+
+    plan_options = QUESTIONS[0]["options"]
+    region_options = QUESTIONS[1]["options"]
+    feature_options = QUESTIONS[2]["options"]
+    feature_sets = [
+        [option for bit, option in enumerate(feature_options) if mask >> bit & 1]
+        for mask in range(64)
+    ]
+
+    rows = []
+    for plan, region, feature_mask, rating, seat, stop in zip(
+        plans, regions, features, ratings, seats, stops
+    ):
+        answers = {"question_1": plan_options[plan]}
+        if stop > 1:
+            answers["question_2"] = region_options[region]
+        if stop > 2:
+            answers["question_3"] = feature_sets[feature_mask]
+        if stop > 3:
+            answers["question_4"] = str(rating)
+        if stop > 4:
+            answers["question_5"] = str(seat)
+        if stop > 5:
+            answers["question_6"] = "Looks good"
+        rows.append((answers, stop == 6))
+    return rows
+
+
+def python_analytics(rows):
+    """The same statistics as the vectorized run, computed with per-row loops."""
+    keys = [f"question_{index}" for index in range(1, len(QUESTIONS) + 1)]
+    option_counts = {key: {} for key in ("question_1", "question_2", "question_3")}
+    ratings, seats, crosstab, features_by_plan, by_plan = [], [], {}, {}, {}
+    reached = [0] * len(keys)
+    completed = 0
+
+    for answers, is_complete in rows:
+        completed += is_complete
+        for key in ("question_1", "question_2"):
+            if key in answers:
+                counts = option_counts[key]
+                counts[answers[key]] = counts.get(answers[key], 0) + 1
+        plan = answers.get("question_1")
+        for option in answers.get("question_3", []):
+            counts = option_counts["question_3"]
+            counts[option] = counts.get(option, 0) + 1
+            if plan is not None:
+                cell = (plan, option)
+                features_by_plan[cell] = features_by_plan.get(cell, 0) + 1
+
+        if plan is not None and "question_2" in answers:
+            cell = (plan, answers["question_2"])
+            crosstab[cell] = crosstab.get(cell, 0) + 1
+        if "question_4" in answers:
+            rating = float(answers["question_4"])
+            ratings.append(rating)
+            if plan is not None:
+                by_plan.setdefault(plan, []).append(rating)
+        if "question_5" in answers:
+            seats.append(float(answers["question_5"]))
+
+        last = max((index for index, key in enumerate(keys) if key in answers), default=-1)
+        for index in range(last + 1):
+            reached[index] += 1
+
+    return {
+        "option_counts": option_counts,
+        "rating_mean": statistics.fmean(ratings),
+        "rating_median": statistics.median(ratings),
+        "seats": (statistics.fmean(seats), statistics.median(seats), min(seats), max(seats)),
+        "crosstab": crosstab,
+        "features_by_plan": features_by_plan,
+        "by_plan": {
+            plan: (statistics.fmean(values), statistics.median(values))
+            for plan, values in by_plan.items()
+        },
+        "reached": reached,
+        "completed": completed,
+    }
+
+
+def vectorized_analytics(frame):
+    return {
+        "summary": frame.summary(),
+        "crosstab": frame.crosstab("question_1", "question_2"),
+        "features_by_plan": frame.crosstab("question_1", "question_3"),
+        "by_plan": frame.numeric_by_category("question_4", "question_1"),
+        "funnel": frame.funnel(),
+    }
+
+
+def _matches(python_result, vectorized_result):
+    for name in ("crosstab", "features_by_plan"):
+        crosstab = vectorized_result[name]
+        for row, row_label in enumerate(crosstab["row_labels"]):
+            for column, column_label in enumerate(crosstab["column_labels"]):
+                if crosstab["counts"][row][column] != python_result[name].get(
+                    (row_label, column_label), 0
+                ):
+                    return False
+
+    for group in vectorized_result["by_plan"]["groups"]:
+        mean, median = python_result["by_plan"][group["option"]]
+        if abs(group["mean"] - mean) > 1e-9 or group["median"] != median:
+            return False
+
+    funnel = vectorized_result["funnel"]
+    return [step["reached"] for step in funnel["steps"]] == python_result["reached"] and (
+        funnel["completed"] == python_result["completed"]
+    )
+
+
+def run(size=1_000_000, iterations=3):
+    """
+    Compare the NumPy analytics engine against per-row Python loops.
+
+    Builds `size` synthetic responses in memory (no database), then times the
+    column load and the vectorized statistics separately from a pure-Python
+    pass computing the same option counts, crosstabs, numeric summaries,
+    rating mean/median by plan and completion funnel. Best of `iterations` runs is reported.
+    """
+    with timer() as elapsed:
+        rows = generate_rows(size)
+    generate_ms = elapsed["ms"]
+
+    load_times, vectorized_times, python_times = [], [], []
+    for _ in range(iterations):
+        with timer() as elapsed:
+            frame = SurveyAnswerFrame(QUESTIONS, rows)
+        load_times.append(elapsed["ms"])
+
+        with timer() as elapsed:
+            vectorized_result = vectorized_analytics(frame)
+        vectorized_times.append(elapsed["ms"])
+
+        with timer() as elapsed:
+            python_result = python_analytics(rows)
+        python_times.append(elapsed["ms"])
+
+    load_ms, vectorized_ms, python_ms = min(load_times), min(vectorized_times), min(python_times)
+    return {
+        "responses": size,
+        "iterations": iterations,
+        "generate_ms": round(generate_ms, 1),
+        "load_ms": round(load_ms, 1),
+        "vectorized_ms": round(vectorized_ms, 1),
+        "python_loop_ms": round(python_ms, 1),
+        "speedup_compute": round(python_ms / vectorized_ms, 1),
+        "speedup_including_load": round(python_ms / (load_ms + vectorized_ms), 2),
+        "results_match": _matches(python_result, vectorized_result),
+    }
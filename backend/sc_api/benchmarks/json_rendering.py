@@ -0,0 +1,134 @@
+import io
+import json
+import random
+import time
+import uuid
+
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from sc_api.apps.schema.models import Survey, Team, User
+from sc_api.apps.survey.demo import MIXED_SURVEY, synthesize_answers
+from sc_api.apps.survey.serializers import SurveyDetailSerializer
+from sc_api.apps.utils.parsers import FastJSONParser
+from sc_api.apps.utils.renderers import FastJSONRenderer, orjson
+from sc_api.benchmarks.utils import summarize
+
+
+def build_survey(size):
+    """Unsaved survey with `size` questions cycled from MIXED_SURVEY, so no database is needed."""
+    now = timezone.now()
+    templates = MIXED_SURVEY["questions"]
+    questions = [
+        {**templates[index % len(templates)], "id": f"q{index + 1}"} for index in range(size)
+    ]
+    return Survey(
+        id=1,
+        oid=uuid.uuid4(),
+        title=MIXED_SURVEY["title"],
+        description=MIXED_SURVEY["description"],
+        category=MIXED_SURVEY["category"],
+        questions=questions,
+        configs=MIXED_SURVEY["configs"],
+        created_by=User(id=1, first_name="Bench", last_name="Owner"),
+        team=Team(id=1, name="Benchmark"),
+        last_response_at=now,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def build_payloads(size, seed=0):
+    """The survey detail and submission view payloads, plus a public fill POST body."""
+    rng = random.Random(seed)
+    survey = build_survey(size)
+    answers = synthesize_answers(survey.questions, rng)
+    now = timezone.now()
+
+    detail = {"success": True, "data": SurveyDetailSerializer(survey).data}
+    # Mirrors SurveySubmissionView: raw UUID and datetimes, left to the renderer.
+    submission = {
+        "success": True,
+        "data": {
+            "response_id": uuid.uuid4(),
+            "survey": {
+                "title": survey.title,
+                "description": survey.description,
+                "questions": survey.questions,
+            },
+            "respondent": {
+                "full_name": "Bench Respondent",
+                "email": "bench@example.com",
+                "phone": "+15550100",
+            },
+            "answers": answers,
+            "submitted_at": now,
+            "completed_at": now,
+            "is_complete": True,
+        },
+    }
+    fill_body = json.dumps(
+        {
+            "respondent_info": {
+                "full_name": "Bench Respondent",
+                "email": "bench@example.com",
+                "phone": "+15550100",
+            },
+            "responses": answers,
+        }
+    ).encode()
+    return {"survey_detail": detail, "submission_view": submission}, fill_body
+
+
+def _time_us(function, iterations):
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        function()
+        latencies.append(round((time.perf_counter() - start) * 1e6, 1))
+    return summarize(latencies, "_us")
+
+
+def run(size=200, iterations=2000):
+    """
+    Compare DRF's stock JSONRenderer/JSONParser with the orjson-backed
+    FastJSONRenderer/FastJSONParser.
+
+    Renders the survey detail and submission view payloads of a survey with
+    `size` questions and parses a matching public fill POST body, `iterations`
+    times each. Both renderers must produce the same JSON.
+    """
+    payloads, fill_body = build_payloads(size)
+    stock, fast = JSONRenderer(), FastJSONRenderer()
+    results = {"orjson": orjson.__version__ if orjson else None, "questions": size}
+
+    for name, payload in payloads.items():
+        stock_bytes, fast_bytes = stock.render(payload), fast.render(payload)
+        if json.loads(stock_bytes) != json.loads(fast_bytes):
+            raise AssertionError(f"{name}: FastJSONRenderer output differs from JSONRenderer.")
+
+        stock_stats = _time_us(lambda: stock.render(payload), iterations)
+        fast_stats = _time_us(lambda: fast.render(payload), iterations)
+        results[name] = {
+            "bytes": len(fast_bytes),
+            "identical_bytes": stock_bytes == fast_bytes,
+            "stock": stock_stats,
+            "fast": fast_stats,
+            "speedup": round(stock_stats["p50_us"] / fast_stats["p50_us"], 1),
+        }
+
+    stock_parser, fast_parser = JSONParser(), FastJSONParser()
+    context = {"encoding": "utf-8"}
+    stock_stats = _time_us(
+        lambda: stock_parser.parse(io.BytesIO(fill_body), None, context), iterations
+    )
+    fast_stats = _time_us(
+        lambda: fast_parser.parse(io.BytesIO(fill_body), None, context), iterations
+    )
+    results["public_fill_parse"] = {
+        "bytes": len(fill_body),
+        "stock": stock_stats,
+        "fast": fast_stats,
+        "speedup": round(stock_stats["p50_us"] / fast_stats["p50_us"], 1),
+    }
+    return results
@@ -0,0 +1,282 @@
+import itertools
+import random
+import subprocess
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connection
+from django.test import Client
+from django.test.utils import override_settings
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+from sc_api.apps.schema.models import SurveyResponse
+from sc_api.apps.survey.demo import (
+    delete_demo_data,
+    generate_demo_data,
+    synthesize_answers,
+)
+from sc_api.apps.utils.stats import percentile
+
+# Relative change beyond which compare_results flags a scenario
+DEFAULT_THRESHOLD = 0.2
+
+
+class LoadContext:
+    """Seeded data shared by all clients, plus a counter for unique submissions."""
+
+    def __init__(self, dataset, prefix):
+        self.prefix = prefix
+        self.owners = [
+            (
+                f"Bearer {AccessToken.for_user(user)}",
+                [survey for survey in dataset["surveys"] if survey.team_id == user.team_id],
+            )
+            for user in dataset["users"]
+        ]
+        self.surveys = dataset["surveys"]
+        self.response_oids = list(
+            SurveyResponse.objects.filter(survey__in=self.surveys, is_complete=True).values_list(
+                "oid", flat=True
+            )[:1000]
+        )
+        self._submissions = itertools.count()
+        self._lock = threading.Lock()
+
+    def owner(self, index):
+        token, surveys = self.owners[index % len(self.owners)]
+        return token, surveys[index % len(surveys)]
+
+    def next_submission(self):
+        with self._lock:
+            return next(self._submissions)
+
+
+def _survey_list(client, context, index):
+    token, _ = context.owner(index)
+    return client.get("/survey/", HTTP_AUTHORIZATION=token)
+
+
+def _survey_detail(client, context, index):
+    token, survey = context.owner(index)
+    return client.get(f"/survey/{survey.oid}/", HTTP_AUTHORIZATION=token)
+
+
+def _public_fill_get(client, context, index):
+    survey = context.surveys[index % len(context.surveys)]
+    return client.get(f"/survey/{survey.oid}/fill/")
+
+
+def _public_fill_post(client, context, index):
+    survey = context.surveys[index % len(context.surveys)]
+    number = context.next_submission()
+    payload = {
+        "respondent_info": {
+            "full_name": f"Load Respondent {number}",
+            "email": f"{context.prefix}-respondent-load-{number}@example.com",
+            "phone": "+15550100",
+        },
+        "responses": synthesize_answers(survey.questions, random.Random(number)),
+    }
+    return client.post(f"/survey/{survey.oid}/fill/", payload, content_type="application/json")
+
+
+def _send_invites(client, context, index):
+    token, survey = context.owner(index)
+    payload = {
+        "emails": [f"invitee-{index}-{n}@example.com" for n in range(5)],
+        "survey_url": f"{settings.FRONTEND_BASE_URL}{survey.public_url}",
+    }
+    return client.post(
+        f"/survey/{survey.oid}/send-invites/",
+        payload,
+        content_type="application/json",
+        HTTP_AUTHORIZATION=token,
+    )
+
+
+def _submission_view(client, context, index):
+    response_oid = context.response_oids[index % len(context.response_oids)]
+    return client.get(f"/survey/submission/{response_oid}/view/")
+
+
+SCENARIOS = {
+    "survey_list": _survey_list,
+    "survey_detail": _survey_detail,
+    "public_fill_get": _public_fill_get,
+    "public_fill_post": _public_fill_post,
+    "send_invites": _send_invites,
+    "submission_view": _submission_view,
+}
+
+
+def _client_worker(scenario, context, indexes):
+    client = Client()
+    latencies, queries, errors = [], [], 0
+    executed = []
+
+    def count_query(execute, sql, params, many, query_context):
+        executed.append(1)
+        return execute(sql, params, many, query_context)
+
+    try:
+        with connection.execute_wrapper(count_query):
+            for index in indexes:
+                executed.clear()
+                start = time.perf_counter()
+                response = scenario(client, context, index)
+                latencies.append((time.perf_counter() - start) * 1000)
+                queries.append(len(executed))
+                errors += response.status_code >= 400
+    finally:
+        connection.close()
+    return latencies, queries, errors
+
+
+def run_scenario(scenario, context, requests, clients):
+    """
+    Drive one scenario with `clients` concurrent clients, each in its own thread
+    and database connection, splitting `requests` between them.
+    """
+    chunks = [range(start, requests, clients) for start in range(clients)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        outcomes = list(pool.map(lambda chunk: _client_worker(scenario, context, chunk), chunks))
+    wall = time.perf_counter() - start
+
+    latencies = [ms for outcome in outcomes for ms in outcome[0]]
+    queries = [count for outcome in outcomes for count in outcome[1]]
+    return {
+        "requests": requests,
+        "errors": sum(outcome[2] for outcome in outcomes),
+        "throughput_rps": round(requests / wall, 1),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "max_ms": round(max(latencies), 3),
+        "p50_queries": percentile(queries, 50),
+        "max_queries": max(queries),
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+@override_settings(
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+    EMAIL_OUTBOX={
+        "BATCH_SIZE": 100,
+        "MAX_ATTEMPTS": 1,
+        "RETRY_BACKOFF": 0,
+        "SENDING_TIMEOUT": 0,
+        "BACKGROUND_WORKERS": 0,
+    },
+)
+def run(
+    size=200,
+    iterations=400,
+    clients=8,
+    teams=2,
+    surveys_per_team=5,
+    scenarios=None,
+    seed=0,
+):
+    """
+    Load-test the key API endpoints against the configured database.
+
+    Seeds `teams` x `surveys_per_team` surveys with `size` responses each,
+    then runs every scenario with `iterations` requests spread over `clients`
+    concurrent clients (after a short single-client warm-up). Reports
+    throughput, latency percentiles and DB queries per request. The seeded
+    data and everything the scenarios created are removed at the end.
+    """
+    names = list(scenarios or SCENARIOS)
+    prefix = f"load-{uuid.uuid4().hex[:8]}"
+    hosts = [*settings.ALLOWED_HOSTS, "testserver"]
+
+    started_at = timezone.now()
+    seed_start = time.perf_counter()
+    dataset = generate_demo_data(teams, surveys_per_team, size, prefix=prefix, seed=seed)
+    seed_seconds = time.perf_counter() - seed_start
+
+    results = {}
+    try:
+        with override_settings(ALLOWED_HOSTS=hosts):
+            context = LoadContext(dataset, prefix)
+            for name in names:
+                warmup = min(clients, iterations)
+                _client_worker(SCENARIOS[name], context, range(iterations, iterations + warmup))
+                results[name] = run_scenario(SCENARIOS[name], context, iterations, clients)
+    finally:
+        delete_demo_data(prefix)
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "database": connection.vendor,
+            "started_at": started_at.isoformat(),
+            "teams": teams,
+            "surveys": len(dataset["surveys"]),
+            "responses": dataset["responses"],
+            "clients": clients,
+            "requests_per_scenario": iterations,
+            "seed_seconds": round(seed_seconds, 2),
+        },
+        "scenarios": results,
+    }
+
+
+def compare_results(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare two load-test results scenario by scenario.
+
+    A scenario regresses when its p50 or p99 latency grows, or its throughput
+    drops, by more than `threshold` (relative), or when it issues more queries
+    per request than before.
+
+    Returns:
+        list: One dict per scenario present in both runs, with the baseline and
+        current values, relative changes and a `regressions` list
+    """
+    rows = []
+    for name, now in current["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if before is None:
+            continue
+
+        def change(key):
+            return (now[key] - before[key]) / before[key] if before[key] else 0.0
+
+        regressions = [key for key in ("p50_ms", "p99_ms") if change(key) > threshold]
+        if change("throughput_rps") < -threshold:
+            regressions.append("throughput_rps")
+        if now["p50_queries"] > before["p50_queries"]:
+            regressions.append("p50_queries")
+
+        rows.append(
+            {
+                "scenario": name,
+                **{
+                    key: {
+                        "baseline": before[key],
+                        "current": now[key],
+                        "change": round(change(key), 3),
+                    }
+                    for key in ("throughput_rps", "p50_ms", "p99_ms", "p50_queries")
+                },
+                "regressions": regressions,
+            }
+        )
+    return rows
@@ -0,0 +1,111 @@
+import logging
+import shutil
+import tempfile
+import time
+import uuid
+from logging.handlers import TimedRotatingFileHandler
+from pathlib import Path
+
+from sc_api.apps.utils.log import (
+    QueuedFileHandler,
+    StructuredFormatter,
+    StructuredLogger,
+)
+
+VERBOSE_FORMAT = (
+    "{name} {levelname} [{asctime}] {process}/{thread} {filename} {funcName} {lineno}: {message}"
+)
+
+
+def _legacy_request(logger, user_oid):
+    # The per-request pattern CustomAuthentication used to emit: eager f-strings
+    # at INFO/DEBUG, all enabled, written synchronously.
+    logger.info("Checking for access token in header")
+    logger.debug("Raw access token retrieved")
+    logger.debug("Token validated")
+    logger.debug(f"Currently logged in user oid: {user_oid}")
+
+
+def _structured_request(logger, user_oid):
+    logger.debug("auth.authenticated", source="header", user=user_oid)
+
+
+def _configure(name, handler, level):
+    logger = logging.getLogger(f"sc_api.benchmarks.request_logging.{name}")
+    logger.handlers = [handler]
+    logger.setLevel(level)
+    logger.propagate = False
+    return logger
+
+
+def _measure(emit, logger, requests):
+    user_oid = uuid.uuid4()
+    start = time.perf_counter()
+    for _ in range(requests):
+        emit(logger, user_oid)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+def run(iterations=20000):
+    """
+    Per-request logging overhead of the authentication path, before and after.
+
+    - legacy: old call pattern, DEBUG level, synchronous rotating file handler
+    - structured_debug_queued: new events at DEBUG, unsampled, queued file handler
+    - structured_debug_sampled: same, with the default 1% auth sampling
+    - structured_info: new events at the default INFO level (DEBUG gated off)
+
+    Reports microseconds spent in logging calls per simulated request on the
+    request thread; records are written to a temporary directory.
+    """
+    log_dir = Path(tempfile.mkdtemp(prefix="sc-logging-bench-"))
+    handlers = []
+
+    def file_handler(name, queued):
+        if queued:
+            handler = QueuedFileHandler(log_dir / f"{name}.log")
+        else:
+            handler = TimedRotatingFileHandler(log_dir / f"{name}.log", when="midnight")
+        handler.setFormatter(StructuredFormatter(VERBOSE_FORMAT, style="{"))
+        handlers.append(handler)
+        return handler
+
+    def structured(name, level, sample_rate):
+        logger = StructuredLogger(_configure(name, file_handler(name, True), level).name)
+        logger.sample_rate = sample_rate
+        return logger
+
+    try:
+        scenarios = {
+            "legacy": (
+                _legacy_request,
+                _configure("legacy", file_handler("legacy", False), logging.DEBUG),
+            ),
+            "structured_debug_queued": (
+                _structured_request,
+                structured("structured_debug_queued", logging.DEBUG, 1.0),
+            ),
+            "structured_debug_sampled": (
+                _structured_request,
+                structured("structured_debug_sampled", logging.DEBUG, 0.01),
+            ),
+            "structured_info": (
+                _structured_request,
+                structured("structured_info", logging.INFO, 0.01),
+            ),
+        }
+
+        results = {"requests": iterations}
+        for name, (emit, logger) in scenarios.items():
+            _measure(emit, logger, min(iterations, 1000))
+            results[f"{name}_us_per_request"] = round(_measure(emit, logger, iterations), 3)
+
+        legacy = results["legacy_us_per_request"]
+        for name in list(scenarios)[1:]:
+            current = results[f"{name}_us_per_request"]
+            results[f"{name}_speedup"] = round(legacy / current, 1) if current else None
+        return results
+    finally:
+        for handler in handlers:
+            handler.close()
+        shutil.rmtree(log_dir, ignore_errors=True)
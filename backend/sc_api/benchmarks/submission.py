@@ -0,0 +1,83 @@
+import uuid
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from sc_api.apps.schema.models import Respondent, Survey, Team, User
+from sc_api.apps.survey.services import DuplicateSubmissionError, submit_survey_response
+from sc_api.benchmarks.utils import summarize, timer
+
+QUESTIONS = [
+    {"id": "q1", "type": "radio", "question": "Pick one", "options": ["A", "B", "C"]},
+    {"id": "q2", "type": "rating", "question": "Rate us", "scale": 5},
+    {"id": "q3", "type": "text", "question": "Anything else?"},
+]
+
+
+def _submit(survey, email, round_trips, latencies):
+    respondent_info = {"full_name": "Bench Respondent", "email": email, "phone": "5550100"}
+    answers = {"question_1": "A", "question_2": 4, "question_3": "Fine"}
+
+    with CaptureQueriesContext(connection) as queries, timer() as elapsed:
+        try:
+            submit_survey_response(survey, respondent_info, answers)
+        except DuplicateSubmissionError:
+            pass
+
+    round_trips.append(len(queries))
+    latencies.append(elapsed["ms"])
+
+
+@override_settings(
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+    EMAIL_OUTBOX={
+        "BATCH_SIZE": 100,
+        "MAX_ATTEMPTS": 1,
+        "RETRY_BACKOFF": 0,
+        "SENDING_TIMEOUT": 0,
+        "BACKGROUND_WORKERS": 0,
+    },
+)
+def run(iterations=200):
+    """
+    Measure database round trips and latency of `submit_survey_response`.
+
+    Every iteration submits once to a single-response survey (new respondent)
+    and once to a multi-response survey (repeat respondent, upsert update path),
+    plus a duplicate submit every tenth iteration. All rows are removed at the end.
+    """
+    tag = uuid.uuid4().hex[:8]
+    team = Team.objects.create(name=f"benchmark-{tag}")
+    user = User.objects.create_user(f"benchmark-{tag}@example.com", team=team)
+    single = Survey.objects.create(
+        title="Benchmark single", created_by=user, team=team, questions=QUESTIONS
+    )
+    multiple = Survey.objects.create(
+        title="Benchmark multiple",
+        created_by=user,
+        team=team,
+        questions=QUESTIONS,
+        allow_multiple_responses=True,
+    )
+
+    results = {}
+    try:
+        for label, survey, email_for in (
+            ("single_new", single, lambda i: f"bench-{tag}-{i}@example.com"),
+            ("multiple_repeat", multiple, lambda i: f"bench-{tag}-{i % 10}@example.com"),
+            ("duplicate", single, lambda i: f"bench-{tag}-{i % 10}@example.com"),
+        ):
+            round_trips, latencies = [], []
+            count = iterations if label != "duplicate" else max(1, iterations // 10)
+            for i in range(count):
+                _submit(survey, email_for(i), round_trips, latencies)
+            results[label] = {
+                "submissions": count,
+                **summarize(round_trips, "_round_trips"),
+                **summarize([round(ms, 3) for ms in latencies], "_ms"),
+            }
+    finally:
+        team.delete()
+        user.delete()
+        Respondent.objects.filter(email__startswith=f"bench-{tag}-").delete()
+
+    return results
@@ -0,0 +1,96 @@
+import uuid
+
+from django.conf import settings
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+from sc_api.apps.schema.models import Survey, Team, User
+from sc_api.apps.survey.demo import load_survey_templates
+from sc_api.apps.survey.listing import survey_list_rows, survey_list_values
+from sc_api.apps.survey.serializers import SurveyListSerializer
+from sc_api.benchmarks.utils import summarize, timer
+
+
+def _serializer_rows(team):
+    # The list path before survey_list_rows: full rows through the serializer.
+    queryset = (
+        Survey.objects.filter(team=team)
+        .select_related("created_by", "team")
+        .order_by("-created_at")
+    )
+    return SurveyListSerializer(queryset, many=True).data
+
+
+def _lean_rows(team):
+    return survey_list_rows(
+        survey_list_values(Survey.objects.filter(team=team).order_by("-created_at"))
+    )
+
+
+def _measure(build, iterations):
+    latencies, round_trips = [], []
+    for _ in range(iterations):
+        with CaptureQueriesContext(connection) as queries, timer() as elapsed:
+            build()
+        latencies.append(round(elapsed["ms"], 3))
+        round_trips.append(len(queries))
+    return {
+        "iterations": iterations,
+        **summarize(latencies, "_ms"),
+        **summarize(round_trips, "_round_trips"),
+    }
+
+
+def run(size=5000, iterations=20):
+    """
+    Compare the survey list built through SurveyListSerializer with the lean
+    `.values()` path on one team holding `size` surveys (demo templates, so
+    every row carries realistic questions/configs JSON). Also times a full
+    GET /survey/ request for the first page. All rows are removed at the end.
+    """
+    tag = uuid.uuid4().hex[:8]
+    team = Team.objects.create(name=f"benchmark-{tag}")
+    user = User.objects.create_user(
+        f"benchmark-{tag}@example.com", team=team, first_name="Bench", last_name="Owner"
+    )
+    templates = load_survey_templates()
+    Survey.objects.bulk_create(
+        [
+            Survey(
+                **{key: value for key, value in template.items() if key != "title"},
+                title=f"{template['title']} #{index}",
+                created_by=user,
+                team=team,
+            )
+            for index, template in (
+                (index, templates[index % len(templates)]) for index in range(size)
+            )
+        ],
+        batch_size=1000,
+    )
+
+    try:
+        if _serializer_rows(team) != _lean_rows(team):
+            raise AssertionError("Lean list rows differ from SurveyListSerializer output.")
+
+        client = Client()
+        token = f"Bearer {AccessToken.for_user(user)}"
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            first_page = _measure(
+                lambda: client.get("/survey/", HTTP_AUTHORIZATION=token), iterations
+            )
+
+        results = {
+            "surveys": size,
+            "serializer": _measure(lambda: _serializer_rows(team), iterations),
+            "lean": _measure(lambda: _lean_rows(team), iterations),
+            "first_page_request": first_page,
+        }
+        results["speedup"] = round(results["serializer"]["p50_ms"] / results["lean"]["p50_ms"], 1)
+    finally:
+        Survey.objects.filter(team=team).delete()
+        user.delete()
+        team.delete()
+
+    return results
@@ -0,0 +1,24 @@
+import time
+from contextlib import contextmanager
+
+from sc_api.apps.utils.stats import percentile
+
+
+def summarize(values, unit=""):
+    """p50/p99/max summary of a list of measurements."""
+    return {
+        f"p50{unit}": percentile(values, 50),
+        f"p99{unit}": percentile(values, 99),
+        f"max{unit}": max(values) if values else None,
+    }
+
+
+@contextmanager
+def timer():
+    """Yield a dict whose `ms` key holds the elapsed wall time once the block exits."""
+    elapsed = {}
+    start = time.perf_counter()
+    try:
+        yield elapsed
+    finally:
+        elapsed["ms"] = (time.perf_counter() - start) * 1000
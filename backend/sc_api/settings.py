@@ -48,9 +48,21 @@ REST_FRAMEWORK = {
         "rest_framework.authentication.SessionAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticatedOrReadOnly",),
+    # orjson-backed JSON when installed; the stock classes otherwise.
+    "DEFAULT_RENDERER_CLASSES": (
+        "sc_api.apps.utils.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "sc_api.apps.utils.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
 }
 
 MIDDLEWARE = [
+    "sc_api.apps.utils.profiling.ProfilingMiddleware",
+    "sc_api.apps.utils.compression.CompressionMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -84,17 +96,75 @@ WSGI_APPLICATION = "sc_api.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# DATABASE_ENGINE is "sqlite3", "postgresql" or a full backend path
+DATABASE_ENGINE = config("DATABASE_ENGINE", default="sqlite3")
+if "." not in DATABASE_ENGINE:
+    DATABASE_ENGINE = f"django.db.backends.{DATABASE_ENGINE}"
+
 DATABASES = {
     "default": {
-        "ENGINE": config("django.db.backends.postgresql", default="django.db.backends.sqlite3"),
+        "ENGINE": DATABASE_ENGINE,
         "NAME": config("DATABASE_NAME", default=BASE_DIR / "db.sqlite3"),
         "USER": config("DATABASE_USER", default="user"),
         "PASSWORD": config("DATABASE_USER_PASSWORD", default="password"),
         "HOST": config("DATABASE_HOST", default="localhost"),
         "PORT": config("DATABASE_PORT", default=5432),
+        # Seconds a connection is reused across requests (0 closes it after each request)
+        "CONN_MAX_AGE": config("DATABASE_CONN_MAX_AGE", default=60, cast=int),
+        # Ping a reused connection before a request uses it
+        "CONN_HEALTH_CHECKS": config("DATABASE_CONN_HEALTH_CHECKS", default=True, cast=bool),
+        "OPTIONS": {},
     }
 }
 
+# psycopg 3 connection pool, per worker process (PostgreSQL only). It replaces
+# persistent connections, so CONN_MAX_AGE is 0 while it is on; with
+# CONN_HEALTH_CHECKS the pool checks each connection as it is handed out.
+DATABASE_POOL = {
+    "ENABLED": config("DATABASE_POOL_ENABLED", default=False, cast=bool),
+    "MIN_SIZE": config("DATABASE_POOL_MIN_SIZE", default=2, cast=int),
+    "MAX_SIZE": config("DATABASE_POOL_MAX_SIZE", default=10, cast=int),
+    # Seconds a request waits for a free connection before failing
+    "TIMEOUT": config("DATABASE_POOL_TIMEOUT", default=10, cast=float),
+    # Seconds before a connection is replaced, and before an idle one above MIN_SIZE is closed
+    "MAX_LIFETIME": config("DATABASE_POOL_MAX_LIFETIME", default=1800, cast=float),
+    "MAX_IDLE": config("DATABASE_POOL_MAX_IDLE", default=300, cast=float),
+}
+
+if DATABASE_POOL["ENABLED"] and DATABASE_ENGINE == "django.db.backends.postgresql":
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": DATABASE_POOL["MIN_SIZE"],
+        "max_size": DATABASE_POOL["MAX_SIZE"],
+        "timeout": DATABASE_POOL["TIMEOUT"],
+        "max_lifetime": DATABASE_POOL["MAX_LIFETIME"],
+        "max_idle": DATABASE_POOL["MAX_IDLE"],
+    }
+
+# Read replica for analytics and exports (sc_api.apps.utils.database.replica_alias),
+# configured when DATABASE_REPLICA_HOST is set; other settings default to the primary's
+DATABASE_REPLICA_HOST = config("DATABASE_REPLICA_HOST", default="")
+if DATABASE_REPLICA_HOST:
+    primary = DATABASES["default"]
+    DATABASES["replica"] = {
+        **primary,
+        "NAME": config("DATABASE_REPLICA_NAME", default=primary["NAME"]),
+        "USER": config("DATABASE_REPLICA_USER", default=primary["USER"]),
+        "PASSWORD": config("DATABASE_REPLICA_PASSWORD", default=primary["PASSWORD"]),
+        "HOST": DATABASE_REPLICA_HOST,
+        "PORT": config("DATABASE_REPLICA_PORT", default=primary["PORT"]),
+        "OPTIONS": dict(primary["OPTIONS"]),
+        # Tests run against the primary instead of creating a second test database
+        "TEST": {"MIRROR": "default"},
+    }
+
+# Writes always go to the primary, and the replica is never migrated
+DATABASE_ROUTERS = ["sc_api.apps.utils.database.PrimaryReplicaRouter"]
+
+# Log each database's connection setup cost when the WSGI/ASGI app is loaded
+# (once in the master under `gunicorn --preload`); the connections are closed after
+DATABASE_STARTUP_CHECK = config("DATABASE_STARTUP_CHECK", default=False, cast=bool)
+
 AUTH_USER_MODEL = "schema.User"
 
 
@@ -147,13 +217,19 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # https://docs.djangoproject.com/en/4.0/topics/logging/
 FORMATTERS = {
     "verbose": {
+        "()": "sc_api.apps.utils.log.StructuredFormatter",
         "format": "{name} {levelname} [{asctime}] {process}/{thread} {filename} {funcName} {lineno}: {message}",
         "style": "{",
     },
     "simple": {
+        "()": "sc_api.apps.utils.log.StructuredFormatter",
         "format": "{name} {levelname} [{asctime}] {filename} {funcName} {lineno}: {message}",
         "style": "{",
     },
+    "json": {
+        "()": "sc_api.apps.utils.log.StructuredFormatter",
+        "json_lines": True,
+    },
 }
 
 FILTERS = {
@@ -165,21 +241,34 @@ FILTERS = {
     },
 }
 
-HANDLERS = {"console": {"level": "DEBUG", "class": "logging.StreamHandler", "formatter": "verbose"}}
+LOG_LEVEL = config("LOG_LEVEL", default="INFO")
+LOG_FORMAT = config("LOG_FORMAT", default="verbose")
+
+# Fraction of DEBUG/INFO events kept per module prefix (warnings and errors are never sampled)
+LOG_SAMPLING = {
+    "sc_api.apps.authentication.base": config("LOG_SAMPLING_AUTH", default=0.01, cast=float),
+}
+
+HANDLERS = {
+    "console": {"level": "DEBUG", "class": "logging.StreamHandler", "formatter": LOG_FORMAT}
+}
 
 if ENV == "local":
     log_path = BASE_DIR / "logs"
     log_path.mkdir(parents=True, exist_ok=True)
+    # Formatting and file I/O happen on a QueueListener thread, not the request thread.
     HANDLERS["file"] = {
         "level": "DEBUG",
-        "class": "logging.handlers.TimedRotatingFileHandler",
+        "()": "sc_api.apps.utils.log.QueuedFileHandler",
         "filename": log_path / "app.log",
         "when": "midnight",
-        "formatter": "verbose",
+        "formatter": LOG_FORMAT,
     }
 
+# Shared utilities (email outbox, profiling, database checks) log alongside the apps
 LOGGERS = {
-    app: {"handlers": HANDLERS.keys(), "level": "DEBUG", "propagate": False} for app in SC_APPS
+    name: {"handlers": list(HANDLERS), "level": LOG_LEVEL, "propagate": False}
+    for name in SC_APPS + ["sc_api.apps.utils"]
 }
 
 LOGGING = {
@@ -237,6 +326,99 @@ EMAIL_HOST_USER = config("EMAIL_HOST_USER", default="")
 EMAIL_HOST_PASSWORD = config("EMAIL_HOST_PASSWORD", default="")
 DEFAULT_FROM_EMAIL = config("DEFAULT_FROM_EMAIL", default="noreply@surveycorps.com")
 
+# Outbound email queue, drained by the send_queued_emails command
+EMAIL_OUTBOX = {
+    "BATCH_SIZE": config("EMAIL_OUTBOX_BATCH_SIZE", default=100, cast=int),
+    "MAX_ATTEMPTS": config("EMAIL_OUTBOX_MAX_ATTEMPTS", default=5, cast=int),
+    "RETRY_BACKOFF": config("EMAIL_OUTBOX_RETRY_BACKOFF", default=60, cast=int),
+    "SENDING_TIMEOUT": config("EMAIL_OUTBOX_SENDING_TIMEOUT", default=600, cast=int),
+    "BACKGROUND_WORKERS": config("EMAIL_OUTBOX_BACKGROUND_WORKERS", default=2, cast=int),
+}
+
+# Django cache framework. The default LocMemCache is per process; point CACHE_BACKEND at
+# a shared backend (e.g. django.core.cache.backends.redis.RedisCache with CACHE_LOCATION
+# redis://host:6379) so cache invalidation reaches every worker.
+CACHE_BACKEND = config("CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache")
+CACHES = {"default": {"BACKEND": CACHE_BACKEND, "LOCATION": config("CACHE_LOCATION", default="")}}
+SHARED_CACHE = CACHE_BACKEND not in (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+# Public survey cache
+# BACKEND is "local" (per-process LRU) or "django" (the CACHES alias named by ALIAS)
+SURVEY_PUBLIC_CACHE = {
+    "BACKEND": config("SURVEY_PUBLIC_CACHE_BACKEND", default="local"),
+    "ALIAS": config("SURVEY_PUBLIC_CACHE_ALIAS", default="default"),
+    "MAX_ENTRIES": config("SURVEY_PUBLIC_CACHE_MAX_ENTRIES", default=1024, cast=int),
+    "TIMEOUT": config("SURVEY_PUBLIC_CACHE_TIMEOUT", default=60, cast=int),
+}
+
+# Authenticated user + team lookups, keyed by the token's user oid. Saves invalidate the
+# entry in this process and in the shared cache only: with the per-process "local" backend,
+# other workers can keep serving a deactivated user until TIMEOUT, so it is kept short.
+AUTH_USER_CACHE = {
+    "BACKEND": config("AUTH_USER_CACHE_BACKEND", default="django" if SHARED_CACHE else "local"),
+    "ALIAS": config("AUTH_USER_CACHE_ALIAS", default="default"),
+    "MAX_ENTRIES": config("AUTH_USER_CACHE_MAX_ENTRIES", default=4096, cast=int),
+    "TIMEOUT": config("AUTH_USER_CACHE_TIMEOUT", default=30 if SHARED_CACHE else 5, cast=int),
+}
+
+# Request profiling: Server-Timing headers and /metrics (off unless PROFILING_ENABLED)
+PROFILING = {
+    "ENABLED": config("PROFILING_ENABLED", default=False, cast=bool),
+    # Recent requests per view kept for percentile gauges
+    "HISTOGRAM_WINDOW": config("PROFILING_HISTOGRAM_WINDOW", default=1000, cast=int),
+    # Bearer token required to scrape /metrics; /metrics is refused while it is empty
+    "METRICS_TOKEN": config("PROFILING_METRICS_TOKEN", default=""),
+    # cProfile dumps for requests sending METRICS_TOKEN in PROFILE_HEADER; disabled when
+    # PROFILE_DIR or METRICS_TOKEN is empty
+    "PROFILE_HEADER": config("PROFILING_PROFILE_HEADER", default="X-Profile"),
+    "PROFILE_SAMPLE_RATE": config("PROFILING_PROFILE_SAMPLE_RATE", default=0.1, cast=float),
+    "PROFILE_DIR": config("PROFILING_PROFILE_DIR", default=""),
+}
+
+# Response compression, negotiated from Accept-Encoding. ENCODINGS are in server
+# preference order; "br" and "zstd" are skipped unless brotli/zstandard are installed.
+COMPRESSION = {
+    "ENABLED": config("COMPRESSION_ENABLED", default=True, cast=bool),
+    "MIN_SIZE": config("COMPRESSION_MIN_SIZE", default=1024, cast=int),
+    "ENCODINGS": config(
+        "COMPRESSION_ENCODINGS",
+        default="zstd,br,gzip",
+        cast=lambda v: [s.strip() for s in v.split(",") if s.strip()],
+    ),
+    "LEVELS": {
+        "gzip": config("COMPRESSION_GZIP_LEVEL", default=6, cast=int),
+        "br": config("COMPRESSION_BROTLI_QUALITY", default=5, cast=int),
+        "zstd": config("COMPRESSION_ZSTD_LEVEL", default=3, cast=int),
+    },
+    # HTML is left out on purpose: admin pages embed CSRF tokens (BREACH).
+    "CONTENT_TYPES": config(
+        "COMPRESSION_CONTENT_TYPES",
+        default="application/json,text/plain",
+        cast=lambda v: [s.strip().lower() for s in v.split(",") if s.strip()],
+    ),
+}
+
+# Compressed bodies of public, ETagged responses, keyed by path, ETag and encoding
+COMPRESSION_CACHE = {
+    "BACKEND": config("COMPRESSION_CACHE_BACKEND", default="local"),
+    "ALIAS": config("COMPRESSION_CACHE_ALIAS", default="default"),
+    "MAX_ENTRIES": config("COMPRESSION_CACHE_MAX_ENTRIES", default=512, cast=int),
+    "TIMEOUT": config("COMPRESSION_CACHE_TIMEOUT", default=300, cast=int),
+}
+
+# Public survey submissions
+SURVEY_SUBMISSION = {
+    "MAX_TEXT_LENGTH": config("SURVEY_SUBMISSION_MAX_TEXT_LENGTH", default=5000, cast=int),
+}
+
+# Survey analytics are computed in the request; larger surveys are refused (export instead)
+SURVEY_ANALYTICS = {
+    "MAX_RESPONSES": config("SURVEY_ANALYTICS_MAX_RESPONSES", default=500000, cast=int),
+}
+
 FRONTEND_PROTOCOL = config("FRONTEND_PROTOCOL", default="http")
 FRONTEND_HOST = config("FRONTEND_HOST", default="localhost:3000")
 FRONTEND_BASE_URL = f"{FRONTEND_PROTOCOL}://{FRONTEND_HOST}"
@@ -1,8 +1,10 @@
 from django.contrib import admin
 from django.urls import include, path
+from sc_api.apps.utils.metrics import metrics_view
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("auth/", include("sc_api.apps.authentication.urls")),
     path("survey/", include("sc_api.apps.survey.urls")),
+    path("metrics", metrics_view, name="metrics"),
 ]
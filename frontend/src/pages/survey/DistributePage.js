@@ -68,7 +68,7 @@ const DistributePage = () => {
             });
 
             const result = extractApiData(response);
-            showSuccess(`Survey invitations sent to ${result.sent_count} recipients!`);
+            showSuccess(`Survey invitations queued for ${result.queued_count} recipients!`);
             setEmails('');
             setMessage('');
         } catch (error) {
@@ -14,6 +14,8 @@ const ListPage = () => {
     const [surveys, setSurveys] = useState([]);
     const [loading, setLoading] = useState(true);
     const [error, setError] = useState(null);
+    const [nextCursor, setNextCursor] = useState(null);
+    const [loadingMore, setLoadingMore] = useState(false);
 
     useEffect(() => {
         fetchSurveys();
@@ -28,6 +30,7 @@ const ListPage = () => {
             // Handle the nested structure from your Django API
             const surveyList = data.surveys || data || [];
             setSurveys(surveyList);
+            setNextCursor(data.next_cursor || null);
         } catch (error) {
             console.error('Error fetching surveys:', error);
             setError(extractApiError(error));
@@ -36,6 +39,20 @@ const ListPage = () => {
         }
     };
 
+    const fetchMoreSurveys = async () => {
+        try {
+            setLoadingMore(true);
+            const response = await surveysAPI.getAll({ cursor: nextCursor });
+            const data = extractApiData(response);
+            setSurveys(current => [...current, ...(data.surveys || [])]);
+            setNextCursor(data.next_cursor || null);
+        } catch (error) {
+            showError('Error loading surveys: ' + extractApiError(error));
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     const handleDelete = async (surveyOid, surveyTitle) => {
         if (window.confirm(`Are you sure you want to delete "${surveyTitle}"?`)) {
             try {
@@ -129,7 +146,7 @@ const ListPage = () => {
                 <div className="bg-white rounded-lg shadow overflow-hidden">
                     <div className="px-6 py-4 border-b border-gray-200">
                         <h2 className="text-lg font-medium text-gray-900">
-                            Your Surveys ({surveys.length})
+                            Your Surveys ({surveys.length}{nextCursor ? '+' : ''})
                         </h2>
                     </div>
 
@@ -203,6 +220,14 @@ const ListPage = () => {
                             </div>
                         ))}
                     </div>
+
+                    {nextCursor && (
+                        <div className="px-6 py-4 border-t border-gray-200 text-center">
+                            <Button onClick={fetchMoreSurveys} disabled={loadingMore}>
+                                {loadingMore ? 'Loading...' : 'Load more'}
+                            </Button>
+                        </div>
+                    )}
                 </div>
             )}
         </div>
@@ -1,7 +1,7 @@
 import apiClient from '../apiClient';
 
 export const surveysAPI = {
-    getAll: () => apiClient.get('/survey/'),
+    getAll: (params = {}) => apiClient.get('/survey/', { params }),
     getById: oid => apiClient.get(`/survey/${oid}/`),
     create: data => apiClient.post('/survey/', data),
     update: (oid, data) => apiClient.put(`/survey/${oid}/`, data),